@@ -2,59 +2,487 @@
 import sys
 import os
 import cv2
-import subprocess
+import asyncio
 import shutil
+import signal
+import threading
+import time
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
-    QListWidget, QFileDialog, QMessageBox, QTextEdit, QInputDialog
+    QListWidget, QFileDialog, QMessageBox, QTextEdit, QInputDialog, QComboBox,
+    QDialog, QDialogButtonBox, QFormLayout, QSpinBox, QCheckBox, QProgressBar,
+    QTableView, QLineEdit, QAbstractItemView, QHeaderView
+)
+from PyQt6.QtGui import (
+    QPixmap, QImage, QShortcut, QKeySequence, QPainter, QPen, QColor, QPolygonF, QTextCursor
+)
+from PyQt6.QtCore import (
+    QTimer, Qt, QUrl, QVariantAnimation, QAbstractAnimation, QEasingCurve, QPoint, QPointF, QRect,
+    QObject, QRunnable, QThreadPool, pyqtSignal, QEvent,
+    QAbstractItemModel, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
 )
-from PyQt6.QtGui import QPixmap, QImage
-from PyQt6.QtCore import QTimer, Qt, QUrl, QPropertyAnimation, QEasingCurve, QPoint, QRect
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 
+from perf import PERF, LagMonitor
+import netdiag
+import netinfo
+import sysmon
+import batchimg
+import archives
+import foldersync
+import theme
+import session
+
 
 IMG_FOLDER = os.path.join(os.path.dirname(__file__), "img")
+PAGE_NAMES = ["Home", "Gallery", "Camera", "Video Player", "Music Player", "Tools", "Monitor",
+              "Processes", "Settings"]
+
+# System monitor refresh intervals (seconds) offered on the Monitor page
+MONITOR_RATES = [0.5, 1.0, 2.0, 5.0]
+
+# Signals offered on the Processes page (only those this platform has)
+PROCESS_SIGNALS = [
+    name for name in ("SIGTERM", "SIGKILL", "SIGINT", "SIGHUP", "SIGSTOP", "SIGCONT")
+    if hasattr(signal, name)
+]
+
+# How much of the Tools output is kept in the session
+TOOLS_TAIL_CHARS = 20000
+
+# Sweeps over more hosts than this list only the ones that answered
+SWEEP_LIST_ALL = 256
+
+# GUI-thread stalls longer than this are reported with their stack
+STALL_THRESHOLD_MS = int(os.environ.get("UG_STALL_MS", "200"))
 
 # Create img folder if it doesn't exist
 if not os.path.exists(IMG_FOLDER):
     os.makedirs(IMG_FOLDER)
 
 
+# -----------------------------------------------------------
+# BACKGROUND TASKS
+# -----------------------------------------------------------
+class TaskSignals(QObject):
+    progress = pyqtSignal(object)
+    result = pyqtSignal(object)
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+
+class Task(QRunnable):
+    """Run fn(progress, cancel) on the thread pool
+
+    Signals are emitted from the worker thread and delivered on the GUI
+    thread, so handlers may touch widgets directly.
+    """
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = TaskSignals()
+        self.cancel_event = threading.Event()
+
+    def run(self):
+        try:
+            result = self.fn(self.signals.progress.emit, self.cancel_event)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+
+# -----------------------------------------------------------
+# LIVE CHART
+# -----------------------------------------------------------
+class LineChart(QWidget):
+    """Lightweight line chart; only repaints when new data arrives"""
+
+    def __init__(self, title="", unit="", parent=None):
+        super().__init__(parent)
+        self.title = title
+        self.unit = unit
+        self.series = []
+        self.setMinimumHeight(140)
+
+    def set_series(self, series):
+        """series: list of (label, values, color); None values are gaps"""
+        self.series = series
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = self.rect().adjusted(8, 22, -8, -8)
+        painter.fillRect(self.rect(), QColor(0, 0, 0, 110))
+
+        peak = max((v for _, values, _ in self.series for v in values if v is not None), default=0)
+        top = peak * 1.1 or 1.0
+
+        painter.setPen(QColor(255, 255, 255, 200))
+        labels = "   ".join(
+            f"{label}: {next((v for v in reversed(values) if v is not None), 0):.1f}{self.unit}"
+            for label, values, _ in self.series
+        )
+        painter.drawText(8, 16, f"{self.title}   {labels}   (max {top:.1f}{self.unit})")
+
+        for _, values, color in self.series:
+            n = len(values)
+            if n < 2:
+                continue
+            step = rect.width() / (n - 1)
+            painter.setPen(QPen(QColor(color), 2))
+            line = QPolygonF()
+            for i, v in enumerate(values):
+                x = rect.left() + i * step
+                if v is None:
+                    # Gap: flush the current segment and mark the loss
+                    if line.size() > 1:
+                        painter.drawPolyline(line)
+                    line = QPolygonF()
+                    painter.fillRect(int(x) - 1, rect.bottom() - 6, 3, 6, QColor("#ff4040"))
+                    continue
+                line.append(QPointF(x, rect.bottom() - v / top * rect.height()))
+            if line.size() > 1:
+                painter.drawPolyline(line)
+        painter.end()
+
+
+# -----------------------------------------------------------
+# ANIMATION DRIVER
+# -----------------------------------------------------------
+class Animator(QObject):
+    """Runs every UI animation from a single QVariantAnimation
+
+    Tweens are time-based, so a slow frame skips ahead instead of
+    stretching the animation. A frame that overruns FRAME_MS pauses the
+    ticks for as long as that frame took, handing the time back to the
+    event loop. With enabled=False tweens jump straight to their end value.
+    """
+
+    FRAME_MS = 16
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.enabled = True
+        self.tweens = {}
+        self.resume_at = 0.0
+        self.driver = QVariantAnimation(self)
+        self.driver.setStartValue(0.0)
+        self.driver.setEndValue(1.0)
+        self.driver.setDuration(1000)
+        self.driver.setLoopCount(-1)
+        self.driver.valueChanged.connect(self.tick)
+
+    def animate(self, key, setter, start, end, duration_ms,
+                easing=QEasingCurve.Type.OutCubic, delay_ms=0):
+        """Tween setter(value) from start to end, replacing any tween with the same key"""
+        if not self.enabled:
+            self.tweens.pop(key, None)
+            setter(end)
+            return
+        setter(start)
+        begin = time.monotonic() + delay_ms / 1000
+        self.tweens[key] = (setter, start, end, begin, duration_ms / 1000, QEasingCurve(easing))
+        if self.driver.state() != QAbstractAnimation.State.Running:
+            self.driver.start()
+
+    def stop(self, finish=True):
+        """Drop all tweens, by default leaving each at its end value"""
+        tweens, self.tweens = self.tweens, {}
+        self.driver.stop()
+        if finish:
+            for setter, _, end, *_ in tweens.values():
+                try:
+                    setter(end)
+                except RuntimeError:
+                    pass  # target widget already deleted
+
+    @staticmethod
+    def interpolate(start, end, t):
+        if isinstance(start, QPoint):
+            return QPoint(round(start.x() + (end.x() - start.x()) * t),
+                          round(start.y() + (end.y() - start.y()) * t))
+        return start + (end - start) * t
+
+    def tick(self, _value=None):
+        now = time.monotonic()
+        if now < self.resume_at:
+            return
+
+        with PERF.measure("ui.animation_frame"):
+            for key, (setter, start, end, begin, duration, curve) in list(self.tweens.items()):
+                if now < begin:
+                    continue
+                t = min((now - begin) / duration, 1.0) if duration else 1.0
+                try:
+                    setter(self.interpolate(start, end, curve.valueForProgress(t)))
+                except RuntimeError:
+                    t = 1.0  # target widget already deleted
+                if t >= 1.0:
+                    del self.tweens[key]
+            if not self.tweens:
+                self.driver.stop()
+
+        spent = time.monotonic() - now
+        if spent * 1000 > self.FRAME_MS:
+            PERF.count("ui.animation_over_budget")
+            self.resume_at = now + 2 * spent  # end of this frame + its length
+
+
+class RepaintCounter(QObject):
+    """Application event filter counting paint events as PERF "ui.paint"
+
+    A Python event filter sees every event in the app, so it is only
+    installed while the HUD is open (and by the benchmarks).
+    """
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            PERF.count("ui.paint")
+        return False
+
+
+# -----------------------------------------------------------
+# PROCESS TABLE MODEL
+# -----------------------------------------------------------
+class ProcessTableModel(QAbstractTableModel):
+    """Process rows keyed by PID, updated from sampler diffs and never reset
+
+    The model keeps itself sorted: ordering 5k PIDs by a Python key takes
+    a few ms, where a QSortFilterProxyModel sort calls data() for every
+    comparison and takes half a second. Each diff ends in at most one
+    layoutChanged; when the order holds, only changed rows emit dataChanged.
+    """
+
+    HEADERS = ["PID", "Name", "State", "CPU %", "RSS", "Read/s", "Write/s"]
+    DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+    ALIGN_ROLE = Qt.ItemDataRole.TextAlignmentRole
+    FILTER_ROLE = Qt.ItemDataRole.UserRole + 1
+    RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+    def __init__(self, format_size, parent=None):
+        super().__init__(parent)
+        self.format_size = format_size
+        self.pids = []
+        self.rows = {}
+        self.row_of = {}
+        self.sort_column = -1
+        self.sort_order = Qt.SortOrder.AscendingOrder
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.pids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        # Called for every role of every visible cell on each repaint;
+        # turn the roles we don't use away before any other work
+        if role == self.ALIGN_ROLE:
+            return None if index.column() in (1, 2) else self.RIGHT
+        if role != self.DISPLAY_ROLE and role != self.FILTER_ROLE:
+            return None
+        pid = self.pids[index.row()]
+        name, state, cpu, rss, read_rate, write_rate, has_io = self.rows[pid]
+        column = index.column()
+
+        if role == self.DISPLAY_ROLE:
+            if column == 0:
+                return str(pid)
+            if column == 1:
+                return name
+            if column == 2:
+                return state
+            if column == 3:
+                return f"{cpu:.1f}"
+            if column == 4:
+                return self.format_size(rss)
+            if not has_io:
+                return "n/a"
+            return self.format_size(read_rate if column == 5 else write_rate) + "/s"
+        return f"{pid} {name}"
+
+    def sort_key(self, column):
+        """Key function ordering PIDs by `column`; ties go by PID"""
+        rows = self.rows
+        if column == 0:
+            return None
+        if column == 1:
+            return lambda pid: (rows[pid][0].lower(), pid)
+        return lambda pid: (rows[pid][column - 1], pid)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self.sort_column = column
+        self.sort_order = order
+        self.resort()
+
+    def resort(self):
+        """Restore the sort order; returns False when no row had to move"""
+        if self.sort_column < 0:
+            return False
+        order = sorted(self.pids, key=self.sort_key(self.sort_column),
+                       reverse=self.sort_order == Qt.SortOrder.DescendingOrder)
+        if order == self.pids:
+            return False
+        hint = QAbstractItemModel.LayoutChangeHint.VerticalSortHint
+        self.layoutAboutToBeChanged.emit([], hint)
+        old = self.persistentIndexList()
+        old_pids = [self.pids[index.row()] for index in old]
+        self.pids = order
+        self.row_of = {pid: row for row, pid in enumerate(order)}
+        self.changePersistentIndexList(
+            old, [self.index(self.row_of[pid], index.column()) for pid, index in zip(old_pids, old)]
+        )
+        self.layoutChanged.emit([], hint)
+        return True
+
+    def apply_diff(self, added, changed, removed):
+        """Apply (added, changed, removed) from sysmon.ProcessSampler.sample()"""
+        if removed:
+            # One beginRemoveRows per run of consecutive rows, highest run
+            # first so the remaining row numbers stay valid
+            for first, last in reversed(self._row_runs(self.row_of[pid] for pid in removed)):
+                self.beginRemoveRows(QModelIndex(), first, last)
+                for pid in self.pids[first:last + 1]:
+                    del self.rows[pid]
+                del self.pids[first:last + 1]
+                self.endRemoveRows()
+            self.row_of = {pid: row for row, pid in enumerate(self.pids)}
+
+        if added:
+            first = len(self.pids)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            for pid, row in added.items():
+                self.row_of[pid] = len(self.pids)
+                self.pids.append(pid)
+                self.rows[pid] = row
+            self.endInsertRows()
+
+        self.rows.update(changed)
+        if (added or changed) and self.resort():
+            # layoutChanged already refreshes every row
+            return
+        if changed:
+            # One dataChanged per run of consecutive rows
+            last_column = len(self.HEADERS) - 1
+            for first, last in self._row_runs(self.row_of[pid] for pid in changed):
+                self.dataChanged.emit(self.index(first, 0), self.index(last, last_column))
+
+    @staticmethod
+    def _row_runs(rows):
+        """[(first, last)] runs of consecutive numbers in `rows`, ascending"""
+        runs = []
+        for row in sorted(rows):
+            if runs and row == runs[-1][1] + 1:
+                runs[-1][1] = row
+            else:
+                runs.append([row, row])
+        return runs
+
+
+class ProcessFilterProxy(QSortFilterProxyModel):
+    """Filters the process table and hands sorting to ProcessTableModel"""
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+
+# -----------------------------------------------------------
+# BATCH IMAGE DIALOG
+# -----------------------------------------------------------
+class BatchDialog(QDialog):
+    """Options for batch processing gallery images"""
+
+    def __init__(self, count, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Batch Process Images")
+        form = QFormLayout(self)
+        form.addRow(QLabel(f"{count} image(s) selected"))
+
+        self.max_width = QSpinBox()
+        self.max_width.setRange(0, 20000)
+        self.max_width.setSpecialValueText("original")
+        form.addRow("Max width:", self.max_width)
+
+        self.max_height = QSpinBox()
+        self.max_height.setRange(0, 20000)
+        self.max_height.setSpecialValueText("original")
+        form.addRow("Max height:", self.max_height)
+
+        self.rotate = QComboBox()
+        self.rotate.addItems(["0°", "90°", "180°", "270°"])
+        form.addRow("Rotate (clockwise):", self.rotate)
+
+        self.crop = QSpinBox()
+        self.crop.setRange(0, 45)
+        self.crop.setSuffix(" % per edge")
+        form.addRow("Crop:", self.crop)
+
+        self.format = QComboBox()
+        self.format.addItems(list(batchimg.OUTPUT_FORMATS))
+        form.addRow("Format:", self.format)
+
+        self.quality = QSpinBox()
+        self.quality.setRange(1, 100)
+        self.quality.setValue(90)
+        form.addRow("JPEG/WebP quality:", self.quality)
+
+        self.strip_exif = QCheckBox("Strip EXIF metadata")
+        self.strip_exif.setChecked(True)
+        form.addRow(self.strip_exif)
+
+        self.workers = QSpinBox()
+        self.workers.setRange(1, os.cpu_count() or 1)
+        self.workers.setValue(os.cpu_count() or 1)
+        form.addRow("Worker processes:", self.workers)
+
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        form.addRow(buttons)
+
+    def options(self):
+        options = batchimg.default_options()
+        options.update({
+            "max_width": self.max_width.value(),
+            "max_height": self.max_height.value(),
+            "rotate": self.rotate.currentIndex() * 90,
+            "crop_percent": self.crop.value(),
+            "format": batchimg.OUTPUT_FORMATS[self.format.currentText()],
+            "quality": self.quality.value(),
+            "strip_exif": self.strip_exif.isChecked(),
+        })
+        return options
+
+
 class MainWindow(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Ultimate GUI")
         self.setGeometry(200, 80, 1100, 750)
 
-        # --- Glass Morphic OS Theme ---
-        self.setStyleSheet("""
-            QWidget {
-                background: rgba(255, 255, 255, 0.10);
-                color: white;
-                font-size: 16px;
-            }
-            QListWidget {
-                background: rgba(255, 255, 255, 0.15);
-                border: none;
-                font-size: 18px;
-            }
-            QListWidget::item:selected {
-                background: rgba(255, 255, 255, 0.30);
-            }
-            QPushButton {
-                background: rgba(255, 255, 255, 0.20);
-                border-radius: 12px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.35);
-            }
-            QLabel {
-                background: transparent;
-                color: white;
-            }
-        """)
+        # Settings and the last session (see session.py)
+        self.session = session.SessionStore()
+
+        # --- Glass Morphic OS Theme (see theme.py) ---
+        self.animator = Animator(self)
+        self.repaint_counter = RepaintCounter(self)
+        self.apply_theme(theme.reduced_motion_default(self.session.get("reduced_motion")))
 
         # Initialize all media resources
         self.cap = None
@@ -64,6 +492,27 @@ class MainWindow(QWidget):
         self.video_widget = None
         self.current_images = []
         self.current_image_index = 0
+        self.tasks = set()
+        self.jobs = set()
+        # Jobs can hold a pool thread for minutes; leave room for short tasks
+        # on machines where idealThreadCount() is 1 or 2
+        pool = QThreadPool.globalInstance()
+        pool.setMaxThreadCount(max(pool.maxThreadCount(), 4))
+        self.unseen_jobs = set()
+        self.file_job = None
+        self.batch_job = None
+        self.tracker_task = None
+        self.traffic_timer = None
+        rate = self.session.get("monitor_interval", 1.0)
+        self.monitor_interval = rate if rate in MONITOR_RATES else 1.0
+        self.monitor_history = sysmon.MonitorHistory()
+        self.current_page = 0
+        self.playlist = self.session.get("playlist", [])
+        self.playlist_index = self.session.get("playlist_index", 0)
+        self.gallery_listing = None
+        self.preview_cache = {}
+        self.warmed = False
+        self.resume_page = None
 
         # MAIN LAYOUT
         layout = QHBoxLayout(self)
@@ -71,7 +520,10 @@ class MainWindow(QWidget):
         # Sidebar
         self.menu = QListWidget()
         self.menu.setFixedWidth(180)
-        self.menu.addItems(["Home", "Gallery", "Camera", "Video Player", "Music Player", "Tools", "Settings"])
+        self.menu.addItems(PAGE_NAMES)
+        # Home is built below; without a current row, focus would select
+        # (and rebuild) it, dropping the page resume_session() is waiting to open
+        self.menu.setCurrentRow(0)
         self.menu.currentRowChanged.connect(self.switch_page)
 
         # Page container
@@ -83,70 +535,374 @@ class MainWindow(QWidget):
         layout.addWidget(self.pages)
 
         self.show_home()
-        
+
+        self.setup_perf_hud()
+        self.restore_session()
+
         # START ENTRY ANIMATIONS
         self.animate_entry()
 
     # -----------------------------------------------------------
-    # ENTRY ANIMATION
+    # SESSION
     # -----------------------------------------------------------
+    def restore_session(self):
+        """Reopen the HUD and pick the last page (never straight into the camera)
+
+        The page itself is only built by resume_session(), after the first paint.
+        """
+        if self.session.get("hud"):
+            self.toggle_perf_hud()
+        if not self.session.get("restore", True):
+            return
+        page = self.session.get("page")
+        if page in PAGE_NAMES and page not in ("Home", "Camera"):
+            self.resume_page = PAGE_NAMES.index(page)
+
+    def save_page_state(self):
+        """Record state that only lives in the widgets of the current page"""
+        page = PAGE_NAMES[self.current_page]
+        if page == "Tools":
+            # Walk back from the end; the output can hold whole files
+            lines, size = [], 0
+            block = self.tools_output.document().lastBlock()
+            while block.isValid() and size < TOOLS_TAIL_CHARS:
+                lines.append(block.text())
+                size += block.length()
+                block = block.previous()
+            self.session.set("tools_output", "\n".join(reversed(lines))[-TOOLS_TAIL_CHARS:])
+        elif page == "Video Player":
+            self.save_position(self.media_player, "video_position")
+        elif page == "Music Player":
+            self.save_position(self.audio_player, "music_position")
+
+    def save_position(self, player, key):
+        if player and player.mediaStatus() in (QMediaPlayer.MediaStatus.LoadedMedia,
+                                               QMediaPlayer.MediaStatus.BufferingMedia,
+                                               QMediaPlayer.MediaStatus.BufferedMedia):
+            self.session.set(key, player.position())
+
+    def remember_position(self, player, key, position):
+        """Save the playback position every 5 s of progress, in case of a crash"""
+        if player.playbackState() != QMediaPlayer.PlaybackState.PlayingState:
+            return
+        if abs(position - self.session.get(key, 0)) >= 5000:
+            self.session.set(key, position)
+
+    def seek_when_loaded(self, player, position):
+        """setPosition() is ignored until the media has loaded"""
+        if not position:
+            return
+
+        def on_status(status):
+            if status in (QMediaPlayer.MediaStatus.LoadedMedia, QMediaPlayer.MediaStatus.BufferedMedia):
+                player.mediaStatusChanged.disconnect(on_status)
+                player.setPosition(position)
+
+        player.mediaStatusChanged.connect(on_status)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.warmed:
+            # Only once the first frame is on screen
+            self.warmed = True
+            QTimer.singleShot(0, self.resume_session)
+
+    def resume_session(self):
+        """Open the page picked by restore_session() and warm the caches
+
+        The gallery waits for warm_caches() so its first image comes out of
+        the cache instead of being decoded on the GUI thread; other pages
+        open straight away. Navigating before then drops the resume.
+        """
+        if self.resume_page is None:
+            self.warm_caches()
+        elif PAGE_NAMES[self.resume_page] == "Gallery":
+            self.warm_caches(on_finished=self.resume)
+        else:
+            self.resume()
+            self.warm_caches()
+
+    def resume(self):
+        index, self.resume_page = self.resume_page, None
+        if index is not None:
+            self.menu.setCurrentRow(index)
+
+    def warm_caches(self, on_finished=None):
+        """Prefetch the gallery listing and the images around the last one viewed"""
+        saved = self.session.get("gallery_image")
+
+        def work(progress, cancel):
+            with PERF.measure("session.warm"):
+                images = self.list_gallery()
+                if saved not in images:
+                    return
+                i = images.index(saved)
+                for path in (images[i], images[(i + 1) % len(images)], images[(i - 1) % len(images)]):
+                    if cancel.is_set():
+                        return
+                    if path in self.preview_cache:
+                        continue
+                    mtime = os.stat(path).st_mtime_ns
+                    # QImage (unlike QPixmap) may be used off the GUI thread
+                    image = QImage(path)
+                    if not image.isNull():
+                        self.preview_cache[path] = (mtime, image.scaled(
+                            600, 400, Qt.AspectRatioMode.KeepAspectRatio,
+                            Qt.TransformationMode.SmoothTransformation
+                        ))
+
+        self.start_task(work, on_finished=on_finished)
+
+    def last_dir(self, kind="files"):
+        return self.session.get("dirs", {}).get(kind, IMG_FOLDER if kind == "images" else "")
+
+    def remember_dir(self, path, kind="files"):
+        if not path:
+            return
+        dirs = dict(self.session.get("dirs", {}))
+        dirs[kind] = path if os.path.isdir(path) else os.path.dirname(path)
+        self.session.set("dirs", dirs)
+
+    def get_open_file(self, title, filters="All Files (*.*)", kind="files"):
+        """QFileDialog.getOpenFileName starting in the last folder used for `kind`"""
+        path, _ = QFileDialog.getOpenFileName(self, title, self.last_dir(kind), filters)
+        self.remember_dir(path, kind)
+        return path
+
+    def get_open_files(self, title, filters="All Files (*.*)", kind="files"):
+        paths, _ = QFileDialog.getOpenFileNames(self, title, self.last_dir(kind), filters)
+        if paths:
+            self.remember_dir(paths[0], kind)
+        return paths
+
+    def get_directory(self, title, kind="files"):
+        path = QFileDialog.getExistingDirectory(self, title, self.last_dir(kind))
+        self.remember_dir(path, kind)
+        return path
+
+    def get_save_file(self, title, name, filters="All Files (*.*)", kind="files"):
+        """QFileDialog.getSaveFileName offering `name` in the last folder used for `kind`
+
+        If `name` has a folder part, that folder is used until `kind` has one.
+        """
+        folder = self.last_dir(kind)
+        start = os.path.join(folder, os.path.basename(name)) if folder else name
+        path, _ = QFileDialog.getSaveFileName(self, title, start, filters)
+        self.remember_dir(path, kind)
+        return path
+
+    # -----------------------------------------------------------
+    # THEME & ENTRY ANIMATION
+    # -----------------------------------------------------------
+    def apply_theme(self, reduced_motion):
+        """Glass theme with animations, or the solid reduced-motion theme"""
+        self.reduced_motion = reduced_motion
+        self.animator.enabled = not reduced_motion
+        if reduced_motion:
+            self.animator.stop()
+
+        # One app-wide sheet; re-polishing every widget is the costly part,
+        # so skip it when nothing changed
+        sheet = theme.stylesheet(theme.palette_for(reduced_motion))
+        app = QApplication.instance()
+        if app.styleSheet() != sheet:
+            with PERF.measure("theme.apply"):
+                app.setStyleSheet(sheet)
+
     def animate_entry(self):
-        """Create eye-catching entry animations"""
-        # Set initial states for animation
-        self.setWindowOpacity(0)  # Start invisible
-        
-        # Sidebar slide in from left
-        self.menu_start_pos = QPoint(-180, self.menu.y())
-        self.menu.move(self.menu_start_pos)
-        
-        # Fade in window
-        self.fade_anim = QPropertyAnimation(self, b"windowOpacity")
-        self.fade_anim.setDuration(800)
-        self.fade_anim.setStartValue(0)
-        self.fade_anim.setEndValue(1)
-        self.fade_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self.fade_anim.start()
-        
-        # Slide in sidebar
-        self.slide_anim = QPropertyAnimation(self.menu, b"pos")
-        self.slide_anim.setDuration(1000)
-        self.slide_anim.setStartValue(QPoint(-180, self.menu.y()))
-        self.slide_anim.setEndValue(QPoint(0, self.menu.y()))
-        self.slide_anim.setEasingCurve(QEasingCurve.Type.OutElastic)
-        QTimer.singleShot(200, self.slide_anim.start)
-        
-        # Zoom in pages container
-        self.pages.setStyleSheet("QWidget { transform: scale(0.8); }")
-        QTimer.singleShot(400, self.animate_pages_zoom)
-        
-        # START ENTRY ANIMATIONS
-        self.animate_entry()
+        """Fade the window in and slide the sidebar in from the left"""
+        y = self.menu.y()
+        self.animator.animate("window.fade", self.setWindowOpacity, 0.0, 1.0, 800)
+        self.animator.animate("menu.slide", self.menu.move, QPoint(-180, y), QPoint(0, y), 1000,
+                              QEasingCurve.Type.OutElastic, delay_ms=200)
+
+    # -----------------------------------------------------------
+    # PERFORMANCE HUD
+    # -----------------------------------------------------------
+    def setup_perf_hud(self):
+        """Create the toggleable metrics overlay and the event-loop lag monitor"""
+        self.hud_label = QLabel(self)
+        self.hud_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.hud_label.setObjectName("perfHud")
+        self.hud_label.hide()
+
+        self.hud_timer = QTimer(self)
+        self.hud_timer.timeout.connect(self.refresh_perf_hud)
+
+        self.hud_shortcut = QShortcut(QKeySequence("F3"), self)
+        self.hud_shortcut.activated.connect(self.toggle_perf_hud)
+
+        # Heartbeat for the lag monitor; a stalled GUI thread stops beating
+        self.lag_monitor = LagMonitor(PERF, threshold_ms=STALL_THRESHOLD_MS)
+        self.heartbeat_timer = QTimer(self)
+        self.heartbeat_timer.timeout.connect(self.lag_monitor.beat)
+        self.heartbeat_timer.start(50)
+        self.lag_monitor.start()
+
+    def toggle_perf_hud(self):
+        # isHidden(), not isVisible(): the window itself may not be shown yet
+        showing = not self.hud_label.isHidden()
+        self.session.set("hud", not showing)
+        # Paint events are only counted while the HUD is showing
+        if showing:
+            self.hud_timer.stop()
+            self.hud_label.hide()
+            QApplication.instance().removeEventFilter(self.repaint_counter)
+        else:
+            QApplication.instance().installEventFilter(self.repaint_counter)
+            self.refresh_perf_hud()
+            self.hud_label.show()
+            self.hud_label.raise_()
+            self.hud_timer.start(500)
+
+    def refresh_perf_hud(self):
+        lines = PERF.report_lines() or ["No samples yet"]
+        self.hud_label.setText("⚡ Performance (F3)\n" + "\n".join(lines))
+        self.hud_label.adjustSize()
+        self.hud_label.move(self.width() - self.hud_label.width() - 10, 10)
+
+    def export_metrics(self):
+        """Dump collected metrics to JSON or CSV"""
+        path = self.get_save_file(
+            "Export Metrics", "metrics.json",
+            "JSON (*.json);;CSV (*.csv)", kind="metrics"
+        )
+        if not path:
+            return
+
+        try:
+            PERF.dump(path)
+            self.tools_output.append("\n✅ Metrics exported!\n")
+            self.tools_output.append(f"📊 {path}\n")
+            self.tools_output.append("=" * 50 + "\n")
+        except Exception as e:
+            self.tools_output.append(f"\n❌ Error exporting metrics: {str(e)}\n")
+            self.tools_output.append("=" * 50 + "\n")
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if hasattr(self, "hud_label") and self.hud_label.isVisible():
+            self.hud_label.move(self.width() - self.hud_label.width() - 10, 10)
 
     # -----------------------------------------------------------
     # SAFE PAGE SWITCHING
     # -----------------------------------------------------------
     def switch_page(self, index):
-        # Stop all media resources
-        self.cleanup_resources()
+        with PERF.measure(f"page.{PAGE_NAMES[index]}" if 0 <= index < len(PAGE_NAMES) else "page.none"):
+            self.save_page_state()
+
+            # Stop all media resources
+            self.cleanup_resources()
+
+            # Clear old widgets
+            for i in reversed(range(self.pages_layout.count())):
+                widget = self.pages_layout.itemAt(i).widget()
+                if widget:
+                    widget.setParent(None)
+                    widget.deleteLater()
+
+            # Set first: job callbacks check it to find out which widgets exist
+            self.current_page = index
+            self.resume_page = None
+            if PAGE_NAMES[index] in self.unseen_jobs:
+                self.unseen_jobs.discard(PAGE_NAMES[index])
+                self.update_job_badges()
+
+            # Show new page
+            if index == 0: self.show_home()
+            elif index == 1: self.show_gallery()
+            elif index == 2: self.show_camera()
+            elif index == 3: self.show_video_player()
+            elif index == 4: self.show_music_player()
+            elif index == 5: self.show_tools()
+            elif index == 6: self.show_monitor()
+            elif index == 7: self.show_processes()
+            elif index == 8: self.show_settings()
+
+            self.session.set("page", PAGE_NAMES[index])
 
-        # Clear old widgets
-        for i in reversed(range(self.pages_layout.count())):
-            widget = self.pages_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-                widget.deleteLater()
-
-        # Show new page
-        if index == 0: self.show_home()
-        elif index == 1: self.show_gallery()
-        elif index == 2: self.show_camera()
-        elif index == 3: self.show_video_player()
-        elif index == 4: self.show_music_player()
-        elif index == 5: self.show_tools()
-        elif index == 6: self.show_settings()
+    # -----------------------------------------------------------
+    # BACKGROUND TASK HELPERS
+    # -----------------------------------------------------------
+    def start_task(self, fn, on_progress=None, on_result=None, on_error=None, on_finished=None,
+                   page=None, long_running=False):
+        """Run fn(progress, cancel) off the GUI thread and route its signals
+
+        Tasks are cancelled when the user leaves the page. Passing `page`
+        makes it a job instead: it keeps running across page switches and
+        badges that page in the sidebar, so its handlers must check
+        page_is() before touching the page's widgets.
+
+        Loops that only end when cancelled (samplers, trackers) pass
+        long_running=True and get a thread of their own; on the shared
+        pool each would hold one of as few as idealThreadCount() threads
+        and starve every other task.
+        """
+        task = Task(fn)
+        if on_progress:
+            task.signals.progress.connect(on_progress)
+        if on_result:
+            task.signals.result.connect(on_result)
+        if on_error:
+            task.signals.error.connect(on_error)
+        if on_finished:
+            task.signals.finished.connect(on_finished)
+        if page:
+            task.page = page
+            task.signals.finished.connect(lambda: self.job_finished(task))
+            self.jobs.add(task)
+            self.update_job_badges()
+        else:
+            task.signals.finished.connect(lambda: self.tasks.discard(task))
+            self.tasks.add(task)
+        if long_running:
+            threading.Thread(target=task.run, name="task-loop", daemon=True).start()
+        else:
+            QThreadPool.globalInstance().start(task)
+        return task
+
+    def job_finished(self, task):
+        self.jobs.discard(task)
+        if not self.page_is(task.page):
+            self.unseen_jobs.add(task.page)
+        self.update_job_badges()
+
+    def update_job_badges(self):
+        """⏳ on pages with running jobs, 🔔 on pages whose job finished unseen"""
+        busy = {task.page for task in self.jobs}
+        for i, name in enumerate(PAGE_NAMES):
+            badge = "⏳" if name in busy else "🔔" if name in self.unseen_jobs else ""
+            self.menu.item(i).setText(f"{name} {badge}".rstrip())
+
+    def page_is(self, name):
+        return PAGE_NAMES[self.current_page] == name
+
+    def cancel_tasks(self, jobs=False):
+        """Cancel running tasks (and jobs too) and detach them from widgets about to be deleted"""
+        tasks = self.tasks | self.jobs if jobs else self.tasks
+        for task in list(tasks):
+            task.cancel()
+            for task_signal in (task.signals.progress, task.signals.result,
+                                task.signals.error, task.signals.finished):
+                try:
+                    task_signal.disconnect()
+                except TypeError:
+                    pass
+        self.tasks.clear()
+        if jobs:
+            self.jobs.clear()
+        self.tracker_task = None
 
     def cleanup_resources(self):
         """Clean up all media resources safely"""
+        # Stop background work tied to the current page
+        self.cancel_tasks()
+
+        if self.traffic_timer:
+            self.traffic_timer.stop()
+            self.traffic_timer.deleteLater()
+            self.traffic_timer = None
+
         # Stop camera
         if self.timer:
             try:
@@ -190,7 +946,7 @@ class MainWindow(QWidget):
     def show_home(self):
         label = QLabel("✨ Welcome to the UI ✨")
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label.setStyleSheet("font-size: 32px; font-weight: bold;")
+        label.setObjectName("heroTitle")
         self.pages_layout.addWidget(label)
 
     # -----------------------------------------------------------
@@ -198,9 +954,11 @@ class MainWindow(QWidget):
     # -----------------------------------------------------------
     def show_gallery(self):
         container = QVBoxLayout()
+        # Only built when there are images; see attach_batch_job()
+        self.batch_progress = None
         
         label = QLabel("Image Gallery")
-        label.setStyleSheet("font-size: 24px; font-weight: bold;")
+        label.setObjectName("pageTitle")
         container.addWidget(label)
 
         self.img_label = QLabel()
@@ -208,20 +966,16 @@ class MainWindow(QWidget):
         self.img_label.setMinimumSize(600, 400)
         container.addWidget(self.img_label)
 
-        # Load all images
-        self.current_images = []
+        # Load all images, back at the last one viewed
+        self.current_images = self.list_gallery()
         self.current_image_index = 0
-
-        try:
-            for file in os.listdir(IMG_FOLDER):
-                if file.lower().endswith((".png", ".jpg", ".jpeg", ".bmp")):
-                    self.current_images.append(os.path.join(IMG_FOLDER, file))
-        except Exception as e:
-            print(f"Error loading images: {e}")
+        saved = self.session.get("gallery_image")
+        if saved in self.current_images:
+            self.current_image_index = self.current_images.index(saved)
 
         if not self.current_images:
             self.img_label.setText("❌ No images found in /img/\nCapture a photo from Camera to see it here!")
-            self.img_label.setStyleSheet("font-size: 18px;")
+            self.img_label.setObjectName("infoLabel")
         else:
             # Navigation buttons
             nav_layout = QHBoxLayout()
@@ -239,6 +993,30 @@ class MainWindow(QWidget):
             nav_layout.addWidget(next_btn)
             
             container.addLayout(nav_layout)
+
+            # Batch processing row
+            batch_layout = QHBoxLayout()
+
+            self.batch_btn = QPushButton("🛠 Batch Process")
+            self.batch_btn.clicked.connect(self.batch_process_images)
+            batch_layout.addWidget(self.batch_btn)
+
+            self.batch_progress = QProgressBar()
+            self.batch_progress.hide()
+            batch_layout.addWidget(self.batch_progress)
+
+            self.batch_status = QLabel()
+            batch_layout.addWidget(self.batch_status)
+
+            self.batch_cancel_btn = QPushButton("Cancel")
+            self.batch_cancel_btn.clicked.connect(self.cancel_batch_job)
+            self.batch_cancel_btn.hide()
+            batch_layout.addWidget(self.batch_cancel_btn)
+
+            batch_layout.addStretch()
+            container.addLayout(batch_layout)
+            # A batch started on an earlier visit may still be running
+            self.attach_batch_job()
             
             # Show first image
             self.display_current_image()
@@ -247,6 +1025,29 @@ class MainWindow(QWidget):
         widget.setLayout(container)
         self.pages_layout.addWidget(widget)
 
+    def list_gallery(self):
+        """Image paths in IMG_FOLDER; the listing is reused until the folder changes
+
+        The listing is kept in the session too, so a resumed session skips
+        the directory scan. Also called from warm_caches() on a pool thread.
+        """
+        try:
+            key = [IMG_FOLDER, os.stat(IMG_FOLDER).st_mtime_ns]
+            listing = self.gallery_listing or self.session.get("gallery_listing")
+            if listing and listing[0] == key:
+                self.gallery_listing = listing
+                return list(listing[1])
+            images = [
+                os.path.join(IMG_FOLDER, file) for file in os.listdir(IMG_FOLDER)
+                if file.lower().endswith((".png", ".jpg", ".jpeg", ".bmp"))
+            ]
+            self.gallery_listing = [key, images]
+            self.session.set("gallery_listing", self.gallery_listing)
+            return list(images)
+        except OSError as e:
+            PERF.error("gallery.list", e)
+            return []
+
     def display_current_image(self):
         """Display the current image in gallery"""
         if not self.current_images:
@@ -254,19 +1055,30 @@ class MainWindow(QWidget):
             
         try:
             img_path = self.current_images[self.current_image_index]
-            pix = QPixmap(img_path)
-            
-            if pix.isNull():
-                self.img_label.setText("❌ Error loading image")
-                return
-                
-            scaled_pix = pix.scaled(600, 400, Qt.AspectRatioMode.KeepAspectRatio, 
-                                   Qt.TransformationMode.SmoothTransformation)
-            self.img_label.setPixmap(scaled_pix)
+            cached = self.preview_cache.pop(img_path, None)
+            if cached and cached[0] == os.stat(img_path).st_mtime_ns:
+                # Pre-scaled by warm_caches()
+                with PERF.measure("gallery.paint"):
+                    self.img_label.setPixmap(QPixmap.fromImage(cached[1]))
+            else:
+                with PERF.measure("gallery.decode"):
+                    pix = QPixmap(img_path)
+
+                if pix.isNull():
+                    self.img_label.setText("❌ Error loading image")
+                    return
+
+                with PERF.measure("gallery.scale"):
+                    scaled_pix = pix.scaled(600, 400, Qt.AspectRatioMode.KeepAspectRatio,
+                                           Qt.TransformationMode.SmoothTransformation)
+                with PERF.measure("gallery.paint"):
+                    self.img_label.setPixmap(scaled_pix)
+            self.session.set("gallery_image", img_path)
             
             # Update counter
             self.image_counter.setText(f"Image {self.current_image_index + 1} / {len(self.current_images)}")
         except Exception as e:
+            PERF.error("gallery.display", e)
             self.img_label.setText(f"❌ Error: {str(e)}")
 
     def show_next_image(self):
@@ -279,6 +1091,103 @@ class MainWindow(QWidget):
             self.current_image_index = (self.current_image_index - 1) % len(self.current_images)
             self.display_current_image()
 
+    def batch_process_images(self):
+        """Resize/rotate/crop/convert selected images across all cores"""
+        if self.batch_job:
+            # A second batch would orphan the running one's process pool
+            QMessageBox.information(self, "Busy", "A batch is still running. "
+                                                  "Wait for it to finish or cancel it first.")
+            return
+        paths = self.get_open_files(
+            "Select Images to Process",
+            "Images (*.png *.jpg *.jpeg *.bmp *.webp);;All Files (*.*)", kind="images"
+        )
+        if not paths:
+            return
+
+        dialog = BatchDialog(len(paths), self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        options = dialog.options()
+        workers = dialog.workers.value()
+
+        out_dir = self.get_directory("Select Output Folder", kind="images")
+        if not out_dir:
+            return
+
+        job = {"state": (0, len(paths)), "started": time.monotonic()}
+
+        def work(progress, cancel):
+            last_report = [0.0]
+
+            # Throttle GUI updates; 10k images shouldn't mean 10k repaints
+            def report(done, total, result):
+                now = time.monotonic()
+                if done == total or now - last_report[0] >= 0.1:
+                    last_report[0] = now
+                    progress((done, total))
+
+            with PERF.measure("gallery.batch"):
+                return batchimg.run_batch(paths, options, out_dir, workers=workers,
+                                          progress=report, cancel=cancel)
+
+        def on_progress(state):
+            job["state"] = state
+            if self.batch_job is job:
+                self.attach_batch_job()
+
+        def finish(status):
+            if self.batch_job is job:
+                self.batch_job = None
+                self.attach_batch_job(status)
+
+        def on_result(summary):
+            status = "cancelled" if summary["cancelled"] else "done"
+            finish(
+                f"✔ {status}: {summary['done'] - summary['failed']} ok, {summary['failed']} failed "
+                f"in {summary['elapsed']:.1f}s"
+            )
+            message = (
+                f"Processed {summary['done']} of {summary['total']} image(s) in {summary['elapsed']:.1f}s\n"
+                f"{self.format_size(summary['in_bytes'])} → {self.format_size(summary['out_bytes'])}\n"
+                f"Saved to: {out_dir}"
+            )
+            if summary["errors"]:
+                message += "\n\nErrors:\n" + "\n".join(summary["errors"][:5])
+            QMessageBox.information(self, "Batch Complete", message)
+
+        def on_error(error):
+            finish("")
+            QMessageBox.critical(self, "Error", f"Batch processing failed: {error}")
+
+        job["task"] = self.start_task(work, on_progress=on_progress, on_result=on_result,
+                                      on_error=on_error, page="Gallery")
+        self.batch_job = job
+        self.attach_batch_job()
+
+    def attach_batch_job(self, status=""):
+        """Point the Gallery batch row at the running batch, or hide it"""
+        if not self.page_is("Gallery") or self.batch_progress is None:
+            return
+        job = self.batch_job
+        self.batch_btn.setEnabled(not job)
+        if not job:
+            self.batch_progress.hide()
+            self.batch_cancel_btn.hide()
+            self.batch_status.setText(status)
+            return
+        done, total = job["state"]
+        rate = done / max(time.monotonic() - job["started"], 1e-6)
+        self.batch_progress.setRange(0, total)
+        self.batch_progress.setValue(done)
+        self.batch_progress.show()
+        self.batch_cancel_btn.show()
+        self.batch_status.setText(f"{done}/{total}  ({rate:.1f} img/s)")
+
+    def cancel_batch_job(self):
+        if self.batch_job:
+            self.batch_job["task"].cancel()
+
     # -----------------------------------------------------------
     # CAMERA PAGE (FIXED)
     # -----------------------------------------------------------
@@ -330,24 +1239,28 @@ class MainWindow(QWidget):
             return
 
         try:
-            ret, frame = self.cap.read()
+            with PERF.measure("camera.read"):
+                ret, frame = self.cap.read()
             if not ret:
+                PERF.count("camera.dropped")
                 return
 
             # Convert and display
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = frame.shape
-            bytes_per_line = ch * w
-            
-            q_img = QImage(frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+            with PERF.measure("camera.convert"):
+                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                h, w, ch = frame.shape
+                bytes_per_line = ch * w
+                
+                q_img = QImage(frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
             
             if self.video_label:
-                pixmap = QPixmap.fromImage(q_img)
-                scaled = pixmap.scaled(640, 480, Qt.AspectRatioMode.KeepAspectRatio,
-                                     Qt.TransformationMode.FastTransformation)
-                self.video_label.setPixmap(scaled)
+                with PERF.measure("camera.paint"):
+                    pixmap = QPixmap.fromImage(q_img)
+                    scaled = pixmap.scaled(640, 480, Qt.AspectRatioMode.KeepAspectRatio,
+                                         Qt.TransformationMode.FastTransformation)
+                    self.video_label.setPixmap(scaled)
         except Exception as e:
-            print(f"Frame update error: {e}")
+            PERF.error("camera.frame", e)
 
     def take_photo(self):
         """Capture photo safely"""
@@ -383,7 +1296,7 @@ class MainWindow(QWidget):
         layout = QVBoxLayout()
 
         label = QLabel("Video Player")
-        label.setStyleSheet("font-size: 24px; font-weight: bold;")
+        label.setObjectName("pageTitle")
         layout.addWidget(label)
 
         # Create video widget
@@ -396,6 +1309,9 @@ class MainWindow(QWidget):
         audio = QAudioOutput()
         self.media_player.setAudioOutput(audio)
         self.media_player.setVideoOutput(self.video_widget)
+        self.media_player.positionChanged.connect(
+            lambda pos, player=self.media_player: self.remember_position(player, "video_position", pos)
+        )
 
         # Control buttons
         btn_layout = QHBoxLayout()
@@ -422,16 +1338,21 @@ class MainWindow(QWidget):
         widget.setLayout(layout)
         self.pages_layout.addWidget(widget)
 
+        # Reopen the last video where it was left, paused
+        source = self.session.get("video_source")
+        if source and os.path.isfile(source):
+            self.media_player.setSource(QUrl.fromLocalFile(source))
+            self.seek_when_loaded(self.media_player, self.session.get("video_position", 0))
+
     def load_video(self):
         """Load video file safely"""
         try:
-            fname, _ = QFileDialog.getOpenFileName(
-                self, "Select Video", "", 
-                "Video Files (*.mp4 *.avi *.mkv *.mov);;All Files (*.*)"
-            )
+            fname = self.get_open_file("Select Video", "Video Files (*.mp4 *.avi *.mkv *.mov);;All Files (*.*)",
+                                       kind="video")
             if fname:
                 self.media_player.setSource(QUrl.fromLocalFile(fname))
                 self.media_player.play()
+                self.session.update(video_source=fname, video_position=0)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load video: {str(e)}")
 
@@ -442,18 +1363,31 @@ class MainWindow(QWidget):
         layout = QVBoxLayout()
 
         label = QLabel("Music Player")
-        label.setStyleSheet("font-size: 24px; font-weight: bold;")
+        label.setObjectName("pageTitle")
         layout.addWidget(label)
 
         self.song_label = QLabel("No song loaded")
         self.song_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.song_label.setStyleSheet("font-size: 18px;")
+        self.song_label.setObjectName("infoLabel")
         layout.addWidget(self.song_label)
 
         # Create audio player
         self.audio_player = QMediaPlayer()
         audio_output = QAudioOutput()
         self.audio_player.setAudioOutput(audio_output)
+        self.audio_player.mediaStatusChanged.connect(self.on_music_status)
+        self.audio_player.positionChanged.connect(
+            lambda pos, player=self.audio_player: self.remember_position(player, "music_position", pos)
+        )
+
+        # Playlist
+        self.playlist = [path for path in self.playlist if os.path.isfile(path)]
+        self.playlist_widget = QListWidget()
+        self.playlist_widget.addItems([os.path.basename(path) for path in self.playlist])
+        self.playlist_widget.itemDoubleClicked.connect(
+            lambda item: self.play_track(self.playlist_widget.row(item))
+        )
+        layout.addWidget(self.playlist_widget)
 
         # Control buttons
         btn_layout = QHBoxLayout()
@@ -474,26 +1408,71 @@ class MainWindow(QWidget):
         stop_btn.clicked.connect(lambda: self.audio_player.stop() if self.audio_player else None)
         btn_layout.addWidget(stop_btn)
 
+        next_btn = QPushButton("⏭ Next")
+        next_btn.clicked.connect(self.next_track)
+        btn_layout.addWidget(next_btn)
+
+        clear_btn = QPushButton("🗑 Clear Playlist")
+        clear_btn.clicked.connect(self.clear_playlist)
+        btn_layout.addWidget(clear_btn)
+
         layout.addLayout(btn_layout)
 
         widget = QWidget()
         widget.setLayout(layout)
         self.pages_layout.addWidget(widget)
 
+        # Back to the last track and position, paused
+        if self.playlist:
+            index = min(self.playlist_index, len(self.playlist) - 1)
+            self.play_track(index, self.session.get("music_position", 0), autoplay=False)
+
     def load_audio(self):
-        """Load audio file safely"""
+        """Add audio files to the playlist and play the first one added"""
         try:
-            fname, _ = QFileDialog.getOpenFileName(
-                self, "Select Audio", "", 
-                "Audio Files (*.mp3 *.wav *.ogg *.flac);;All Files (*.*)"
+            fnames = self.get_open_files(
+                "Select Audio", "Audio Files (*.mp3 *.wav *.ogg *.flac);;All Files (*.*)", kind="music"
             )
-            if fname:
-                self.audio_player.setSource(QUrl.fromLocalFile(fname))
-                self.song_label.setText(f"🎵 {os.path.basename(fname)}")
-                self.audio_player.play()
+            if fnames:
+                first = len(self.playlist)
+                self.playlist.extend(fnames)
+                self.playlist_widget.addItems([os.path.basename(path) for path in fnames])
+                self.session.set("playlist", list(self.playlist))
+                self.play_track(first)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load audio: {str(e)}")
 
+    def play_track(self, index, position=0, autoplay=True):
+        if not self.audio_player or not 0 <= index < len(self.playlist):
+            return
+        path = self.playlist[index]
+        self.playlist_index = index
+        self.audio_player.setSource(QUrl.fromLocalFile(path))
+        self.seek_when_loaded(self.audio_player, position)
+        self.song_label.setText(f"🎵 {os.path.basename(path)}")
+        self.playlist_widget.setCurrentRow(index)
+        if autoplay:
+            self.audio_player.play()
+        self.session.update(playlist_index=index, music_position=position)
+
+    def next_track(self):
+        if self.playlist:
+            self.play_track((self.playlist_index + 1) % len(self.playlist))
+
+    def on_music_status(self, status):
+        if status == QMediaPlayer.MediaStatus.EndOfMedia and self.playlist_index + 1 < len(self.playlist):
+            self.play_track(self.playlist_index + 1)
+
+    def clear_playlist(self):
+        if self.audio_player:
+            self.audio_player.stop()
+            self.audio_player.setSource(QUrl())
+        self.playlist = []
+        self.playlist_index = 0
+        self.playlist_widget.clear()
+        self.song_label.setText("No song loaded")
+        self.session.update(playlist=[], playlist_index=0, music_position=0)
+
     # -----------------------------------------------------------
     # SYSTEM TOOLS
     # -----------------------------------------------------------
@@ -501,47 +1480,84 @@ class MainWindow(QWidget):
         layout = QVBoxLayout()
 
         label = QLabel("System Tools & File Manager")
-        label.setStyleSheet("font-size: 22px; font-weight: bold;")
+        label.setObjectName("pageTitle")
         layout.addWidget(label)
 
         # Output display
         self.tools_output = QTextEdit()
         self.tools_output.setReadOnly(True)
-        self.tools_output.setStyleSheet("""
-            QTextEdit {
-                background: rgba(0, 0, 0, 0.5);
-                color: #00ff00;
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 14px;
-                border: 1px solid rgba(255, 255, 255, 0.3);
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
-        self.tools_output.setText("Ready. Click a button to run a command...\n")
+        self.tools_output.setObjectName("console")
+        previous = self.session.get("tools_output")
+        if previous:
+            # Output from the last visit (or the last session)
+            self.tools_output.setPlainText(previous)
+            self.tools_output.moveCursor(QTextCursor.MoveOperation.End)
+        else:
+            self.tools_output.setText("Ready. Click a button to run a command...\n")
         layout.addWidget(self.tools_output)
 
+        # Progress for long-running file jobs (archives)
+        progress_layout = QHBoxLayout()
+        self.tools_progress = QProgressBar()
+        self.tools_progress.setRange(0, 1000)
+        self.tools_progress.hide()
+        progress_layout.addWidget(self.tools_progress)
+        self.tools_status = QLabel()
+        progress_layout.addWidget(self.tools_status)
+        self.tools_cancel_btn = QPushButton("Cancel")
+        self.tools_cancel_btn.clicked.connect(self.cancel_file_job)
+        self.tools_cancel_btn.hide()
+        progress_layout.addWidget(self.tools_cancel_btn)
+        layout.addLayout(progress_layout)
+
         # Network Tools Row
         net_layout = QHBoxLayout()
         net_label = QLabel("🌐 Network Tools:")
-        net_label.setStyleSheet("font-weight: bold;")
+        net_label.setObjectName("sectionLabel")
         net_layout.addWidget(net_label)
 
         btn_ping = QPushButton("Ping Google")
         btn_ping.clicked.connect(self.ping_google)
         net_layout.addWidget(btn_ping)
 
+        btn_sweep = QPushButton("Ping Sweep")
+        btn_sweep.clicked.connect(self.ping_sweep)
+        net_layout.addWidget(btn_sweep)
+
+        self.btn_tracker = QPushButton("Latency Tracker")
+        self.btn_tracker.clicked.connect(self.toggle_latency_tracker)
+        net_layout.addWidget(self.btn_tracker)
+
         btn_ipconfig = QPushButton("IP Config")
         btn_ipconfig.clicked.connect(self.show_ipconfig)
         net_layout.addWidget(btn_ipconfig)
 
+        self.btn_traffic = QPushButton("Live Traffic")
+        self.btn_traffic.clicked.connect(self.toggle_live_traffic)
+        net_layout.addWidget(self.btn_traffic)
+
         net_layout.addStretch()
         layout.addLayout(net_layout)
 
+        # Live latency chart, shown while the tracker runs
+        self.latency_chart = LineChart("Latency", " ms")
+        self.latency_chart.hide()
+        layout.addWidget(self.latency_chart)
+
+        # Live per-interface throughput, shown while Live Traffic runs
+        self.traffic_chart = LineChart("Throughput", " KB/s")
+        self.traffic_chart.hide()
+        layout.addWidget(self.traffic_chart)
+
+        self.traffic_label = QLabel()
+        self.traffic_label.setObjectName("monoLabel")
+        self.traffic_label.hide()
+        layout.addWidget(self.traffic_label)
+
         # File Operations Row 1
         file_layout1 = QHBoxLayout()
         file_label = QLabel("📁 File Operations:")
-        file_label.setStyleSheet("font-weight: bold;")
+        file_label.setObjectName("sectionLabel")
         file_layout1.addWidget(file_label)
 
         btn_create_file = QPushButton("Create File")
@@ -579,13 +1595,38 @@ class MainWindow(QWidget):
         btn_read.clicked.connect(self.read_file)
         file_layout2.addWidget(btn_read)
 
+        btn_sync = QPushButton("Sync Folders")
+        btn_sync.clicked.connect(self.sync_folders)
+        file_layout2.addWidget(btn_sync)
+
         file_layout2.addStretch()
         layout.addLayout(file_layout2)
 
+        # Archive Operations Row
+        archive_layout = QHBoxLayout()
+        archive_label = QLabel("🗜️ Archives:")
+        archive_label.setObjectName("sectionLabel")
+        archive_layout.addWidget(archive_label)
+
+        btn_compress = QPushButton("Compress")
+        btn_compress.clicked.connect(self.compress_files)
+        archive_layout.addWidget(btn_compress)
+
+        btn_extract = QPushButton("Extract")
+        btn_extract.clicked.connect(self.extract_archive)
+        archive_layout.addWidget(btn_extract)
+
+        btn_browse = QPushButton("Browse Archive")
+        btn_browse.clicked.connect(self.browse_archive)
+        archive_layout.addWidget(btn_browse)
+
+        archive_layout.addStretch()
+        layout.addLayout(archive_layout)
+
         # System Tools Row
         sys_layout = QHBoxLayout()
         sys_label = QLabel("🛠️ System:")
-        sys_label.setStyleSheet("font-weight: bold;")
+        sys_label.setObjectName("sectionLabel")
         sys_layout.addWidget(sys_label)
 
         btn_open_downloads = QPushButton("Open Downloads")
@@ -600,6 +1641,14 @@ class MainWindow(QWidget):
         btn_list_dir.clicked.connect(self.list_directory)
         sys_layout.addWidget(btn_list_dir)
 
+        btn_hud = QPushButton("Perf HUD")
+        btn_hud.clicked.connect(self.toggle_perf_hud)
+        sys_layout.addWidget(btn_hud)
+
+        btn_metrics = QPushButton("Export Metrics")
+        btn_metrics.clicked.connect(self.export_metrics)
+        sys_layout.addWidget(btn_metrics)
+
         btn_clear = QPushButton("Clear Output")
         btn_clear.clicked.connect(lambda: self.tools_output.clear())
         sys_layout.addWidget(btn_clear)
@@ -611,11 +1660,160 @@ class MainWindow(QWidget):
         widget.setLayout(layout)
         self.pages_layout.addWidget(widget)
 
+        # A job started on an earlier visit may still be running
+        self.file_job_buttons = [btn_sync, btn_compress, btn_extract]
+        self.attach_file_job()
+
+    # -----------------------------------------------------------
+    # NETWORK DIAGNOSTICS
+    # -----------------------------------------------------------
     def ping_google(self):
         """Ping Google and show results"""
         self.tools_output.append("\n🌐 Pinging 8.8.8.8 (Google DNS)...\n")
         self.tools_output.append("=" * 50 + "\n")
 
+        # TCP connect to the DNS port works without root or a ping binary
+        def work(progress, cancel):
+            stats = netdiag.LatencyStats(window=4)
+
+            async def run():
+                for seq in range(1, 5):
+                    if cancel.is_set():
+                        break
+                    result = await netdiag.tcp_probe("8.8.8.8", 53)
+                    stats.add(result.rtt_ms)
+                    progress(str(result))
+                    await asyncio.sleep(0.2)
+
+            with PERF.measure("tools.ping"):
+                asyncio.run(run())
+            return stats.summary()
+
+        def done(s):
+            if s["sent"] and s["lost"] < s["sent"]:
+                self.tools_output.append(
+                    f"\n✅ Ping successful! {s['sent']} sent, {s['lost']} lost, "
+                    f"min/avg/max = {s['min_ms']:.1f}/{s['avg_ms']:.1f}/{s['max_ms']:.1f} ms\n"
+                )
+            else:
+                self.tools_output.append("\n❌ Ping failed!\n")
+            self.tools_output.append("=" * 50 + "\n")
+
+        self.start_task(work, on_progress=self.tools_output.append, on_result=done,
+                        on_error=lambda e: self.tools_output.append(f"\n❌ Error: {e}\n"))
+
+    def ping_sweep(self):
+        """Probe many hosts or a CIDR range concurrently"""
+        spec, ok = QInputDialog.getText(
+            self, "Ping Sweep", "Hosts or CIDR ranges (comma separated):",
+            text="8.8.8.8, 1.1.1.1, google.com"
+        )
+        if not ok or not spec.strip():
+            return
+
+        port, ok = QInputDialog.getInt(
+            self, "Ping Sweep", "TCP port (0 = ICMP echo):", 443, 0, 65535
+        )
+        if not ok:
+            return
+
+        try:
+            targets = netdiag.expand_targets(spec)
+        except ValueError as e:
+            self.tools_output.append(f"\n❌ Invalid targets: {str(e)}\n")
+            self.tools_output.append("=" * 50 + "\n")
+            return
+
+        method = f"TCP port {port}" if port else "ICMP"
+        self.tools_output.append(f"\n🌐 Sweeping {len(targets)} host(s) via {method}...\n")
+        self.tools_output.append("=" * 50 + "\n")
+
+        list_all = len(targets) <= SWEEP_LIST_ALL
+        if not list_all:
+            self.tools_output.append(f"Listing responding hosts only ({len(targets)} targets)\n")
+
+        # Results go out in batches a few times a second; one append per
+        # result would be 65k appends for a /16
+        def work(progress, cancel):
+            batch = []
+            counts = {"done": 0, "up": 0}
+            flushed = counted = time.monotonic()
+
+            def on_result(result):
+                nonlocal flushed, counted
+                counts["done"] += 1
+                counts["up"] += result.ok
+                if list_all or result.ok:
+                    batch.append(str(result))
+                now = time.monotonic()
+                if not list_all and now - counted >= 5:
+                    batch.append(f"  … {counts['done']}/{len(targets)} probed, {counts['up']} up")
+                    counted = now
+                if batch and now - flushed >= 0.25:
+                    progress("\n".join(batch))
+                    batch.clear()
+                    flushed = now
+
+            with PERF.measure("tools.sweep"):
+                results = asyncio.run(netdiag.sweep(
+                    targets, port or None, concurrency=200, timeout=1.5,
+                    on_result=on_result, cancel=cancel
+                ))
+            if batch:
+                progress("\n".join(batch))
+            return results
+
+        def done(results):
+            up = sum(1 for r in results if r.ok)
+            self.tools_output.append(f"\n✅ Sweep complete: {up} up, {len(results) - up} down\n")
+            self.tools_output.append("=" * 50 + "\n")
+
+        self.start_task(work, on_progress=self.tools_output.append, on_result=done,
+                        on_error=lambda e: self.tools_output.append(f"\n❌ Error: {e}\n"))
+
+    def toggle_latency_tracker(self):
+        """Start or stop continuous probing of one host with a live chart"""
+        if self.tracker_task:
+            self.tracker_task.cancel()
+            self.tracker_task = None
+            self.btn_tracker.setText("Latency Tracker")
+            return
+
+        target, ok = QInputDialog.getText(
+            self, "Latency Tracker", "Host[:port] or [IPv6]:port (no port = ICMP echo):", text="8.8.8.8:53"
+        )
+        target = target.strip()
+        if not ok or not target:
+            return
+
+        try:
+            host, port = netdiag.parse_target(target)
+        except ValueError as e:
+            self.tools_output.append(f"\n❌ {str(e)}\n")
+            return
+
+        stats = netdiag.LatencyStats(window=120)
+
+        # stats is only touched on the tracker thread; the GUI gets copies
+        def work(progress, cancel):
+            asyncio.run(netdiag.track(host, port, stats, interval=1.0,
+                                      on_sample=lambda result: progress((list(stats.samples), stats.summary())),
+                                      cancel=cancel))
+
+        def on_sample(snapshot):
+            samples, s = snapshot
+            self.latency_chart.title = f"{target}  loss {s['loss_pct']:.0f}%  jitter {s['jitter_ms']:.1f} ms"
+            self.latency_chart.set_series([("rtt", samples, "#00ff00")])
+
+        self.latency_chart.show()
+        self.btn_tracker.setText("Stop Tracker")
+        self.tools_output.append(f"\n📈 Tracking latency to {target}...\n")
+        self.tracker_task = self.start_task(
+            work, on_progress=on_sample,
+            on_error=lambda e: self.tools_output.append(f"\n❌ Tracker error: {e}\n"),
+            long_running=True
+        )
+
     # -----------------------------------------------------------
     # FILE OPERATIONS
     # -----------------------------------------------------------
@@ -625,14 +1823,14 @@ class MainWindow(QWidget):
         if not ok or not filename:
             return
         
-        location = QFileDialog.getExistingDirectory(self, "Select Location to Save File")
+        location = self.get_directory("Select Location to Save File")
         if not location:
             return
         
         filepath = os.path.join(location, filename)
         
         try:
-            with open(filepath, 'w') as f:
+            with PERF.measure("files.create"), open(filepath, 'w') as f:
                 f.write("# New file created by Ultimate GUI\n")
             
             self.tools_output.append(f"\n✅ File created successfully!\n")
@@ -649,14 +1847,15 @@ class MainWindow(QWidget):
         if not ok or not foldername:
             return
         
-        location = QFileDialog.getExistingDirectory(self, "Select Location to Create Folder")
+        location = self.get_directory("Select Location to Create Folder")
         if not location:
             return
         
         folderpath = os.path.join(location, foldername)
         
         try:
-            os.makedirs(folderpath, exist_ok=True)
+            with PERF.measure("files.mkdir"):
+                os.makedirs(folderpath, exist_ok=True)
             
             self.tools_output.append(f"\n✅ Folder created successfully!\n")
             self.tools_output.append(f"📁 {folderpath}\n")
@@ -668,11 +1867,11 @@ class MainWindow(QWidget):
 
     def delete_file(self):
         """Delete a file or folder"""
-        filepath, _ = QFileDialog.getOpenFileName(self, "Select File to Delete", "", "All Files (*.*)")
+        filepath = self.get_open_file("Select File to Delete", "All Files (*.*)")
         
         if not filepath:
             # If no file selected, try folder
-            filepath = QFileDialog.getExistingDirectory(self, "Select Folder to Delete")
+            filepath = self.get_directory("Select Folder to Delete")
         
         if not filepath:
             return
@@ -687,10 +1886,12 @@ class MainWindow(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 if os.path.isfile(filepath):
-                    os.remove(filepath)
+                    with PERF.measure("files.delete"):
+                        os.remove(filepath)
                     self.tools_output.append(f"\n✅ File deleted successfully!\n")
                 elif os.path.isdir(filepath):
-                    shutil.rmtree(filepath)
+                    with PERF.measure("files.delete"):
+                        shutil.rmtree(filepath)
                     self.tools_output.append(f"\n✅ Folder deleted successfully!\n")
                 
                 self.tools_output.append(f"🗑️ {filepath}\n")
@@ -702,10 +1903,10 @@ class MainWindow(QWidget):
 
     def rename_file(self):
         """Rename a file or folder"""
-        filepath, _ = QFileDialog.getOpenFileName(self, "Select File to Rename", "", "All Files (*.*)")
+        filepath = self.get_open_file("Select File to Rename", "All Files (*.*)")
         
         if not filepath:
-            filepath = QFileDialog.getExistingDirectory(self, "Select Folder to Rename")
+            filepath = self.get_directory("Select Folder to Rename")
         
         if not filepath:
             return
@@ -719,7 +1920,8 @@ class MainWindow(QWidget):
         try:
             directory = os.path.dirname(filepath)
             new_path = os.path.join(directory, new_name)
-            os.rename(filepath, new_path)
+            with PERF.measure("files.rename"):
+                os.rename(filepath, new_path)
             
             self.tools_output.append(f"\n✅ Renamed successfully!\n")
             self.tools_output.append(f"Old: {old_name}\n")
@@ -732,11 +1934,11 @@ class MainWindow(QWidget):
 
     def copy_file(self):
         """Copy a file"""
-        source, _ = QFileDialog.getOpenFileName(self, "Select File to Copy", "", "All Files (*.*)")
+        source = self.get_open_file("Select File to Copy", "All Files (*.*)")
         if not source:
             return
         
-        destination = QFileDialog.getExistingDirectory(self, "Select Destination Folder")
+        destination = self.get_directory("Select Destination Folder")
         if not destination:
             return
         
@@ -752,7 +1954,8 @@ class MainWindow(QWidget):
                     dest_path = os.path.join(destination, f"{base}_copy{counter}{ext}")
                     counter += 1
             
-            shutil.copy2(source, dest_path)
+            with PERF.measure("files.copy"):
+                shutil.copy2(source, dest_path)
             
             self.tools_output.append(f"\n✅ File copied successfully!\n")
             self.tools_output.append(f"From: {source}\n")
@@ -765,11 +1968,11 @@ class MainWindow(QWidget):
 
     def move_file(self):
         """Move a file"""
-        source, _ = QFileDialog.getOpenFileName(self, "Select File to Move", "", "All Files (*.*)")
+        source = self.get_open_file("Select File to Move", "All Files (*.*)")
         if not source:
             return
         
-        destination = QFileDialog.getExistingDirectory(self, "Select Destination Folder")
+        destination = self.get_directory("Select Destination Folder")
         if not destination:
             return
         
@@ -777,7 +1980,8 @@ class MainWindow(QWidget):
             filename = os.path.basename(source)
             dest_path = os.path.join(destination, filename)
             
-            shutil.move(source, dest_path)
+            with PERF.measure("files.move"):
+                shutil.move(source, dest_path)
             
             self.tools_output.append(f"\n✅ File moved successfully!\n")
             self.tools_output.append(f"From: {source}\n")
@@ -790,41 +1994,336 @@ class MainWindow(QWidget):
 
     def read_file(self):
         """Read and display a text file"""
-        filepath, _ = QFileDialog.getOpenFileName(
-            self, "Select Text File", "", 
-            "Text Files (*.txt *.log *.md);;All Files (*.*)"
-        )
+        filepath = self.get_open_file("Select Text File", "Text Files (*.txt *.log *.md);;All Files (*.*)")
         if not filepath:
             return
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with PERF.measure("files.read"):
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    content = f.read()
             
-            self.tools_output.append(f"\n📄 Reading file: {os.path.basename(filepath)}\n")
-            self.tools_output.append("=" * 50 + "\n")
-            self.tools_output.append(content)
-            self.tools_output.append("\n" + "=" * 50 + "\n")
+            with PERF.measure("files.read.render"):
+                self.tools_output.append(f"\n📄 Reading file: {os.path.basename(filepath)}\n")
+                self.tools_output.append("=" * 50 + "\n")
+                self.tools_output.append(content)
+                self.tools_output.append("\n" + "=" * 50 + "\n")
             
         except Exception as e:
             self.tools_output.append(f"\n❌ Error reading file: {str(e)}\n")
             self.tools_output.append("=" * 50 + "\n")
 
+    # -----------------------------------------------------------
+    # ARCHIVES
+    # -----------------------------------------------------------
+    def tools_log(self, text):
+        """Append to the Tools output, or to its saved copy while another page is shown"""
+        if self.page_is("Tools"):
+            self.tools_output.append(text)
+            return
+        previous = self.session.get("tools_output")
+        text = previous + "\n" + text if previous else text
+        self.session.set("tools_output", text[-TOOLS_TAIL_CHARS:])
+
+    def start_file_job(self, title, work, on_result, on_error):
+        """Run `work` as the Tools file job, which owns the progress row and Cancel
+
+        One file job at a time: the archive and sync buttons stay disabled
+        until it ends, and the slot is free again before the handlers run.
+        The job keeps running if the user leaves Tools; show_tools()
+        re-attaches the progress row to it.
+        """
+        job = {"title": title, "state": None}
+
+        def on_progress(state):
+            job["state"] = state
+            if self.file_job is job:
+                self.attach_file_job()
+
+        def finish(handler):
+            def finished(value):
+                if self.file_job is job:
+                    self.file_job = None
+                    self.attach_file_job()
+                handler(value)
+            return finished
+
+        job["task"] = self.start_task(work, on_progress=on_progress, on_result=finish(on_result),
+                                      on_error=finish(on_error), page="Tools")
+        self.file_job = job
+        self.attach_file_job()
+
+    def run_file_job(self, title, work, on_done):
+        """Run a long file job with the Tools progress bar and a Cancel button"""
+        def on_result(state):
+            on_done(state)
+            self.tools_log("=" * 50 + "\n")
+
+        def on_error(error):
+            # archives.CancelledError carries no message
+            self.tools_log(f"\n❌ {title} failed: {error or 'cancelled'}\n")
+            self.tools_log("=" * 50 + "\n")
+
+        self.start_file_job(title, work, on_result, on_error)
+
+    def file_job_running(self):
+        """True, after telling the user, while a file job holds the progress row"""
+        if not self.file_job:
+            return False
+        QMessageBox.information(self, "Busy", f"{self.file_job['title']} is still running. "
+                                              "Wait for it to finish or cancel it first.")
+        return True
+
+    def attach_file_job(self):
+        """Point the Tools progress row at the running file job, or hide it"""
+        if not self.page_is("Tools"):
+            return
+        job = self.file_job
+        for button in self.file_job_buttons:
+            button.setEnabled(not job)
+        if not job:
+            self.tools_progress.hide()
+            self.tools_cancel_btn.hide()
+            self.tools_status.setText("")
+            return
+        state = job["state"]
+        if isinstance(state, str):
+            # Steps without a byte count (the sync plan) report text
+            self.tools_progress.hide()
+            self.tools_cancel_btn.show()
+            self.tools_status.setText(state)
+            return
+        if state and state["total"]:
+            self.tools_progress.setValue(int(1000 * min(state["done"] / state["total"], 1.0)))
+        elif not state:
+            self.tools_progress.setValue(0)
+        self.tools_progress.show()
+        self.tools_cancel_btn.show()
+        if state:
+            self.tools_status.setText(
+                f"{self.format_size(state['done'])} @ {self.format_size(state['rate'])}/s  {state['file'][-40:]}"
+            )
+        else:
+            self.tools_status.setText(f"{job['title']}...")
+
+    def cancel_file_job(self):
+        if self.file_job:
+            self.file_job["task"].cancel()
+
+    def compress_files(self):
+        """Create a zip / tar.gz / tar.xz / tar.zst archive"""
+        if self.file_job_running():
+            return
+        sources = self.get_open_files("Select Files to Compress", "All Files (*.*)")
+        if not sources:
+            # If no files selected, try a folder
+            folder = self.get_directory("Select Folder to Compress")
+            sources = [folder] if folder else []
+        if not sources:
+            return
+
+        formats = [".zip", ".tar.gz", ".tar.xz", ".tar.zst"]
+        fmt, ok = QInputDialog.getItem(self, "Compress", "Archive format:", formats, 0, False)
+        if not ok:
+            return
+
+        threads = 1
+        if fmt != ".zip":
+            threads, ok = QInputDialog.getInt(
+                self, "Compress", "Compression threads:", os.cpu_count() or 1, 1, 64
+            )
+            if not ok:
+                return
+
+        base = os.path.splitext(os.path.basename(sources[0].rstrip(os.sep)))[0]
+        default = os.path.join(os.path.dirname(sources[0].rstrip(os.sep)), base + fmt)
+        archive_path = self.get_save_file("Save Archive As", default, f"Archive (*{fmt})", kind="archives")
+        if not archive_path:
+            return
+        if not archive_path.lower().endswith(fmt):
+            archive_path += fmt
+
+        self.tools_log(f"\n🗜️ Compressing {len(sources)} item(s) to {os.path.basename(archive_path)}...\n")
+
+        def work(progress, cancel):
+            with PERF.measure("files.compress"):
+                return archives.create_archive(archive_path, sources, threads=threads,
+                                               progress=progress, cancel=cancel)
+
+        def done(state):
+            size = os.path.getsize(archive_path)
+            ratio = size / state["done"] if state["done"] else 0
+            self.tools_log(f"\n✅ Archive created! ({state['elapsed']:.1f}s, "
+                           f"{self.format_size(state['rate'])}/s)\n")
+            self.tools_log(f"📦 {archive_path}\n")
+            self.tools_log(f"{self.format_size(state['done'])} → {self.format_size(size)} ({ratio:.0%})\n")
+
+        self.run_file_job("Compress", work, done)
+
+    def extract_archive(self):
+        """Extract an archive into a chosen folder"""
+        if self.file_job_running():
+            return
+        archive_path = self.get_open_file(
+            "Select Archive to Extract",
+            "Archives (*.zip *.tar *.tar.gz *.tgz *.tar.xz *.tar.zst);;All Files (*.*)", kind="archives"
+        )
+        if not archive_path:
+            return
+
+        destination = self.get_directory("Select Destination Folder")
+        if not destination:
+            return
+
+        self.tools_log(f"\n📂 Extracting {os.path.basename(archive_path)}...\n")
+
+        def work(progress, cancel):
+            with PERF.measure("files.extract"):
+                return archives.extract_archive(archive_path, destination, progress=progress, cancel=cancel)
+
+        def done(state):
+            self.tools_log(f"\n✅ Extracted! ({state['elapsed']:.1f}s, "
+                           f"{self.format_size(state['rate'])}/s)\n")
+            self.tools_log(f"To: {destination}\n")
+
+        self.run_file_job("Extract", work, done)
+
+    def browse_archive(self):
+        """List archive contents without extracting"""
+        archive_path = self.get_open_file(
+            "Select Archive",
+            "Archives (*.zip *.tar *.tar.gz *.tgz *.tar.xz *.tar.zst);;All Files (*.*)", kind="archives"
+        )
+        if not archive_path:
+            return
+
+        limit = 2000
+        self.tools_log(f"\n📦 Contents of: {os.path.basename(archive_path)}\n")
+        self.tools_log("=" * 50 + "\n")
+
+        # Entries stream in batches so the first ones show up immediately
+        def work(progress, cancel):
+            batch = []
+            count = 0
+            with PERF.measure("files.list_archive"):
+                for name, size, is_dir in archives.list_archive(archive_path):
+                    if cancel.is_set() or count >= limit:
+                        return count, True
+                    count += 1
+                    icon = "📁" if is_dir else "📄"
+                    batch.append(f"  └─ {icon} {name}" + ("" if is_dir else f" ({self.format_size(size)})"))
+                    if len(batch) >= 200:
+                        progress("\n".join(batch))
+                        batch = []
+            if batch:
+                progress("\n".join(batch))
+            return count, False
+
+        def done(result):
+            count, truncated = result
+            more = f" (showing first {limit})" if truncated else ""
+            self.tools_log(f"\n{count} entries{more}\n")
+            self.tools_log("=" * 50 + "\n")
+
+        self.start_task(work, on_progress=self.tools_log, on_result=done,
+                        on_error=lambda e: self.tools_log(f"\n❌ Error reading archive: {e}\n"), page="Tools")
+
+    # -----------------------------------------------------------
+    # FOLDER SYNC
+    # -----------------------------------------------------------
+    def sync_folders(self):
+        """One-way sync: preview the diff, then copy only what changed"""
+        if self.file_job_running():
+            return
+        source = self.get_directory("Select Source Folder")
+        if not source:
+            return
+
+        dest = self.get_directory("Select Destination Folder")
+        if not dest:
+            return
+
+        src_real, dst_real = os.path.realpath(source), os.path.realpath(dest)
+        if src_real == dst_real or dst_real.startswith(src_real + os.sep):
+            QMessageBox.warning(self, "Error", "Destination must not be the source or inside it!")
+            return
+
+        modes = [
+            "Update (copy new and changed files)",
+            # Always rescans the destination: the manifest only knows synced files
+            "Mirror (also delete files missing from source)",
+        ]
+        mode, ok = QInputDialog.getItem(self, "Sync Folders", "Sync mode:", modes, 0, False)
+        if not ok:
+            return
+        mirror = mode == modes[1]
+
+        self.tools_log("\n🔄 Comparing folders...\n")
+        self.tools_log(f"From: {source}\n")
+        self.tools_log(f"To: {dest}\n")
+
+        def plan_work(progress, cancel):
+            with PERF.measure("files.sync_plan"):
+                return foldersync.plan_sync(source, dest, mirror=mirror,
+                                            progress=progress, cancel=cancel)
+
+        def on_plan(plan):
+            self.tools_log("\n".join(foldersync.describe_plan(plan)) + "\n")
+
+            changes = len(plan["copy"]) + len(plan["touch"]) + len(plan["delete"])
+            if not changes:
+                self.tools_log("\n✅ Already in sync!\n")
+                self.tools_log("=" * 50 + "\n")
+                return
+
+            reply = QMessageBox.question(
+                self, "Confirm Sync",
+                f"Copy {len(plan['copy'])} file(s) ({self.format_size(plan['bytes'])}), "
+                f"update {len(plan['touch'])} timestamp(s) and delete {len(plan['delete'])} file(s)?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                self.tools_log("\nSync cancelled.\n")
+                self.tools_log("=" * 50 + "\n")
+                return
+
+            def apply_work(progress, cancel):
+                with PERF.measure("files.sync_apply"):
+                    return foldersync.apply_plan(plan, progress=progress, cancel=cancel)
+
+            def done(summary):
+                status = "⚠️ Sync cancelled" if summary["cancelled"] else "✅ Sync complete!"
+                self.tools_log(
+                    f"\n{status} {summary['copied']} copied, {summary['deleted']} deleted "
+                    f"({summary['elapsed']:.1f}s, {self.format_size(summary['rate'])}/s)\n"
+                )
+                for error in summary["errors"][:20]:
+                    self.tools_log(f"  ❌ {error}\n")
+
+            self.run_file_job("Sync", apply_work, done)
+
+        def on_error(error):
+            self.tools_log(f"\n❌ Error comparing folders: {error or 'cancelled'}\n")
+            self.tools_log("=" * 50 + "\n")
+
+        self.start_file_job("Sync", plan_work, on_plan, on_error)
+
     def list_directory(self):
         """List contents of a directory"""
-        directory = QFileDialog.getExistingDirectory(self, "Select Directory to List")
+        directory = self.get_directory("Select Directory to List")
         if not directory:
             return
         
         try:
             self.tools_output.append(f"\n📁 Contents of: {directory}\n")
             self.tools_output.append("=" * 50 + "\n")
-            
-            items = os.listdir(directory)
-            
-            folders = [item for item in items if os.path.isdir(os.path.join(directory, item))]
-            files = [item for item in items if os.path.isfile(os.path.join(directory, item))]
-            
+
+            with PERF.measure("files.list"):
+                items = os.listdir(directory)
+
+                folders = [item for item in items if os.path.isdir(os.path.join(directory, item))]
+                files = [item for item in items if os.path.isfile(os.path.join(directory, item))]
+
             self.tools_output.append(f"\n📁 Folders ({len(folders)}):\n")
             for folder in sorted(folders):
                 self.tools_output.append(f"  └─ 📁 {folder}\n")
@@ -848,30 +2347,6 @@ class MainWindow(QWidget):
                 return f"{size:.1f} {unit}"
             size /= 1024.0
         return f"{size:.1f} TB"
-        
-        try:
-            # Run ping command
-            result = subprocess.run(
-                ["ping", "8.8.8.8", "-n", "4"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            # Show output
-            self.tools_output.append(result.stdout)
-            
-            if result.returncode == 0:
-                self.tools_output.append("\n✅ Ping successful!\n")
-            else:
-                self.tools_output.append("\n❌ Ping failed!\n")
-                
-        except subprocess.TimeoutExpired:
-            self.tools_output.append("\n⏱️ Ping timed out!\n")
-        except Exception as e:
-            self.tools_output.append(f"\n❌ Error: {str(e)}\n")
-        
-        self.tools_output.append("=" * 50 + "\n")
 
     def show_ipconfig(self):
         """Show IP configuration"""
@@ -879,36 +2354,385 @@ class MainWindow(QWidget):
         self.tools_output.append("=" * 50 + "\n")
         
         try:
-            result = subprocess.run(
-                ["ipconfig"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            # Read straight from /proc, /sys and socket ioctls; no ipconfig process
+            with PERF.measure("tools.ipconfig"):
+                lines = netinfo.report()
             
-            self.tools_output.append(result.stdout)
+            self.tools_output.append("\n".join(lines) + "\n")
             
         except Exception as e:
             self.tools_output.append(f"\n❌ Error: {str(e)}\n")
         
         self.tools_output.append("=" * 50 + "\n")
 
+    def toggle_live_traffic(self):
+        """Sample interface byte counters every second and show rx/tx rates"""
+        if self.traffic_timer:
+            self.traffic_timer.stop()
+            self.traffic_timer.deleteLater()
+            self.traffic_timer = None
+            self.btn_traffic.setText("Live Traffic")
+            return
+
+        if not netinfo.available():
+            self.tools_output.append("\n❌ Live traffic needs /proc/net/dev (Linux only)\n")
+            self.tools_output.append("=" * 50 + "\n")
+            return
+
+        self.traffic_sampler = netinfo.RateSampler()
+        self.traffic_sampler.sample()
+        self.traffic_history = {"rx": [], "tx": []}
+
+        self.traffic_timer = QTimer()
+        self.traffic_timer.timeout.connect(self.update_live_traffic)
+        self.traffic_timer.start(1000)
+
+        self.btn_traffic.setText("Stop Traffic")
+        self.traffic_label.setText("Sampling...")
+        self.traffic_label.show()
+        self.traffic_chart.show()
+
+    def update_live_traffic(self):
+        with PERF.measure("tools.traffic_sample"):
+            rates = self.traffic_sampler.sample()
+
+        lines = []
+        total_rx = total_tx = 0.0
+        for name, (rx, tx) in sorted(rates.items()):
+            if name != "lo":
+                total_rx += rx
+                total_tx += tx
+            lines.append(f"{name:<12} ⬇ {netinfo.format_rate(rx):>12}   ⬆ {netinfo.format_rate(tx):>12}")
+        self.traffic_label.setText("\n".join(lines))
+
+        for key, value in (("rx", total_rx), ("tx", total_tx)):
+            history = self.traffic_history[key]
+            history.append(value / 1024)
+            del history[:-60]
+        self.traffic_chart.set_series([
+            ("rx", self.traffic_history["rx"], "#00bfff"),
+            ("tx", self.traffic_history["tx"], "#ffa500"),
+        ])
+
+    # -----------------------------------------------------------
+    # SYSTEM MONITOR
+    # -----------------------------------------------------------
+    def show_monitor(self):
+        layout = QVBoxLayout()
+
+        label = QLabel("System Monitor")
+        label.setObjectName("pageTitle")
+        layout.addWidget(label)
+
+        widget = QWidget()
+        widget.setLayout(layout)
+        self.pages_layout.addWidget(widget)
+
+        if not sysmon.available():
+            info = QLabel("❌ /proc is not available on this system")
+            info.setObjectName("infoLabel")
+            layout.addWidget(info)
+            return
+
+        # Refresh rate row
+        rate_layout = QHBoxLayout()
+        rate_layout.addWidget(QLabel("Refresh every:"))
+        self.monitor_rate = QComboBox()
+        self.monitor_rate.addItems([f"{rate:g} s" for rate in MONITOR_RATES])
+        self.monitor_rate.setCurrentIndex(MONITOR_RATES.index(self.monitor_interval))
+        self.monitor_rate.currentIndexChanged.connect(lambda i: self.set_monitor_interval(MONITOR_RATES[i]))
+        rate_layout.addWidget(self.monitor_rate)
+        self.monitor_overhead = QLabel()
+        rate_layout.addWidget(self.monitor_overhead)
+        rate_layout.addStretch()
+        layout.addLayout(rate_layout)
+
+        self.cpu_chart = LineChart("CPU", "%")
+        layout.addWidget(self.cpu_chart)
+        self.memory_chart = LineChart("Memory", "%")
+        layout.addWidget(self.memory_chart)
+        self.disk_chart = LineChart("Disk I/O", " KB/s")
+        layout.addWidget(self.disk_chart)
+
+        stats_layout = QHBoxLayout()
+        self.cores_label = QLabel()
+        self.cores_label.setObjectName("monoLabel")
+        self.cores_label.setAlignment(Qt.AlignmentFlag.AlignTop)
+        stats_layout.addWidget(self.cores_label)
+        self.top_label = QLabel()
+        self.top_label.setObjectName("monoLabel")
+        self.top_label.setAlignment(Qt.AlignmentFlag.AlignTop)
+        stats_layout.addWidget(self.top_label)
+        layout.addLayout(stats_layout)
+
+        self.redraw_monitor()
+
+        # Sample on a worker thread; the sampler must live on that thread
+        # because it measures its own CPU time with time.thread_time()
+        def work(progress, cancel):
+            sampler = sysmon.SystemSampler()
+            while not cancel.wait(self.monitor_interval):
+                progress(sampler.sample())
+
+        self.start_task(work, on_progress=self.update_monitor,
+                        on_error=lambda e: self.top_label.setText(f"❌ Monitor error: {e}"), long_running=True)
+
+    def update_monitor(self, sample):
+        """Apply one sample from the monitor thread"""
+        with PERF.measure("monitor.update"):
+            self.monitor_history.add(sample)
+            self.redraw_monitor()
+
+            cores = [f"{'core':<6}{'usage':>7}"]
+            for i, usage in enumerate(sample["cpu_cores"]):
+                bar = "█" * int(usage / 10) + "░" * (10 - int(usage / 10))
+                cores.append(f"cpu{i:<3}{usage:6.1f}% {bar}")
+            memory = sample["memory"]
+            cores.append("")
+            cores.append(f"RAM  {self.format_size(memory['used'])} / {self.format_size(memory['total'])}")
+            if memory["swap_total"]:
+                cores.append(f"Swap {self.format_size(memory['swap_used'])} / {self.format_size(memory['swap_total'])}")
+            self.cores_label.setText("\n".join(cores))
+
+            top = [f"{'PID':>7}  {'CPU%':>6}  {'RSS':>10}  NAME"]
+            for proc in sample["top"]:
+                top.append(f"{proc['pid']:>7}  {proc['cpu']:6.1f}  {self.format_size(proc['rss']):>10}  {proc['name']}")
+            self.top_label.setText("\n".join(top))
+
+            self.monitor_overhead.setText(f"monitor overhead: {sample['overhead']:.2f}% CPU")
+
+    def redraw_monitor(self):
+        history = self.monitor_history
+        self.cpu_chart.set_series([("total", history.cpu.values(), "#00ff00")])
+        self.memory_chart.set_series([("used", history.memory.values(), "#00bfff")])
+        self.disk_chart.set_series([
+            ("read", history.disk_read.values(), "#ffa500"),
+            ("write", history.disk_write.values(), "#ff4081"),
+        ])
+
+    # -----------------------------------------------------------
+    # PROCESSES
+    # -----------------------------------------------------------
+    def show_processes(self):
+        layout = QVBoxLayout()
+
+        label = QLabel("Processes")
+        label.setObjectName("pageTitle")
+        layout.addWidget(label)
+
+        widget = QWidget()
+        widget.setLayout(layout)
+        self.pages_layout.addWidget(widget)
+
+        if not sysmon.available():
+            info = QLabel("❌ /proc is not available on this system")
+            info.setObjectName("infoLabel")
+            layout.addWidget(info)
+            return
+
+        # Filter / refresh row
+        controls = QHBoxLayout()
+        self.process_filter = QLineEdit()
+        self.process_filter.setPlaceholderText("Filter by name or PID...")
+        controls.addWidget(self.process_filter)
+
+        controls.addWidget(QLabel("Refresh every:"))
+        rate = QComboBox()
+        rate.addItems([f"{rate:g} s" for rate in MONITOR_RATES])
+        rate.setCurrentIndex(MONITOR_RATES.index(self.monitor_interval))
+        rate.currentIndexChanged.connect(lambda i: self.set_monitor_interval(MONITOR_RATES[i]))
+        controls.addWidget(rate)
+        layout.addLayout(controls)
+
+        self.process_model = ProcessTableModel(self.format_size)
+        self.process_proxy = ProcessFilterProxy()
+        self.process_proxy.setSourceModel(self.process_model)
+        self.process_proxy.setFilterRole(ProcessTableModel.FILTER_ROLE)
+        self.process_proxy.setFilterKeyColumn(0)
+        self.process_proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.process_proxy.setDynamicSortFilter(True)
+        self.process_filter.textChanged.connect(self.process_proxy.setFilterFixedString)
+
+        self.process_table = QTableView()
+        self.process_table.setModel(self.process_proxy)
+        self.process_table.setSortingEnabled(True)
+        self.process_table.sortByColumn(3, Qt.SortOrder.DescendingOrder)
+        self.process_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.process_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.process_table.verticalHeader().hide()
+        self.process_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.process_table)
+
+        # Signal row
+        actions = QHBoxLayout()
+        self.signal_combo = QComboBox()
+        self.signal_combo.addItems(PROCESS_SIGNALS)
+        actions.addWidget(self.signal_combo)
+        btn_signal = QPushButton("Send Signal")
+        btn_signal.clicked.connect(self.send_process_signal)
+        actions.addWidget(btn_signal)
+        self.process_status = QLabel()
+        actions.addWidget(self.process_status)
+        actions.addStretch()
+        layout.addLayout(actions)
+
+        # /proc is read on a worker thread; only the diff reaches the GUI
+        def work(progress, cancel):
+            sampler = sysmon.ProcessSampler()
+            while True:
+                with PERF.measure("processes.sample"):
+                    diff = sampler.sample()
+                progress(diff)
+                if cancel.wait(self.monitor_interval):
+                    return
+
+        self.start_task(work, on_progress=self.update_processes,
+                        on_error=lambda e: self.process_status.setText(f"❌ Process list error: {e}"),
+                        long_running=True)
+
+    def update_processes(self, diff):
+        """Apply one sampler diff to the process table"""
+        added, changed, removed = diff
+        start = time.perf_counter()
+        with PERF.measure("processes.apply"):
+            self.process_model.apply_diff(added, changed, removed)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.process_status.setText(
+            f"{len(self.process_model.pids)} processes  "
+            f"(+{len(added)} / ~{len(changed)} / -{len(removed)}, {elapsed_ms:.1f} ms)"
+        )
+
+    def send_process_signal(self):
+        """Send the chosen signal to the selected processes"""
+        selected = self.process_table.selectionModel().selectedRows()
+        if not selected:
+            QMessageBox.warning(self, "Error", "Select a process first!")
+            return
+
+        pids = [self.process_model.pids[self.process_proxy.mapToSource(index).row()] for index in selected]
+        name = self.signal_combo.currentText()
+        targets = ", ".join(f"{self.process_model.rows[pid][0]} ({pid})" for pid in pids[:5])
+        if len(pids) > 5:
+            targets += f" and {len(pids) - 5} more"
+
+        reply = QMessageBox.question(
+            self, "Confirm Signal", f"Send {name} to {targets}?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+
+        failed = []
+        for pid in pids:
+            try:
+                os.kill(pid, getattr(signal, name))
+            except ProcessLookupError:
+                failed.append(f"{pid}: already exited")
+            except PermissionError:
+                failed.append(f"{pid}: permission denied")
+            except Exception as e:
+                failed.append(f"{pid}: {e}")
+
+        if failed:
+            QMessageBox.warning(self, "Error", f"{name} failed for:\n" + "\n".join(failed))
+        self.process_status.setText(f"✅ {name} sent to {len(pids) - len(failed)} process(es)")
+
     # -----------------------------------------------------------
     # SETTINGS
     # -----------------------------------------------------------
     def show_settings(self):
         layout = QVBoxLayout()
-        label = QLabel("Settings Panel (Coming Soon)")
-        label.setStyleSheet("font-size: 22px;")
+        label = QLabel("Settings")
+        label.setObjectName("pageTitle")
         layout.addWidget(label)
-        
+
+        form = QFormLayout()
+
+        motion = QComboBox()
+        detected = "on" if theme.reduced_motion_default() else "off"
+        motion.addItems([f"Auto ({detected} here)", "On", "Off"])
+        preference = self.session.get("reduced_motion")
+        motion.setCurrentIndex(0 if preference is None else 1 if preference else 2)
+        motion.currentIndexChanged.connect(self.set_reduced_motion)
+        form.addRow("Reduced motion (no animations or translucency):", motion)
+
+        hud = QCheckBox("Show performance HUD (F3)")
+        hud.setChecked(not self.hud_label.isHidden())
+        hud.toggled.connect(self.set_hud)
+        form.addRow(hud)
+
+        rate = QComboBox()
+        rate.addItems([f"{rate:g} s" for rate in MONITOR_RATES])
+        rate.setCurrentIndex(MONITOR_RATES.index(self.monitor_interval))
+        rate.currentIndexChanged.connect(lambda i: self.set_monitor_interval(MONITOR_RATES[i]))
+        form.addRow("Monitor / process refresh:", rate)
+
+        restore = QCheckBox("Reopen the last page on startup")
+        restore.setChecked(self.session.get("restore", True))
+        restore.toggled.connect(lambda checked: self.session.set("restore", checked))
+        form.addRow(restore)
+        layout.addLayout(form)
+
+        session_layout = QHBoxLayout()
+        btn_clear = QPushButton("Clear Session")
+        btn_clear.clicked.connect(self.clear_session)
+        session_layout.addWidget(btn_clear)
+        self.session_label = QLabel(f"Saved to: {self.session.path}")
+        session_layout.addWidget(self.session_label)
+        session_layout.addStretch()
+        layout.addLayout(session_layout)
+        layout.addStretch()
+
         widget = QWidget()
         widget.setLayout(layout)
         self.pages_layout.addWidget(widget)
 
+    def set_reduced_motion(self, index):
+        preference = (None, True, False)[index]
+        self.session.set("reduced_motion", preference)
+        self.apply_theme(theme.reduced_motion_default(preference))
+
+    def set_hud(self, checked):
+        if checked == self.hud_label.isHidden():
+            self.toggle_perf_hud()
+
+    def set_monitor_interval(self, rate):
+        self.monitor_interval = rate
+        self.session.set("monitor_interval", rate)
+
+    def clear_session(self):
+        """Forget pages, positions, playlist, output and folders; keep settings"""
+        reply = QMessageBox.question(
+            self, "Clear Session",
+            "Forget the last page, gallery and playback positions, playlist, Tools output and folders?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        self.session.clear()
+        self.playlist = []
+        self.playlist_index = 0
+        self.preview_cache.clear()
+        self.session_label.setText("✅ Session cleared")
+
     def closeEvent(self, event):
         """Clean up when closing app"""
+        if self.jobs:
+            pages = ", ".join(sorted({task.page for task in self.jobs}))
+            reply = QMessageBox.question(
+                self, "Jobs Running",
+                f"{len(self.jobs)} job(s) still running ({pages}).\n"
+                "Quit anyway? They will be cancelled and partial archives removed.",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                event.ignore()
+                return
+        self.save_page_state()
+        self.cancel_tasks(jobs=True)
         self.cleanup_resources()
+        self.lag_monitor.stop()
+        self.session.close()
         cv2.destroyAllWindows()
         event.accept()
 
@@ -0,0 +1,422 @@
+import io
+import os
+import lzma
+import stat
+import time
+import zlib
+import tarfile
+import zipfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import zstandard
+except ImportError:  # optional: only needed for .tar.zst
+    zstandard = None
+
+
+CHUNK_SIZE = 1 << 20
+BLOCK_SIZE = 4 << 20
+
+FORMATS = {
+    ".zip": "zip",
+    ".tar.gz": "gz",
+    ".tgz": "gz",
+    ".tar.xz": "xz",
+    ".tar.zst": "zst",
+    ".tar": "tar",
+}
+
+
+class CancelledError(Exception):
+    pass
+
+
+def detect_format(path):
+    name = path.lower()
+    for ext, kind in FORMATS.items():
+        if name.endswith(ext):
+            return kind
+    raise ValueError(f"Unsupported archive type: {os.path.basename(path)}")
+
+
+def _require_zstd():
+    if zstandard is None:
+        raise RuntimeError("tar.zst needs the 'zstandard' package (pip install zstandard)")
+
+
+# -----------------------------------------------------------
+# PROGRESS
+# -----------------------------------------------------------
+class Progress:
+    """Byte counter shared by readers/writers; reports at most every 100 ms
+
+    Safe to share between threads (e.g. parallel transfers).
+    """
+
+    def __init__(self, total, callback=None, cancel=None):
+        self.total = total
+        self.done = 0
+        self.callback = callback
+        self.cancel = cancel
+        self.started = time.monotonic()
+        self.last_report = 0.0
+        self.current = ""
+        self.lock = threading.Lock()
+
+    def add(self, n):
+        if self.cancel is not None and self.cancel.is_set():
+            raise CancelledError()
+        now = time.monotonic()
+        with self.lock:
+            self.done += n
+            due = self.callback and now - self.last_report >= 0.1
+            if due:
+                self.last_report = now
+        if due:
+            self.callback(self.snapshot())
+
+    def snapshot(self):
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        return {
+            "done": self.done,
+            "total": self.total,
+            "file": self.current,
+            "elapsed": elapsed,
+            "rate": self.done / elapsed,
+        }
+
+
+class _CountingReader(io.RawIOBase):
+    """Wraps a source file so tarfile's streaming copy reports progress"""
+
+    def __init__(self, raw, progress):
+        self.raw = raw
+        self.progress = progress
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        n = self.raw.readinto(buffer)
+        if n:
+            self.progress.add(n)
+        return n
+
+
+# -----------------------------------------------------------
+# PARALLEL BLOCK COMPRESSION
+# -----------------------------------------------------------
+class ParallelBlockWriter(io.RawIOBase):
+    """Compress fixed-size blocks on a thread pool, written in order
+
+    Each block becomes an independent gzip member / xz stream. Both
+    formats allow concatenation, so any standard decoder (gzip, xz, tar,
+    Python's gzip/lzma modules) reads the result as one stream. zlib and
+    lzma release the GIL, so threads give real parallelism.
+    """
+
+    def __init__(self, raw, compress_block, workers=None, block_size=BLOCK_SIZE):
+        self.raw = raw
+        self.compress_block = compress_block
+        self.block_size = block_size
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ThreadPoolExecutor(self.workers)
+        self.pending = deque()
+        self.buffer = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.buffer += data
+        while len(self.buffer) >= self.block_size:
+            self._submit(bytes(self.buffer[:self.block_size]))
+            del self.buffer[:self.block_size]
+        return len(data)
+
+    def _submit(self, block):
+        self.pending.append(self.pool.submit(self.compress_block, block))
+        # Bound memory: keep at most 2 blocks per worker in flight
+        while len(self.pending) > self.workers * 2:
+            self.raw.write(self.pending.popleft().result())
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self.buffer:
+                self._submit(bytes(self.buffer))
+                self.buffer.clear()
+            while self.pending:
+                self.raw.write(self.pending.popleft().result())
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+            self.raw.close()
+            super().close()
+
+
+def _gzip_block(level):
+    def compress(block):
+        packer = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31 = gzip wrapper
+        return packer.compress(block) + packer.flush()
+    return compress
+
+
+def _xz_block(preset):
+    def compress(block):
+        return lzma.compress(block, format=lzma.FORMAT_XZ, preset=preset)
+    return compress
+
+
+def _open_compressed_writer(path, kind, threads, level):
+    """Binary file object that compresses everything written to it"""
+    raw = open(path, "wb")
+    if kind == "tar":
+        return raw
+    if kind == "zst":
+        _require_zstd()
+        params = zstandard.ZstdCompressionParameters.from_level(level or 3, threads=threads if threads > 1 else 0)
+        return zstandard.ZstdCompressor(compression_params=params).stream_writer(raw, closefd=True)
+    if threads > 1:
+        if kind == "gz":
+            return ParallelBlockWriter(raw, _gzip_block(level or 6), threads)
+        return ParallelBlockWriter(raw, _xz_block(level if level is not None else 6), threads)
+    if kind == "gz":
+        import gzip
+        return gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=level or 6, mtime=0)
+    return lzma.LZMAFile(raw, "wb", preset=level if level is not None else 6)
+
+
+def _open_compressed_reader(path, kind):
+    raw = open(path, "rb")
+    if kind == "tar":
+        return raw
+    if kind == "zst":
+        _require_zstd()
+        return zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+    if kind == "gz":
+        import gzip
+        return gzip.GzipFile(fileobj=raw, mode="rb")
+    return lzma.LZMAFile(raw, "rb")
+
+
+# -----------------------------------------------------------
+# CREATE
+# -----------------------------------------------------------
+def _collect(sources):
+    """(absolute path, archive name, size) for every file under sources"""
+    entries = []
+    for source in sources:
+        source = os.path.abspath(source)
+        base = os.path.dirname(source)
+        if os.path.isfile(source):
+            entries.append((source, os.path.basename(source), os.path.getsize(source)))
+            continue
+        entries.append((source, os.path.relpath(source, base), 0))
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for name in sorted(dirs):
+                path = os.path.join(root, name)
+                entries.append((path, os.path.relpath(path, base), 0))
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                try:
+                    size = os.path.getsize(path) if not os.path.islink(path) else 0
+                except OSError:
+                    continue
+                entries.append((path, os.path.relpath(path, base), size))
+    return entries
+
+
+def create_archive(archive_path, sources, threads=1, level=None, progress=None, cancel=None):
+    """Stream `sources` (files or folders) into a zip or tar.{gz,xz,zst}
+
+    Files are copied in CHUNK_SIZE pieces, so memory use does not depend
+    on file size. Returns the final progress snapshot.
+    """
+    kind = detect_format(archive_path)
+    entries = _collect(sources)
+    tracker = Progress(sum(size for _, _, size in entries), progress, cancel)
+
+    try:
+        if kind == "zip":
+            _create_zip(archive_path, entries, tracker, level)
+        else:
+            _create_tar(archive_path, kind, entries, tracker, threads, level)
+    except BaseException:
+        # Don't leave a truncated archive behind
+        try:
+            os.remove(archive_path)
+        except OSError:
+            pass
+        raise
+    return tracker.snapshot()
+
+
+def _create_zip(archive_path, entries, tracker, level):
+    compresslevel = level if level is not None else 6
+    with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED,
+                         compresslevel=compresslevel, allowZip64=True) as zf:
+        for path, name, size in entries:
+            tracker.current = name
+            if os.path.islink(path):
+                _write_zip_link(zf, path, name)
+                continue
+            if os.path.isdir(path):
+                zf.write(path, name + "/")
+                continue
+            info = zipfile.ZipInfo.from_file(path, name)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with open(path, "rb") as src, zf.open(info, "w", force_zip64=size > 0x7FFFFFFF) as dst:
+                while True:
+                    chunk = src.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    tracker.add(len(chunk))
+
+
+def _write_zip_link(zf, path, name):
+    """Store a symlink the way Info-ZIP does: S_IFLNK mode, target as the data
+
+    Following it instead would fail for links to directories and for
+    dangling links, and would copy data from outside the tree.
+    """
+    mtime = time.localtime(os.lstat(path).st_mtime)[:6]
+    info = zipfile.ZipInfo(name, date_time=max(mtime, (1980, 1, 1, 0, 0, 0)))
+    info.create_system = 3  # Unix, so readers honour the mode bits
+    info.external_attr = (stat.S_IFLNK | 0o777) << 16
+    zf.writestr(info, os.readlink(path))
+
+
+def _is_zip_link(info):
+    return info.create_system == 3 and stat.S_ISLNK(info.external_attr >> 16)
+
+
+def _create_tar(archive_path, kind, entries, tracker, threads, level):
+    fileobj = _open_compressed_writer(archive_path, kind, threads, level)
+    try:
+        with tarfile.open(fileobj=fileobj, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+            for path, name, size in entries:
+                tracker.current = name
+                info = tar.gettarinfo(path, name)
+                if info.isreg():
+                    with open(path, "rb", buffering=0) as src:
+                        tar.addfile(info, io.BufferedReader(_CountingReader(src, tracker), CHUNK_SIZE))
+                else:
+                    tar.addfile(info)
+    finally:
+        fileobj.close()
+
+
+# -----------------------------------------------------------
+# LIST
+# -----------------------------------------------------------
+def list_archive(archive_path):
+    """Yield (name, size, is_dir) lazily
+
+    Zip listings come straight from the central directory at the end of
+    the file, so no entry data is read. Tar has no index: headers are
+    streamed in order and the first entries appear immediately.
+    """
+    kind = detect_format(archive_path)
+    if kind == "zip":
+        with zipfile.ZipFile(archive_path) as zf:
+            for info in zf.infolist():
+                yield info.filename, info.file_size, info.is_dir()
+        return
+
+    fileobj = _open_compressed_reader(archive_path, kind)
+    try:
+        with tarfile.open(fileobj=fileobj, mode="r|") as tar:
+            for info in tar:
+                yield info.name, info.size, info.isdir()
+    finally:
+        fileobj.close()
+
+
+# -----------------------------------------------------------
+# EXTRACT
+# -----------------------------------------------------------
+def _safe_target(dest, name):
+    target = os.path.realpath(os.path.join(dest, name))
+    root = os.path.realpath(dest)
+    if target != root and not target.startswith(root + os.sep):
+        raise ValueError(f"Refusing to extract outside destination: {name}")
+    return target
+
+
+def _extract_zip_link(zf, info, dest):
+    """Recreate a symlink entry, refusing targets outside `dest` like tar's data filter"""
+    # Not _safe_target's resolved path: that would follow an existing link
+    path = os.path.join(dest, info.filename)
+    link = zf.read(info).decode("utf-8")
+    resolved = os.path.realpath(os.path.join(os.path.dirname(path), link))
+    root = os.path.realpath(dest)
+    if os.path.isabs(link) or (resolved != root and not resolved.startswith(root + os.sep)):
+        raise ValueError(f"Refusing symlink that points outside destination: {info.filename} -> {link}")
+    if os.path.islink(path) or os.path.isfile(path):
+        os.remove(path)
+    os.symlink(link, path)
+
+
+def extract_archive(archive_path, dest, progress=None, cancel=None):
+    """Stream every entry to `dest`, refusing paths that escape it"""
+    kind = detect_format(archive_path)
+    os.makedirs(dest, exist_ok=True)
+
+    if kind == "zip":
+        with zipfile.ZipFile(archive_path) as zf:
+            infos = zf.infolist()
+            tracker = Progress(sum(i.file_size for i in infos), progress, cancel)
+            for info in infos:
+                tracker.current = info.filename
+                target = _safe_target(dest, info.filename)
+                if info.is_dir():
+                    os.makedirs(target, exist_ok=True)
+                    continue
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                if _is_zip_link(info):
+                    _extract_zip_link(zf, info, dest)
+                    tracker.add(info.file_size)
+                    continue
+                with zf.open(info) as src, open(target, "wb") as dst:
+                    while True:
+                        chunk = src.read(CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        dst.write(chunk)
+                        tracker.add(len(chunk))
+        return tracker.snapshot()
+
+    # Tar size is only known from the headers; use the file size as total
+    tracker = Progress(os.path.getsize(archive_path), progress, cancel)
+    raw = open(archive_path, "rb", buffering=0)
+    counted = io.BufferedReader(_CountingReader(raw, tracker), CHUNK_SIZE)
+    if kind == "tar":
+        fileobj = counted
+    elif kind == "zst":
+        _require_zstd()
+        fileobj = zstandard.ZstdDecompressor().stream_reader(counted)
+    elif kind == "gz":
+        import gzip
+        fileobj = gzip.GzipFile(fileobj=counted, mode="rb")
+    else:
+        fileobj = lzma.LZMAFile(counted, "rb")
+
+    try:
+        with tarfile.open(fileobj=fileobj, mode="r|") as tar:
+            for info in tar:
+                tracker.current = info.name
+                _safe_target(dest, info.name)
+                if hasattr(tarfile, "data_filter"):
+                    tar.extract(info, dest, filter="data")
+                elif info.isfile() or info.isdir():
+                    # Older Pythons: skip links and devices rather than trust them
+                    tar.extract(info, dest)
+    finally:
+        fileobj.close()
+        raw.close()
+    return tracker.snapshot()
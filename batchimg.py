@@ -0,0 +1,261 @@
+import os
+import time
+import shutil
+import struct
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import cv2
+
+
+OUTPUT_FORMATS = {"Keep": None, "PNG": ".png", "JPEG": ".jpg", "WebP": ".webp", "BMP": ".bmp"}
+ROTATIONS = {
+    0: None,
+    90: cv2.ROTATE_90_CLOCKWISE,
+    180: cv2.ROTATE_180,
+    270: cv2.ROTATE_90_COUNTERCLOCKWISE,
+}
+
+# APP1 (EXIF/XMP), APP3..APP13 (incl. Photoshop IPTC), APP15 and COM.
+# APP0 (JFIF), APP2 (ICC profile) and APP14 (Adobe colour transform)
+# change how the pixels are decoded, so they stay.
+METADATA_MARKERS = {0xE1, *range(0xE3, 0xEE), 0xEF, 0xFE}
+
+
+def default_options():
+    return {
+        "max_width": 0,       # 0 keeps the original size
+        "max_height": 0,
+        "rotate": 0,          # degrees clockwise
+        "crop_percent": 0,    # trimmed from every edge
+        "format": None,       # output extension, None keeps the source format
+        "quality": 90,        # JPEG / WebP
+        "strip_exif": True,
+    }
+
+
+# -----------------------------------------------------------
+# WORKER SIDE
+# -----------------------------------------------------------
+def _init_worker():
+    # One OpenCV thread per process; the pool provides the parallelism
+    cv2.setNumThreads(1)
+
+
+def _jpeg_segments(data):
+    """[(marker, segment)] ahead of the image data and the offset where it starts
+
+    Returns (None, 0) when `data` is not a JPEG.
+    """
+    if data[:2] != b"\xff\xd8":
+        return None, 0
+    segments = []
+    pos = 2
+    while pos + 4 <= len(data) and data[pos] == 0xFF:
+        marker = data[pos + 1]
+        if marker == 0xDA:  # start of scan: the rest is image data
+            break
+        length = int.from_bytes(data[pos + 2:pos + 4], "big")
+        segments.append((marker, data[pos:pos + 2 + length]))
+        pos += 2 + length
+    return segments, pos
+
+
+def _strip_jpeg_metadata(data):
+    """Drop the METADATA_MARKERS segments from a JPEG without re-encoding"""
+    segments, pos = _jpeg_segments(data)
+    if segments is None:
+        return None
+    kept = [segment for marker, segment in segments if marker not in METADATA_MARKERS]
+    return b"".join([data[:2], *kept, data[pos:]])
+
+
+def _exif_orientation(segments):
+    """EXIF Orientation (1-8) from the APP1 segment; 1 when missing or unreadable"""
+    for marker, segment in segments:
+        if marker != 0xE1 or segment[4:10] != b"Exif\0\0":
+            continue
+        tiff = segment[10:]
+        order = {b"II": "<", b"MM": ">"}.get(tiff[:2])
+        if order is None:
+            return 1
+        try:
+            ifd = struct.unpack_from(order + "I", tiff, 4)[0]
+            for i in range(struct.unpack_from(order + "H", tiff, ifd)[0]):
+                tag, kind, _, value = struct.unpack_from(order + "HHIH", tiff, ifd + 2 + 12 * i)
+                if tag == 0x0112 and kind == 3:  # Orientation, SHORT
+                    return value if 1 <= value <= 8 else 1
+        except struct.error:
+            pass
+        return 1
+    return 1
+
+
+def _with_icc_profile(encoded, segments):
+    """Copy the source's ICC profile (APP2) into a JPEG OpenCV encoded without one"""
+    icc = [segment for marker, segment in segments
+           if marker == 0xE2 and segment[4:16] == b"ICC_PROFILE\0"]
+    if not icc:
+        return encoded
+    head, pos = _jpeg_segments(encoded)
+    # After the JFIF APP0, which must come first
+    jfif = [segment for marker, segment in head[:1] if marker == 0xE0]
+    start = 2 + sum(len(segment) for segment in jfif)
+    return b"".join([encoded[:2], *jfif, *icc, encoded[start:]])
+
+
+def _pixels_unchanged(options, src, dst):
+    same_format = os.path.splitext(src)[1].lower() == os.path.splitext(dst)[1].lower()
+    return (
+        same_format
+        and not options["max_width"] and not options["max_height"]
+        and not options["rotate"] and not options["crop_percent"]
+    )
+
+
+def process_image(src, dst, options):
+    """Apply the batch operations to one image; runs in a worker process
+
+    Re-encoding through OpenCV never writes EXIF, so metadata is dropped
+    whenever pixels change (a JPEG keeps its ICC profile). When they don't,
+    the file is copied as-is or, for a JPEG EXIF strip, rewritten without
+    its metadata segments. A JPEG whose EXIF Orientation isn't 1 is
+    re-encoded upright instead, as stripping the tag would turn it sideways.
+    """
+    in_bytes = os.path.getsize(src)
+    segments = []
+    if src.lower().endswith((".jpg", ".jpeg")) and dst.lower().endswith((".jpg", ".jpeg")):
+        with open(src, "rb") as f:
+            data = f.read()
+        segments = _jpeg_segments(data)[0] or []
+
+    if _pixels_unchanged(options, src, dst):
+        if not options["strip_exif"]:
+            shutil.copyfile(src, dst)
+            return src, dst, in_bytes, in_bytes
+        if segments and _exif_orientation(segments) == 1:
+            stripped = _strip_jpeg_metadata(data)
+            with open(dst, "wb") as f:
+                f.write(stripped)
+            return src, dst, in_bytes, len(stripped)
+
+    # IMREAD_COLOR applies the EXIF orientation, so output is upright
+    image = cv2.imread(src, cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError(f"cannot decode {os.path.basename(src)}")
+
+    crop = options["crop_percent"]
+    if crop:
+        h, w = image.shape[:2]
+        dy, dx = int(h * crop / 100), int(w * crop / 100)
+        image = image[dy:h - dy, dx:w - dx]
+
+    rotation = ROTATIONS.get(options["rotate"])
+    if rotation is not None:
+        image = cv2.rotate(image, rotation)
+
+    max_w, max_h = options["max_width"], options["max_height"]
+    if max_w or max_h:
+        h, w = image.shape[:2]
+        scale = min(max_w / w if max_w else 1.0, max_h / h if max_h else 1.0)
+        if scale < 1.0:
+            size = (max(1, round(w * scale)), max(1, round(h * scale)))
+            image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+    ext = os.path.splitext(dst)[1].lower()
+    params = []
+    if ext in (".jpg", ".jpeg"):
+        params = [cv2.IMWRITE_JPEG_QUALITY, options["quality"]]
+    elif ext == ".webp":
+        params = [cv2.IMWRITE_WEBP_QUALITY, options["quality"]]
+
+    ok, encoded = cv2.imencode(ext, image, params)
+    if not ok:
+        raise ValueError(f"cannot encode {os.path.basename(dst)}")
+    # The pixels are still in the source's colour space
+    encoded = _with_icc_profile(encoded.tobytes(), segments)
+    with open(dst, "wb") as f:
+        f.write(encoded)
+    return src, dst, in_bytes, len(encoded)
+
+
+# -----------------------------------------------------------
+# DRIVER
+# -----------------------------------------------------------
+def plan_outputs(paths, out_dir, ext=None):
+    """Unique destination for every source, decided up front in the parent"""
+    taken = set(os.listdir(out_dir)) if os.path.isdir(out_dir) else set()
+    plan = []
+    for src in paths:
+        stem, src_ext = os.path.splitext(os.path.basename(src))
+        target_ext = ext or src_ext.lower()
+        name = stem + target_ext
+        counter = 1
+        while name in taken:
+            name = f"{stem}_{counter}{target_ext}"
+            counter += 1
+        taken.add(name)
+        plan.append((src, os.path.join(out_dir, name)))
+    return plan
+
+
+def run_batch(paths, options, out_dir, workers=None, max_inflight=None, progress=None, cancel=None):
+    """Process `paths` across a process pool, streaming results back
+
+    At most `max_inflight` images are submitted at once, which bounds
+    memory no matter how many files are selected. progress(done, total,
+    result_or_error) is called from this thread as each image completes.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    max_inflight = max_inflight or workers * 2
+    jobs = iter(plan_outputs(paths, out_dir, options["format"]))
+    total = len(paths)
+    summary = {"total": total, "done": 0, "failed": 0, "cancelled": False,
+               "in_bytes": 0, "out_bytes": 0, "errors": []}
+    start = time.perf_counter()
+
+    # spawn: forking a process that runs Qt threads is not safe
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker) as pool:
+        pending = set()
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < max_inflight:
+                if cancel is not None and cancel.is_set():
+                    exhausted = True
+                    break
+                job = next(jobs, None)
+                if job is None:
+                    exhausted = True
+                    break
+                pending.add(pool.submit(process_image, job[0], job[1], options))
+
+            if not pending:
+                break
+            finished, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+            for future in finished:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    summary["failed"] += 1
+                    if len(summary["errors"]) < 20:
+                        summary["errors"].append(str(e))
+                    result = e
+                else:
+                    summary["in_bytes"] += result[2]
+                    summary["out_bytes"] += result[3]
+                summary["done"] += 1
+                if progress:
+                    progress(summary["done"], total, result)
+
+            if cancel is not None and cancel.is_set():
+                # Drop queued work; images already being processed finish
+                for future in pending:
+                    future.cancel()
+                exhausted = True
+                pending = {f for f in pending if not f.cancelled()}
+
+    summary["cancelled"] = summary["done"] < total
+    summary["elapsed"] = time.perf_counter() - start
+    return summary
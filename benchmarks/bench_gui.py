@@ -0,0 +1,330 @@
+"""Headless benchmarks for the GUI hot paths.
+
+Run from the repo root:
+
+    python benchmarks/bench_gui.py                   # run and compare to baseline
+    python benchmarks/bench_gui.py --save-baseline   # record a new baseline
+    python benchmarks/bench_gui.py --quick           # smaller fixtures
+
+Exit status is 1 when any benchmark regresses past the tolerance.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QT_VERSION_STR
+
+import Gui
+from perf import PERF, Histogram
+import fixtures
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# (image count, resolution) per gallery fixture
+FULL_SIZES = {
+    "gallery_small": (20, (640, 480)),
+    "gallery_large": (200, (1920, 1080)),
+    "gallery_huge": (10, (4000, 3000)),
+}
+QUICK_SIZES = {
+    "gallery_small": (10, (640, 480)),
+    "gallery_large": (20, (1920, 1080)),
+}
+
+
+# -----------------------------------------------------------
+# MEASUREMENT
+# -----------------------------------------------------------
+def bench(results, name, fn, repeat, setup=None):
+    """Time `fn` `repeat` times, keeping setup out of the measurement"""
+    hist = Histogram()
+    app = QApplication.instance()
+    for i in range(repeat):
+        if setup:
+            setup(i)
+        start = time.perf_counter()
+        fn()
+        app.processEvents()
+        hist.add((time.perf_counter() - start) * 1e6)
+    s = hist.summary()
+    results[name] = {
+        "count": s["count"],
+        "mean_ms": s["mean_us"] / 1000,
+        "p50_ms": s["p50_us"] / 1000,
+        "p95_ms": s["p95_us"] / 1000,
+        "max_ms": s["max_us"] / 1000,
+    }
+    print(f"  {name:<36} p50={results[name]['p50_ms']:8.3f}ms  p95={results[name]['p95_ms']:8.3f}ms")
+
+
+def bench_startup(results, repeat):
+    windows = []
+
+    def start():
+        window = Gui.MainWindow()
+        window.show()
+        windows.append(window)
+
+    bench(results, "startup", start, repeat)
+    for window in windows:
+        window.close()
+
+
+def bench_switch_page(window, results, video_path, repeat):
+    with mock.patch.object(Gui.cv2, "VideoCapture", lambda index: fixtures.FileCamera(video_path)):
+        for index, name in enumerate(Gui.PAGE_NAMES):
+            bench(results, f"switch_page.{name}", lambda i=index: window.switch_page(i), repeat)
+        window.switch_page(0)
+
+
+def bench_gallery(window, results, folders, repeat):
+    for label, folder in folders.items():
+        Gui.IMG_FOLDER = folder
+        bench(results, f"gallery.open.{label}", lambda: window.switch_page(1), max(3, repeat // 5))
+        window.switch_page(1)
+        bench(results, f"gallery.next.{label}", window.show_next_image, repeat)
+        bench(results, f"gallery.prev.{label}", window.show_prev_image, repeat)
+
+
+def bench_camera(window, results, video_path, frames):
+    with mock.patch.object(Gui.cv2, "VideoCapture", lambda index: fixtures.FileCamera(video_path)):
+        window.switch_page(2)
+        # Drive frames directly; the 30 ms QTimer would cap throughput
+        window.timer.stop()
+        bench(results, "camera.update_frame", window.update_frame, frames)
+        start = time.perf_counter()
+        for _ in range(frames):
+            window.update_frame()
+        results["camera.update_frame"]["fps"] = frames / (time.perf_counter() - start)
+        print(f"  {'camera.update_frame fps':<36} {results['camera.update_frame']['fps']:8.1f}")
+        window.switch_page(0)
+
+
+def bench_tools(window, results, paths, repeat):
+    window.switch_page(5)
+
+    for label, tree in paths["trees"].items():
+        with mock.patch.object(Gui.QFileDialog, "getExistingDirectory", return_value=tree):
+            bench(results, f"tools.list_directory.{label}", window.list_directory, repeat)
+        window.tools_output.clear()
+
+    for label, text in paths["texts"].items():
+        with mock.patch.object(Gui.QFileDialog, "getOpenFileName", return_value=(text, "")):
+            bench(results, f"tools.read_file.{label}", window.read_file, max(3, repeat // 5),
+                  setup=lambda i: window.tools_output.clear())
+        window.tools_output.clear()
+
+    dest_root = paths["copy_dest"]
+    for label, src in paths["binaries"].items():
+        dest = os.path.join(dest_root, label)
+        os.makedirs(dest, exist_ok=True)
+
+        def clear_dest(i, dest=dest):
+            # Fresh destination so the duplicate-name loop doesn't grow
+            for name in os.listdir(dest):
+                os.remove(os.path.join(dest, name))
+            window.tools_output.clear()
+
+        with mock.patch.object(Gui.QFileDialog, "getOpenFileName", return_value=(src, "")), \
+                mock.patch.object(Gui.QFileDialog, "getExistingDirectory", return_value=dest):
+            bench(results, f"tools.copy_file.{label}", window.copy_file, max(3, repeat // 5), setup=clear_dest)
+
+    window.switch_page(0)
+
+
+def count_paints(fn, settle_ms=0):
+    """Paint events caused by fn(), including any animation within settle_ms"""
+    app = QApplication.instance()
+    before = PERF.snapshot()["counters"].get("ui.paint", 0)
+    fn()
+    app.processEvents()
+    deadline = time.perf_counter() + settle_ms / 1000
+    while time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    return PERF.snapshot()["counters"].get("ui.paint", 0) - before
+
+
+def bench_repaints(video_path, root):
+    """Paint events for startup and each page switch, glass theme vs reduced motion"""
+    app = QApplication.instance()
+    counter = Gui.RepaintCounter()
+    app.installEventFilter(counter)
+    repaints = {}
+    try:
+        with mock.patch.object(Gui.cv2, "VideoCapture", lambda index: fixtures.FileCamera(video_path)):
+            for mode, flag in (("glass", "0"), ("reduced", "1")):
+                # Fresh session each time, so startup doesn't reopen another page
+                env = {"UG_REDUCED_MOTION": flag, "UG_SESSION": os.path.join(root, f"session_{mode}.json")}
+                with mock.patch.dict(os.environ, env):
+                    windows = []
+
+                    def start():
+                        window = Gui.MainWindow()
+                        window.show()
+                        windows.append(window)
+
+                    # Long enough for the entry animation to finish
+                    counts = {"startup": count_paints(start, settle_ms=1500)}
+                    window = windows[0]
+                    for index, name in enumerate(Gui.PAGE_NAMES):
+                        counts[f"switch_page.{name}"] = count_paints(lambda i=index: window.switch_page(i))
+                    window.switch_page(0)
+                    window.close()
+                repaints[mode] = counts
+    finally:
+        app.removeEventFilter(counter)
+
+    print(f"\n{'paint events':<38}{'glass':>8}{'reduced':>9}")
+    for name in repaints["glass"]:
+        print(f"{name:<38}{repaints['glass'][name]:>8}{repaints['reduced'][name]:>9}")
+    return repaints
+
+
+# -----------------------------------------------------------
+# FIXTURES
+# -----------------------------------------------------------
+def build_fixtures(root, quick):
+    print("Generating fixtures...")
+    sizes = QUICK_SIZES if quick else FULL_SIZES
+    folders = {
+        label: fixtures.make_image_folder(os.path.join(root, label), count, res)
+        for label, (count, res) in sizes.items()
+    }
+    mb = 1 << 20
+    paths = {
+        "trees": {
+            "flat": fixtures.make_tree(os.path.join(root, "flat"), 0, 0, 500 if quick else 5000),
+            "deep": fixtures.make_tree(os.path.join(root, "deep"), 3 if quick else 5, 3, 5),
+        },
+        "texts": {
+            "1mb": fixtures.make_text_file(os.path.join(root, "text_1mb.txt"), mb),
+            "10mb": fixtures.make_text_file(os.path.join(root, "text_10mb.txt"), (2 if quick else 10) * mb),
+        },
+        "binaries": {
+            "1mb": fixtures.make_binary_file(os.path.join(root, "bin_1mb.dat"), mb),
+            "100mb": fixtures.make_binary_file(os.path.join(root, "bin_100mb.dat"), (10 if quick else 100) * mb),
+        },
+        "copy_dest": os.path.join(root, "copy_dest"),
+    }
+    video = fixtures.make_video(os.path.join(root, "camera.avi"), 60, (1280, 720))
+    return folders, paths, video
+
+
+# -----------------------------------------------------------
+# BASELINE COMPARISON
+# -----------------------------------------------------------
+def compare(results, baseline, tolerance, min_delta_ms):
+    """Return names whose p50 got slower than baseline by more than tolerance"""
+    regressions = []
+    print(f"\n{'benchmark':<38}{'baseline':>12}{'current':>12}{'change':>10}")
+    for name, base in sorted(baseline.get("results", {}).items()):
+        current = results.get(name)
+        if not current:
+            continue
+        before, after = base["p50_ms"], current["p50_ms"]
+        change = (after - before) / before if before else 0.0
+        flag = ""
+        if change > tolerance and after - before > min_delta_ms:
+            regressions.append(name)
+            flag = "  ❌ REGRESSION"
+        print(f"{name:<38}{before:>10.3f}ms{after:>10.3f}ms{change:>+9.0%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MainWindow hot paths headlessly")
+    parser.add_argument("--output", default="bench_results.json", help="where to write results JSON")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p50 slowdown (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.05, help="ignore changes smaller than this")
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--quick", action="store_true", help="smaller fixtures for a fast smoke run")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    original_img_folder = Gui.IMG_FOLDER
+    results = {}
+    root = tempfile.mkdtemp(prefix="ug_bench_")
+    # Keep the user's real session out of (and untouched by) the run
+    os.environ["UG_SESSION"] = os.path.join(root, "session.json")
+
+    try:
+        folders, paths, video = build_fixtures(root, args.quick)
+
+        print("Running benchmarks...")
+        bench_startup(results, 5)
+        window = Gui.MainWindow()
+        window.show()
+        app.processEvents()
+        PERF.reset()
+
+        bench_switch_page(window, results, video, args.repeat)
+        bench_gallery(window, results, folders, args.repeat)
+        bench_camera(window, results, video, args.frames)
+        bench_tools(window, results, paths, args.repeat)
+        window.close()
+        repaints = bench_repaints(video, root)
+    finally:
+        Gui.IMG_FOLDER = original_img_folder
+        shutil.rmtree(root, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "qt": QT_VERSION_STR,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "quick": args.quick,
+        },
+        "results": results,
+        # Sub-phase timings from the app's own instrumentation
+        "instrumented": PERF.snapshot()["timings"],
+        # Informational only; not compared against the baseline
+        "repaints": repaints,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline found; run with --save-baseline to create one.")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("meta", {}).get("quick") != args.quick:
+        print("⚠ Baseline was recorded with a different --quick setting")
+
+    regressions = compare(results, baseline, args.tolerance, args.min_delta_ms)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    print("\n✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+import os
+import cv2
+import numpy as np
+
+
+# -----------------------------------------------------------
+# SYNTHETIC FIXTURES
+# -----------------------------------------------------------
+def make_image(width, height, seed=0):
+    """Gradient plus noise, so encoders can't cheat on flat images"""
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    base = np.stack([x + 0 * y, y + 0 * x, (x + y) / 2], axis=-1)
+    noise = rng.integers(0, 32, size=(height, width, 3), dtype=np.uint8)
+    return np.clip(base + noise, 0, 255).astype(np.uint8)
+
+
+def make_image_folder(path, count, size, ext=".jpg"):
+    """Write `count` images of `size` (w, h) into `path`"""
+    os.makedirs(path, exist_ok=True)
+    width, height = size
+    # Encoding is the slow part; reuse a few source frames
+    frames = [make_image(width, height, seed) for seed in range(min(count, 4))]
+    for i in range(count):
+        cv2.imwrite(os.path.join(path, f"img_{i:05d}{ext}"), frames[i % len(frames)])
+    return path
+
+
+def make_text_file(path, size_bytes):
+    """Write a UTF-8 text file of roughly `size_bytes`"""
+    line = "The quick brown fox jumps over the lazy dog 0123456789 ✓\n"
+    chunk = line * max(1, 65536 // len(line))
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while written < size_bytes:
+            f.write(chunk)
+            written += len(chunk.encode("utf-8"))
+    return path
+
+
+def make_binary_file(path, size_bytes):
+    block = os.urandom(1 << 20)
+    with open(path, "wb") as f:
+        remaining = size_bytes
+        while remaining > 0:
+            f.write(block[:remaining])
+            remaining -= len(block)
+    return path
+
+
+def make_tree(path, depth, fanout, files_per_dir, file_size=256):
+    """Deep directory tree: fanout**depth leaf folders with small files"""
+    os.makedirs(path, exist_ok=True)
+    payload = b"x" * file_size
+    for i in range(files_per_dir):
+        with open(os.path.join(path, f"file_{i:04d}.dat"), "wb") as f:
+            f.write(payload)
+    if depth > 0:
+        for i in range(fanout):
+            make_tree(os.path.join(path, f"dir_{i:02d}"), depth - 1, fanout, files_per_dir, file_size)
+    return path
+
+
+def make_video(path, frames, size, fps=30):
+    """Encode an MJPG clip to act as a file-backed camera"""
+    width, height = size
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), fps, (width, height))
+    base = make_image(width, height)
+    for i in range(frames):
+        writer.write(np.roll(base, i * 4, axis=1))
+    writer.release()
+    return path
+
+
+# The benches patch cv2.VideoCapture to return a FileCamera; keep the real
+# constructor, or FileCamera would end up constructing itself forever
+_VideoCapture = cv2.VideoCapture
+
+
+class FileCamera:
+    """cv2.VideoCapture stand-in that loops a video file forever"""
+
+    def __init__(self, path):
+        self.path = path
+        self.cap = _VideoCapture(path)
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self):
+        ret, frame = self.cap.read()
+        if not ret:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.cap.read()
+        return ret, frame
+
+    def release(self):
+        self.cap.release()
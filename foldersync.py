@@ -0,0 +1,336 @@
+import os
+import json
+import gzip
+import time
+import stat
+import shutil
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from archives import Progress, CancelledError, CHUNK_SIZE
+
+
+MANIFEST_NAME = ".sync_manifest.json.gz"
+MANIFEST_VERSION = 1
+
+
+# -----------------------------------------------------------
+# PARALLEL SCAN
+# -----------------------------------------------------------
+def _scan_dir(path, rel):
+    """One directory level: ({rel: (size, mtime_ns)}, [sub dirs])"""
+    files = {}
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = f"{rel}/{entry.name}" if rel else entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, name))
+                elif entry.is_file(follow_symlinks=False):
+                    st = entry.stat(follow_symlinks=False)
+                    files[name] = (st.st_size, st.st_mtime_ns)
+            except OSError:
+                continue
+    return files, subdirs
+
+
+def scan_tree(root, workers=8, progress=None, cancel=None):
+    """Walk `root` with one scandir task per directory, several at a time
+
+    Returns (files, dirs): files maps 'a/b.txt' -> (size, mtime_ns) and
+    dirs is the set of relative directory paths.
+    """
+    files = {}
+    dirs = set()
+    with ThreadPoolExecutor(workers) as pool:
+        pending = {pool.submit(_scan_dir, root, "")}
+        while pending:
+            if cancel is not None and cancel.is_set():
+                for future in pending:
+                    future.cancel()
+                raise CancelledError()
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                try:
+                    found, subdirs = future.result()
+                except OSError:
+                    continue  # unreadable directory
+                files.update(found)
+                for path, rel in subdirs:
+                    dirs.add(rel)
+                    pending.add(pool.submit(_scan_dir, path, rel))
+            if progress:
+                progress(len(files))
+    files.pop(MANIFEST_NAME, None)
+    return files, dirs
+
+
+def file_hash(path):
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# -----------------------------------------------------------
+# MANIFEST
+# -----------------------------------------------------------
+def load_manifest(dest, source):
+    """Source state recorded at the last sync into `dest`, or None"""
+    path = os.path.join(dest, MANIFEST_NAME)
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != MANIFEST_VERSION or data.get("source") != os.path.abspath(source):
+        return None
+    return {name: tuple(value) for name, value in data["files"].items()}
+
+
+def save_manifest(dest, source, files):
+    """Write atomically so an interrupted save never leaves a corrupt manifest"""
+    path = os.path.join(dest, MANIFEST_NAME)
+    tmp = path + ".tmp"
+    data = {"version": MANIFEST_VERSION, "source": os.path.abspath(source), "files": files}
+    with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=1) as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def check_manifest(dest, manifest, cancel=None):
+    """Current (size, mtime_ns) of each manifest entry still present in dest
+
+    One lstat per recorded file instead of a full scan. Files that were
+    deleted (or replaced by something else) since the last sync are left
+    out, so the plan treats their source copies as new.
+    """
+    files = {}
+    for i, name in enumerate(manifest):
+        if cancel is not None and i % 1000 == 0 and cancel.is_set():
+            raise CancelledError()
+        try:
+            st = os.lstat(os.path.join(dest, name))
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            files[name] = (st.st_size, st.st_mtime_ns)
+    return files
+
+
+# -----------------------------------------------------------
+# PLAN
+# -----------------------------------------------------------
+def plan_sync(source, dest, mirror=False, verify=False, workers=8, progress=None, cancel=None):
+    """Work out what a one-way sync from source to dest has to do
+
+    With a manifest from a previous sync the destination is not scanned;
+    only the files it lists are lstat'ed, so deleted or edited copies are
+    still noticed. Without one, with verify=True, or when mirroring (the
+    manifest cannot list files or directories that only exist in dest)
+    both trees are scanned. Either way, files whose size matches but
+    mtime differs are hashed to decide.
+    """
+    start = time.perf_counter()
+    report = (lambda n: progress(f"Scanning source... {n:,} files")) if progress else None
+    src_files, src_dirs = scan_tree(source, workers, report, cancel)
+
+    manifest = None if verify or mirror else load_manifest(dest, source)
+    if manifest is not None:
+        if progress:
+            progress(f"Checking {len(manifest):,} synced files...")
+        dst_files, dst_dirs = check_manifest(dest, manifest, cancel), set()
+    elif os.path.isdir(dest):
+        report = (lambda n: progress(f"Scanning destination... {n:,} files")) if progress else None
+        dst_files, dst_dirs = scan_tree(dest, workers, report, cancel)
+    else:
+        dst_files, dst_dirs = {}, set()
+
+    copy, touch, conflicts = [], [], []
+    for name, (size, mtime) in src_files.items():
+        old = dst_files.get(name)
+        if old is None:
+            copy.append((name, size, "new"))
+        elif old[0] != size:
+            copy.append((name, size, "changed"))
+        elif old[1] != mtime:
+            conflicts.append(name)
+
+    # Same size, different mtime: only here is content worth hashing
+    if conflicts:
+        if progress:
+            progress(f"Hashing {len(conflicts):,} possible conflicts...")
+
+        def same_content(name):
+            try:
+                return file_hash(os.path.join(source, name)) == file_hash(os.path.join(dest, name))
+            except OSError:
+                return False  # vanished or unreadable since the scan: copy it
+
+        with ThreadPoolExecutor(workers) as pool:
+            for name, same in zip(conflicts, pool.map(same_content, conflicts)):
+                if cancel is not None and cancel.is_set():
+                    raise CancelledError()
+                if same:
+                    touch.append(name)
+                else:
+                    copy.append((name, src_files[name][0], "modified"))
+
+    delete, delete_dirs = [], []
+    if mirror:
+        delete = sorted(name for name in dst_files if name not in src_files)
+        # Deepest first so directories are empty when removed
+        delete_dirs = sorted((d for d in dst_dirs if d not in src_dirs), key=lambda d: -d.count("/"))
+
+    copy.sort()
+    return {
+        "source": source,
+        "dest": dest,
+        "copy": copy,
+        "touch": sorted(touch),
+        "delete": delete,
+        "delete_dirs": delete_dirs,
+        "src_files": src_files,
+        "unchanged": len(src_files) - len(copy) - len(touch),
+        "used_manifest": manifest is not None,
+        "bytes": sum(size for _, size, _ in copy),
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+def describe_plan(plan, limit=50):
+    """Preview lines for the diff"""
+    lines = [
+        f"Scanned {len(plan['src_files']):,} source files in {plan['elapsed']:.2f}s"
+        + (" (manifest: destination not rescanned)" if plan["used_manifest"] else ""),
+        f"  {plan['unchanged']:,} unchanged",
+        f"  {len(plan['copy']):,} to copy ({plan['bytes']:,} bytes)",
+        f"  {len(plan['touch']):,} identical content, timestamp only",
+        f"  {len(plan['delete']):,} to delete",
+    ]
+    for name, _, reason in plan["copy"][:limit]:
+        lines.append(f"  + {name}  [{reason}]")
+    if len(plan["copy"]) > limit:
+        lines.append(f"  ... {len(plan['copy']) - limit:,} more to copy")
+    for name in plan["delete"][:limit]:
+        lines.append(f"  - {name}")
+    if len(plan["delete"]) > limit:
+        lines.append(f"  ... {len(plan['delete']) - limit:,} more to delete")
+    return lines
+
+
+# -----------------------------------------------------------
+# APPLY
+# -----------------------------------------------------------
+def _copy_file(src, dst, progress):
+    """Copy via a temp file + rename so dst is never left half-written"""
+    tmp = dst + ".sync-tmp"
+    try:
+        with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+            try:
+                # Zero-copy in the kernel, still in chunks for progress/cancel
+                offset = 0
+                while True:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, CHUNK_SIZE)
+                    if not sent:
+                        break
+                    offset += sent
+                    progress.add(sent)
+            except (AttributeError, OSError):
+                if offset:
+                    raise
+                while True:
+                    chunk = fsrc.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    fdst.write(chunk)
+                    progress.add(len(chunk))
+        shutil.copystat(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def apply_plan(plan, workers=4, progress=None, cancel=None):
+    """Carry out a plan with a concurrent transfer queue, then save the manifest"""
+    source, dest = plan["source"], plan["dest"]
+    tracker = Progress(plan["bytes"], progress, cancel)
+    lock = threading.Lock()
+    synced = set()
+    errors = []
+
+    def transfer(name):
+        tracker.current = name
+        target = os.path.join(dest, name)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        _copy_file(os.path.join(source, name), target, tracker)
+        with lock:
+            synced.add(name)
+
+    os.makedirs(dest, exist_ok=True)
+    cancelled = False
+    with ThreadPoolExecutor(workers) as pool:
+        # Largest first keeps every worker busy until the end
+        jobs = sorted(plan["copy"], key=lambda job: -job[1])
+        futures = {pool.submit(transfer, name): name for name, _, _ in jobs}
+        for future in futures:
+            if future.cancelled():
+                # Never started because an earlier transfer was cancelled;
+                # result() would raise concurrent.futures.CancelledError
+                continue
+            try:
+                future.result()
+            except CancelledError:
+                cancelled = True
+                for other in futures:
+                    other.cancel()
+            except OSError as e:
+                errors.append(f"{futures[future]}: {e.strerror or e}")
+
+    deleted = 0
+    if not cancelled:
+        for name in plan["touch"]:
+            mtime = plan["src_files"][name][1]
+            try:
+                os.utime(os.path.join(dest, name), ns=(mtime, mtime))
+                synced.add(name)
+            except OSError as e:
+                errors.append(f"{name}: {e.strerror or e}")
+        for name in plan["delete"]:
+            try:
+                os.remove(os.path.join(dest, name))
+                deleted += 1
+            except OSError as e:
+                errors.append(f"{name}: {e.strerror or e}")
+        for name in plan["delete_dirs"]:
+            try:
+                os.rmdir(os.path.join(dest, name))
+            except OSError:
+                pass  # not empty: holds files we were told to keep
+
+    # Record only what is known to be in place; anything else is retried next time
+    copied_or_touched = {name for name, _, _ in plan["copy"]} | set(plan["touch"])
+    files = {
+        name: list(state) for name, state in plan["src_files"].items()
+        if name not in copied_or_touched or name in synced
+    }
+    save_manifest(dest, source, files)
+
+    summary = tracker.snapshot()
+    summary.update({
+        "copied": len(synced & {name for name, _, _ in plan["copy"]}),
+        "deleted": deleted,
+        "errors": errors,
+        "cancelled": cancelled,
+    })
+    return summary
@@ -0,0 +1,239 @@
+import os
+import time
+import socket
+import struct
+import asyncio
+import ipaddress
+from collections import deque
+
+
+# Refuse to expand CIDR ranges bigger than this (a /16 is 65k hosts)
+MAX_TARGETS = 65536
+
+
+# -----------------------------------------------------------
+# TARGETS
+# -----------------------------------------------------------
+def expand_targets(spec, limit=MAX_TARGETS):
+    """Turn 'host, 10.0.0.0/28 other-host' into a list of host strings"""
+    targets = []
+    for entry in spec.replace(",", " ").split():
+        if "/" in entry:
+            network = ipaddress.ip_network(entry, strict=False)
+            if network.num_addresses > limit:
+                raise ValueError(f"{entry} has {network.num_addresses} addresses (limit {limit})")
+            hosts = list(network.hosts()) or [network.network_address]
+            targets.extend(str(ip) for ip in hosts)
+        else:
+            targets.append(entry)
+        if len(targets) > limit:
+            raise ValueError(f"Too many targets (limit {limit})")
+    return targets
+
+
+def parse_target(text):
+    """Split 'host', 'host:port', '[v6addr]:port' or a bare IPv6 address into (host, port)
+
+    port is None when none was given. A bare IPv6 address has no port; it
+    needs brackets for one, as in URLs.
+    """
+    text = text.strip()
+    if text.startswith("["):
+        host, bracket, rest = text[1:].partition("]")
+        if not bracket or (rest and not rest.startswith(":")):
+            raise ValueError(f"Invalid target: {text}")
+        port_text = rest[1:] if rest else None
+    elif text.count(":") == 1:
+        host, _, port_text = text.partition(":")
+    else:
+        host, port_text = text, None
+    if not host:
+        raise ValueError(f"Invalid target: {text}")
+    if port_text is None:
+        return host, None
+    try:
+        port = int(port_text)
+    except ValueError:
+        port = -1
+    if not 0 < port < 65536:
+        raise ValueError(f"Invalid port: {port_text}")
+    return host, port
+
+
+def format_target(host, port=None):
+    """Inverse of parse_target(): brackets IPv6 addresses that carry a port"""
+    if not port:
+        return host
+    return f"[{host}]:{port}" if ":" in host else f"{host}:{port}"
+
+
+class ProbeResult:
+    """Outcome of one probe; rtt_ms is None when the host did not answer"""
+
+    __slots__ = ("host", "port", "method", "rtt_ms", "error")
+
+    def __init__(self, host, port, method, rtt_ms=None, error=""):
+        self.host = host
+        self.port = port
+        self.method = method
+        self.rtt_ms = rtt_ms
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.rtt_ms is not None
+
+    def __str__(self):
+        target = format_target(self.host, self.port)
+        if self.ok:
+            return f"{target:<28} {self.method.upper():<4} {self.rtt_ms:8.2f} ms"
+        return f"{target:<28} {self.method.upper():<4} {'--':>8}    ({self.error})"
+
+
+# -----------------------------------------------------------
+# PROBES
+# -----------------------------------------------------------
+async def tcp_probe(host, port, timeout=2.0):
+    """Time a TCP handshake; a refused connection still proves the host is up"""
+    start = time.perf_counter()
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except ConnectionRefusedError:
+        return ProbeResult(host, port, "tcp", (time.perf_counter() - start) * 1000, "refused")
+    except asyncio.TimeoutError:
+        return ProbeResult(host, port, "tcp", error="timeout")
+    except OSError as e:
+        return ProbeResult(host, port, "tcp", error=e.strerror or str(e))
+    rtt = (time.perf_counter() - start) * 1000
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return ProbeResult(host, port, "tcp", rtt)
+
+
+def _checksum(data):
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+async def icmp_probe(host, timeout=2.0, seq=1):
+    """ICMP echo over an unprivileged datagram socket (Linux ping_group_range)
+
+    Raw sockets would need root; if datagram ICMP isn't permitted either the
+    result carries the error so callers can fall back to TCP probes.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        infos = await loop.getaddrinfo(host, None, family=socket.AF_INET)
+        address = infos[0][4][0]
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+    except (OSError, IndexError) as e:
+        return ProbeResult(host, 0, "icmp", error=getattr(e, "strerror", None) or str(e))
+
+    sock.setblocking(False)
+    try:
+        # Type 8 echo request; the kernel rewrites the identifier for us
+        ident, seq = os.getpid() & 0xFFFF, seq & 0xFFFF
+        payload = struct.pack("!d", time.perf_counter())
+        checksum = _checksum(struct.pack("!BBHHH", 8, 0, 0, ident, seq) + payload)
+        packet = struct.pack("!BBHHH", 8, 0, checksum, ident, seq) + payload
+        start = time.perf_counter()
+        await loop.sock_sendto(sock, packet, (address, 0))
+        deadline = start + timeout
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return ProbeResult(host, 0, "icmp", error="timeout")
+            data, _ = await asyncio.wait_for(loop.sock_recvfrom(sock, 1024), remaining)
+            # Echo reply (type 0) carrying our sequence number
+            if len(data) >= 8 and data[0] == 0 and struct.unpack("!H", data[6:8])[0] == seq:
+                return ProbeResult(host, 0, "icmp", (time.perf_counter() - start) * 1000)
+    except asyncio.TimeoutError:
+        return ProbeResult(host, 0, "icmp", error="timeout")
+    except OSError as e:
+        return ProbeResult(host, 0, "icmp", error=e.strerror or str(e))
+    finally:
+        sock.close()
+
+
+async def probe(host, port=None, timeout=2.0, seq=1):
+    """TCP probe when a port is given, ICMP echo otherwise"""
+    if port:
+        return await tcp_probe(host, port, timeout)
+    return await icmp_probe(host, timeout, seq)
+
+
+async def sweep(targets, port=None, concurrency=100, timeout=2.0, on_result=None, cancel=None):
+    """Probe many hosts at once, at most `concurrency` in flight"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(host):
+        async with semaphore:
+            if cancel is not None and cancel.is_set():
+                return None
+            result = await probe(host, port, timeout)
+        if on_result:
+            on_result(result)
+        return result
+
+    results = await asyncio.gather(*(run(host) for host in targets))
+    return [r for r in results if r is not None]
+
+
+# -----------------------------------------------------------
+# LATENCY TRACKING
+# -----------------------------------------------------------
+class LatencyStats:
+    """Rolling latency / jitter / loss over the last `window` probes"""
+
+    def __init__(self, window=60):
+        self.samples = deque(maxlen=window)
+        self.sent = 0
+        self.lost = 0
+
+    def add(self, rtt_ms):
+        """Record one probe; None means the probe was lost"""
+        self.sent += 1
+        if rtt_ms is None:
+            self.lost += 1
+        self.samples.append(rtt_ms)
+
+    def received(self):
+        return [s for s in self.samples if s is not None]
+
+    def summary(self):
+        values = self.received()
+        window_loss = 100.0 * (len(self.samples) - len(values)) / len(self.samples) if self.samples else 0.0
+        if not values:
+            return {"sent": self.sent, "lost": self.lost, "loss_pct": window_loss,
+                    "min_ms": 0.0, "avg_ms": 0.0, "max_ms": 0.0, "jitter_ms": 0.0}
+        # Jitter as mean absolute difference between consecutive replies
+        diffs = [abs(b - a) for a, b in zip(values, values[1:])]
+        return {
+            "sent": self.sent,
+            "lost": self.lost,
+            "loss_pct": window_loss,
+            "min_ms": min(values),
+            "avg_ms": sum(values) / len(values),
+            "max_ms": max(values),
+            "jitter_ms": sum(diffs) / len(diffs) if diffs else 0.0,
+        }
+
+
+async def track(host, port, stats, interval=1.0, timeout=2.0, on_sample=None, cancel=None):
+    """Probe one host every `interval` seconds until `cancel` is set"""
+    seq = 0
+    while cancel is None or not cancel.is_set():
+        seq += 1
+        started = time.perf_counter()
+        result = await probe(host, port, timeout, seq)
+        stats.add(result.rtt_ms)
+        if on_sample:
+            on_sample(result)
+        await asyncio.sleep(max(0.0, interval - (time.perf_counter() - started)))
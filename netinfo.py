@@ -0,0 +1,234 @@
+import os
+import time
+import socket
+import struct
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+SYS_NET = "/sys/class/net"
+PROC_NET = "/proc/net"
+
+# ioctl request numbers from <linux/sockios.h>
+SIOCGIFADDR = 0x8915
+SIOCGIFNETMASK = 0x891B
+
+
+def available():
+    """True when the Linux /proc and /sys network views can be read"""
+    return os.path.isdir(SYS_NET) and os.path.exists(os.path.join(PROC_NET, "dev"))
+
+
+def _read(path):
+    """Read a /proc or /sys file to EOF with raw reads, '' if unreadable
+
+    Usually one 64 KB read; /proc/net/dev and /proc/net/route grow past
+    that on hosts with hundreds of interfaces, and a short read would
+    leave a truncated last line that still parses.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return ""
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks).decode("ascii", "replace").strip()
+    except OSError:
+        # e.g. `speed` on a down interface returns EINVAL
+        return ""
+    finally:
+        os.close(fd)
+
+
+# -----------------------------------------------------------
+# INTERFACES & ADDRESSES
+# -----------------------------------------------------------
+def interfaces():
+    try:
+        return sorted(os.listdir(SYS_NET))
+    except OSError:
+        return sorted(name for _, name in socket.if_nameindex())
+
+
+def _ioctl_ipv4(sock, name, request):
+    ifreq = struct.pack("256s", name[:15].encode())
+    try:
+        return socket.inet_ntoa(fcntl.ioctl(sock.fileno(), request, ifreq)[20:24])
+    except OSError:
+        return ""
+
+
+def ipv4_addresses():
+    """{iface: (address, netmask)} for interfaces that have an IPv4 address"""
+    result = {}
+    if fcntl is None:
+        return result
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for name in interfaces():
+            address = _ioctl_ipv4(sock, name, SIOCGIFADDR)
+            if address:
+                result[name] = (address, _ioctl_ipv4(sock, name, SIOCGIFNETMASK))
+    return result
+
+
+def ipv6_addresses():
+    """{iface: [(address, prefix_len)]} from /proc/net/if_inet6"""
+    result = {}
+    for line in _read(os.path.join(PROC_NET, "if_inet6")).splitlines():
+        fields = line.split()
+        if len(fields) < 6:
+            continue
+        address = socket.inet_ntop(socket.AF_INET6, bytes.fromhex(fields[0]))
+        result.setdefault(fields[5], []).append((address, int(fields[2], 16)))
+    return result
+
+
+def interface_info(name):
+    base = os.path.join(SYS_NET, name)
+    speed = _read(os.path.join(base, "speed"))
+    return {
+        "name": name,
+        "mac": _read(os.path.join(base, "address")),
+        "mtu": _read(os.path.join(base, "mtu")),
+        "state": _read(os.path.join(base, "operstate")),
+        "speed_mbps": int(speed) if speed.lstrip("-").isdigit() and int(speed) > 0 else None,
+    }
+
+
+# -----------------------------------------------------------
+# ROUTES & DNS
+# -----------------------------------------------------------
+def _hex_ipv4(value):
+    # /proc/net/route stores addresses as little-endian hex
+    return socket.inet_ntoa(struct.pack("<I", int(value, 16)))
+
+
+def routes():
+    """IPv4 routing table from /proc/net/route"""
+    table = []
+    lines = _read(os.path.join(PROC_NET, "route")).splitlines()
+    for line in lines[1:]:
+        fields = line.split()
+        if len(fields) < 8:
+            continue
+        flags = int(fields[3], 16)
+        if not flags & 0x1:  # RTF_UP
+            continue
+        table.append({
+            "iface": fields[0],
+            "destination": _hex_ipv4(fields[1]),
+            "gateway": _hex_ipv4(fields[2]),
+            "netmask": _hex_ipv4(fields[7]),
+            "metric": int(fields[6]),
+            "default": fields[1] == "00000000",
+        })
+    return table
+
+
+def nameservers():
+    servers = []
+    for line in _read("/etc/resolv.conf").splitlines():
+        fields = line.split()
+        if len(fields) >= 2 and fields[0] == "nameserver":
+            servers.append(fields[1])
+    return servers
+
+
+# -----------------------------------------------------------
+# COUNTERS & RATES
+# -----------------------------------------------------------
+def counters():
+    """{iface: (rx_bytes, tx_bytes)} for every interface, from one /proc read"""
+    result = {}
+    for line in _read(os.path.join(PROC_NET, "dev")).splitlines()[2:]:
+        name, _, data = line.partition(":")
+        fields = data.split()
+        if len(fields) >= 9:
+            result[name.strip()] = (int(fields[0]), int(fields[8]))
+    return result
+
+
+class RateSampler:
+    """Turns cumulative byte counters into per-interface rx/tx rates"""
+
+    def __init__(self):
+        self.previous = None
+        self.previous_time = 0.0
+
+    def sample(self):
+        """Return {iface: (rx_bytes_per_s, tx_bytes_per_s)}; empty on first call"""
+        now = time.monotonic()
+        current = counters()
+        rates = {}
+        if self.previous is not None:
+            elapsed = now - self.previous_time or 1e-9
+            for name, (rx, tx) in current.items():
+                old = self.previous.get(name)
+                if old is None:
+                    continue
+                # Counters reset when an interface is re-created
+                rates[name] = (max(0, rx - old[0]) / elapsed, max(0, tx - old[1]) / elapsed)
+        self.previous = current
+        self.previous_time = now
+        return rates
+
+
+def format_rate(bytes_per_s):
+    for unit in ["B/s", "KB/s", "MB/s", "GB/s"]:
+        if bytes_per_s < 1024.0:
+            return f"{bytes_per_s:.1f} {unit}"
+        bytes_per_s /= 1024.0
+    return f"{bytes_per_s:.1f} TB/s"
+
+
+def report():
+    """Human readable interface / address / route summary, ipconfig style"""
+    lines = [f"Host name: {socket.gethostname()}"]
+    if not available():
+        try:
+            lines.append(f"Address:   {socket.gethostbyname(socket.gethostname())}")
+        except OSError as e:
+            lines.append(f"Address:   unavailable ({e})")
+        return lines
+
+    v4 = ipv4_addresses()
+    v6 = ipv6_addresses()
+    totals = counters()
+    for name in interfaces():
+        info = interface_info(name)
+        speed = f", {info['speed_mbps']} Mb/s" if info["speed_mbps"] else ""
+        lines.append("")
+        lines.append(f"{name}: {info['state']}{speed}, mtu {info['mtu']}")
+        if info["mac"] and info["mac"] != "00:00:00:00:00:00":
+            lines.append(f"   MAC:        {info['mac']}")
+        if name in v4:
+            address, netmask = v4[name]
+            lines.append(f"   IPv4:       {address}  netmask {netmask}")
+        for address, prefix in v6.get(name, []):
+            lines.append(f"   IPv6:       {address}/{prefix}")
+        if name in totals:
+            rx, tx = totals[name]
+            lines.append(f"   RX / TX:    {rx:,} / {tx:,} bytes")
+
+    table = routes()
+    if table:
+        lines.append("")
+        lines.append("Routes:")
+        for route in table:
+            target = "default" if route["default"] else f"{route['destination']}/{route['netmask']}"
+            via = f" via {route['gateway']}" if route["gateway"] != "0.0.0.0" else ""
+            lines.append(f"   {target}{via} dev {route['iface']} metric {route['metric']}")
+
+    servers = nameservers()
+    if servers:
+        lines.append("")
+        lines.append(f"DNS servers: {', '.join(servers)}")
+    return lines
@@ -0,0 +1,237 @@
+import os
+import sys
+import csv
+import json
+import math
+import time
+import threading
+import traceback
+from collections import deque
+from contextlib import contextmanager
+
+
+# -----------------------------------------------------------
+# TIMING HISTOGRAM
+# -----------------------------------------------------------
+class Histogram:
+    """Log-bucketed latency histogram (microseconds), O(1) per sample"""
+
+    # 8 sub-buckets per power of two keeps the relative error under ~9%
+    SUB_BUCKETS = 8
+    MAX_BUCKETS = 40 * SUB_BUCKETS
+
+    def __init__(self):
+        self.buckets = [0] * self.MAX_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _bucket(self, us):
+        if us < 1.0:
+            return 0
+        return min(int(math.log2(us) * self.SUB_BUCKETS) + 1, self.MAX_BUCKETS - 1)
+
+    def _bucket_value(self, index):
+        if index == 0:
+            return 1.0
+        return 2 ** ((index - 0.5) / self.SUB_BUCKETS)
+
+    def add(self, us):
+        self.buckets[self._bucket(us)] += 1
+        self.count += 1
+        self.total += us
+        if us < self.min:
+            self.min = us
+        if us > self.max:
+            self.max = us
+
+    def percentile(self, pct):
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(self.count * pct / 100.0))
+        seen = 0
+        for index, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                return min(max(self._bucket_value(index), self.min), self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean_us": self.total / self.count if self.count else 0.0,
+            "min_us": self.min if self.count else 0.0,
+            "p50_us": self.percentile(50),
+            "p95_us": self.percentile(95),
+            "p99_us": self.percentile(99),
+            "max_us": self.max,
+        }
+
+
+# -----------------------------------------------------------
+# RECORDER
+# -----------------------------------------------------------
+class PerfRecorder:
+    """Collects timings, counters, errors and stalls for the whole app"""
+
+    def __init__(self):
+        self.histograms = {}
+        self.counters = {}
+        self.errors = {}
+        self.stalls = deque(maxlen=50)
+        self.lock = threading.Lock()
+        self.enabled = os.environ.get("UG_PERF", "1") != "0"
+
+    def record(self, name, us):
+        if not self.enabled:
+            return
+        with self.lock:
+            hist = self.histograms.get(name)
+            if hist is None:
+                hist = self.histograms[name] = Histogram()
+            hist.add(us)
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def error(self, name, exc):
+        """Count an exception on a hot path instead of printing it"""
+        with self.lock:
+            entry = self.errors.setdefault(name, {"count": 0, "last": ""})
+            entry["count"] += 1
+            entry["last"] = f"{type(exc).__name__}: {exc}"
+
+    def stall(self, duration_ms, stack):
+        with self.lock:
+            self.stalls.append({
+                "time": time.strftime("%H:%M:%S"),
+                "duration_ms": round(duration_ms, 1),
+                "stack": stack,
+            })
+
+    @contextmanager
+    def measure(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1e6)
+
+    def reset(self):
+        with self.lock:
+            self.histograms.clear()
+            self.counters.clear()
+            self.errors.clear()
+            self.stalls.clear()
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "timings": {name: h.summary() for name, h in sorted(self.histograms.items())},
+                "counters": dict(self.counters),
+                "errors": {name: dict(e) for name, e in self.errors.items()},
+                "stalls": list(self.stalls),
+            }
+
+    def report_lines(self, limit=12):
+        """Short text lines for the on-screen HUD"""
+        snap = self.snapshot()
+        lines = []
+        timings = sorted(snap["timings"].items(), key=lambda kv: -kv[1]["p95_us"])
+        for name, s in timings[:limit]:
+            lines.append(
+                f"{name:<24} n={s['count']:<6} p50={s['p50_us'] / 1000:6.2f}ms "
+                f"p95={s['p95_us'] / 1000:6.2f}ms p99={s['p99_us'] / 1000:6.2f}ms"
+            )
+        for name, n in sorted(snap["counters"].items()):
+            lines.append(f"{name:<24} {n}")
+        for name, e in snap["errors"].items():
+            lines.append(f"⚠ {name}: {e['count']}x {e['last']}")
+        if snap["stalls"]:
+            last = snap["stalls"][-1]
+            lines.append(f"⏱ stalls: {len(snap['stalls'])} (last {last['duration_ms']}ms at {last['time']})")
+        return lines
+
+    def dump_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+    def dump_csv(self, path):
+        snap = self.snapshot()
+        fields = ["count", "mean_us", "min_us", "p50_us", "p95_us", "p99_us", "max_us"]
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["name"] + fields)
+            for name, s in snap["timings"].items():
+                writer.writerow([name] + [round(s[k], 2) for k in fields])
+
+    def dump(self, path):
+        """Write JSON or CSV depending on the file extension"""
+        if path.lower().endswith(".csv"):
+            self.dump_csv(path)
+        else:
+            self.dump_json(path)
+
+
+# -----------------------------------------------------------
+# EVENT LOOP LAG MONITOR
+# -----------------------------------------------------------
+class LagMonitor:
+    """Watchdog thread that flags GUI-thread stalls
+
+    The GUI thread calls beat() from a short QTimer. If no beat arrives
+    within `threshold_ms`, the watchdog grabs the GUI thread's current
+    stack so the stall can be traced back to the code that caused it.
+    """
+
+    def __init__(self, recorder, threshold_ms=200, check_ms=50):
+        self.recorder = recorder
+        self.threshold = threshold_ms / 1000.0
+        self.check = check_ms / 1000.0
+        self.gui_thread_id = threading.get_ident()
+        self.last_beat = time.perf_counter()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def beat(self):
+        now = time.perf_counter()
+        lag = now - self.last_beat
+        self.last_beat = now
+        self.recorder.record("eventloop.beat", lag * 1e6)
+
+    def start(self):
+        if self.thread:
+            return
+        # stop() leaves the event set; a restarted watchdog would exit at once
+        self.stop_event.clear()
+        self.last_beat = time.perf_counter()
+        self.thread = threading.Thread(target=self._run, name="lag-monitor", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread:
+            # Wakes within one check interval; joined so a restart can't
+            # leave two watchdogs running
+            self.thread.join(timeout=1.0)
+        self.thread = None
+
+    def _run(self):
+        pending_beat, pending_stack = None, ""
+        while not self.stop_event.wait(self.check):
+            beat = self.last_beat
+            if pending_beat is not None and beat != pending_beat:
+                # Loop recovered: report the full stall with the captured stack
+                self.recorder.stall((beat - pending_beat) * 1000, pending_stack)
+                self.recorder.count("eventloop.stalls")
+                pending_beat = None
+            if pending_beat is None and time.perf_counter() - beat >= self.threshold:
+                # Grab the stack while the GUI thread is still stuck in it
+                frame = sys._current_frames().get(self.gui_thread_id)
+                pending_stack = "".join(traceback.format_stack(frame)) if frame else ""
+                pending_beat = beat
+
+
+PERF = PerfRecorder()
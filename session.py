@@ -0,0 +1,139 @@
+import os
+import json
+import time
+import tempfile
+import threading
+
+from perf import PERF
+
+
+SESSION_VERSION = 1
+
+# Preferences survive "Clear session"; everything else is resumable state
+SETTINGS_KEYS = ("reduced_motion", "hud", "monitor_interval", "restore")
+
+
+def default_path():
+    """UG_SESSION if set, else $XDG_CONFIG_HOME/ultimate-gui/session.json"""
+    if os.environ.get("UG_SESSION"):
+        return os.environ["UG_SESSION"]
+    config = os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+    return os.path.join(config, "ultimate-gui", "session.json")
+
+
+def load(path):
+    """Saved state, or {} when missing, unreadable or from another version"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != SESSION_VERSION:
+        return {}
+    data.pop("version")
+    return data
+
+
+class SessionStore:
+    """Settings and session state, written off the GUI thread
+
+    set() only updates an in-memory dict, so it is cheap enough to call
+    on every change. A writer thread waits until changes have stopped
+    for `delay` seconds (or 5 x delay at most), then saves compact JSON
+    to a unique temp file, fsyncs it and renames it over the old one, so
+    a crash or power cut never leaves a torn or empty file.
+    """
+
+    def __init__(self, path=None, delay=1.0):
+        self.path = path or default_path()
+        self.delay = delay
+        self.state = load(self.path)
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock()
+        self.version = 0
+        self.saved_version = 0
+        self.changed = threading.Event()
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="session-writer", daemon=True)
+        self.thread.start()
+
+    def get(self, key, default=None):
+        with self.lock:
+            return self.state.get(key, default)
+
+    def set(self, key, value):
+        self.update(**{key: value})
+
+    def update(self, **values):
+        with self.lock:
+            changed = False
+            for key, value in values.items():
+                if self.state.get(key) != value:
+                    self.state[key] = value
+                    changed = True
+            if not changed:
+                return
+            self.version += 1
+        self.changed.set()
+
+    def clear(self):
+        """Forget session state, keeping the settings"""
+        with self.lock:
+            self.state = {key: value for key, value in self.state.items() if key in SETTINGS_KEYS}
+            self.version += 1
+        self.changed.set()
+
+    def flush(self):
+        """Write pending changes now, on the calling thread"""
+        with self.write_lock:
+            with self.lock:
+                if self.version == self.saved_version:
+                    return
+                version = self.version
+                data = dict(self.state, version=SESSION_VERSION)
+            try:
+                with PERF.measure("session.save"):
+                    folder = os.path.dirname(self.path)
+                    if folder:
+                        os.makedirs(folder, exist_ok=True)
+                    # Unique temp name: two running instances must not share one
+                    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(self.path) + ".",
+                                               suffix=".tmp", dir=folder or None)
+                    try:
+                        with os.fdopen(fd, "w", encoding="utf-8") as f:
+                            json.dump(data, f, separators=(",", ":"))
+                            # On disk before the rename, or a power cut can leave it empty
+                            f.flush()
+                            os.fsync(f.fileno())
+                        os.replace(tmp, self.path)
+                    except BaseException:
+                        try:
+                            os.remove(tmp)
+                        except OSError:
+                            pass
+                        raise
+                self.saved_version = version
+            except (OSError, TypeError, ValueError) as e:
+                PERF.error("session.save", e)
+
+    def close(self):
+        """Stop the writer thread and save whatever is still pending"""
+        self.stopping.set()
+        self.changed.set()
+        self.thread.join(timeout=2)
+        self.flush()
+
+    def _run(self):
+        while True:
+            self.changed.wait()
+            # Debounce: wait for a quiet spell, but never hold changes
+            # back for more than a few delays
+            first = time.monotonic()
+            while not self.stopping.is_set():
+                self.changed.clear()
+                self.stopping.wait(self.delay)
+                if not self.changed.is_set() or time.monotonic() - first >= 5 * self.delay:
+                    break
+            if self.stopping.is_set():
+                return
+            self.flush()
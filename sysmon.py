@@ -0,0 +1,321 @@
+import os
+import time
+from array import array
+
+
+PROC = "/proc"
+CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+SECTOR_SIZE = 512
+
+
+def available():
+    return os.path.exists(os.path.join(PROC, "stat"))
+
+
+def _read(path):
+    """Read a /proc file to EOF with raw reads, '' if it vanished
+
+    Almost always a single read; /proc/diskstats or a process's io file
+    can still exceed one buffer on big hosts, so keep reading until EOF.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return ""
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks).decode("utf-8", "replace")
+    except OSError:
+        return ""
+    finally:
+        os.close(fd)
+
+
+# -----------------------------------------------------------
+# HISTORY STORAGE
+# -----------------------------------------------------------
+class RingBuffer:
+    """Fixed-capacity float history backed by a flat array('d')"""
+
+    def __init__(self, capacity=300):
+        self.data = array("d", bytes(8 * capacity))
+        self.capacity = capacity
+        self.head = 0
+        self.count = 0
+
+    def append(self, value):
+        self.data[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def values(self):
+        """Oldest-to-newest copy of the stored samples"""
+        if self.count < self.capacity:
+            return self.data[:self.count].tolist()
+        return (self.data[self.head:] + self.data[:self.head]).tolist()
+
+    def last(self):
+        return self.data[self.head - 1] if self.count else 0.0
+
+    def __len__(self):
+        return self.count
+
+
+# -----------------------------------------------------------
+# /proc READERS
+# -----------------------------------------------------------
+def read_cpu_times():
+    """{'cpu': (busy, total), 'cpu0': ...} jiffies from /proc/stat"""
+    times = {}
+    for line in _read(os.path.join(PROC, "stat")).splitlines():
+        if not line.startswith("cpu"):
+            break
+        fields = line.split()
+        values = [int(v) for v in fields[1:9]]
+        idle = values[3] + values[4]  # idle + iowait
+        total = sum(values)
+        times[fields[0]] = (total - idle, total)
+    return times
+
+
+def read_memory():
+    """Memory figures in bytes from /proc/meminfo"""
+    info = {}
+    for line in _read(os.path.join(PROC, "meminfo")).splitlines():
+        key, _, rest = line.partition(":")
+        if key in ("MemTotal", "MemAvailable", "SwapTotal", "SwapFree"):
+            info[key] = int(rest.split()[0]) * 1024
+    total = info.get("MemTotal", 0)
+    used = total - info.get("MemAvailable", 0)
+    swap_total = info.get("SwapTotal", 0)
+    return {
+        "total": total,
+        "used": used,
+        "percent": 100.0 * used / total if total else 0.0,
+        "swap_total": swap_total,
+        "swap_used": swap_total - info.get("SwapFree", 0),
+    }
+
+
+def _whole_disks():
+    # Partitions have no entry of their own under /sys/block
+    try:
+        return {name for name in os.listdir("/sys/block") if not name.startswith(("loop", "ram"))}
+    except OSError:
+        return set()
+
+
+def read_disk_bytes(disks=None):
+    """Cumulative (read_bytes, written_bytes) summed over whole disks"""
+    disks = _whole_disks() if disks is None else disks
+    read = written = 0
+    for line in _read(os.path.join(PROC, "diskstats")).splitlines():
+        fields = line.split()
+        if len(fields) >= 10 and fields[2] in disks:
+            read += int(fields[5]) * SECTOR_SIZE
+            written += int(fields[9]) * SECTOR_SIZE
+    return read, written
+
+
+def read_process_stat(pid):
+    """(name, state, cpu_ticks, rss_bytes, starttime) from /proc/<pid>/stat, or None if gone
+
+    starttime (clock ticks after boot) tells a recycled PID apart from
+    the process that had it before.
+    """
+    data = _read(f"{PROC}/{pid}/stat")
+    if not data:
+        return None
+    # comm is wrapped in parentheses and may itself contain spaces or ')'
+    left = data.find("(")
+    right = data.rfind(")")
+    fields = data[right + 2:].split()
+    # fields[0] is field 3 (state); utime/stime are fields 14/15,
+    # starttime is 22 and rss is 24
+    return (
+        data[left + 1:right],
+        fields[0],
+        int(fields[11]) + int(fields[12]),
+        int(fields[21]) * PAGE_SIZE,
+        int(fields[19]),
+    )
+
+
+def list_pids():
+    try:
+        return [int(name) for name in os.listdir(PROC) if name.isdigit()]
+    except OSError:
+        return []
+
+
+# -----------------------------------------------------------
+# SAMPLER
+# -----------------------------------------------------------
+class SystemSampler:
+    """Turns cumulative /proc counters into per-interval rates
+
+    Each call to sample() costs one read per /proc file plus one
+    /proc/<pid>/stat read per process; the sampler's own CPU time is
+    reported so the monitor can show its overhead.
+    """
+
+    def __init__(self, top_n=8):
+        self.top_n = top_n
+        self.disks = _whole_disks()
+        self.prev_cpu = read_cpu_times()
+        self.prev_disk = read_disk_bytes(self.disks)
+        self.prev_procs = {}
+        self._top_processes(1.0)  # prime per-process tick counts
+        self.prev_time = time.monotonic()
+        # thread_time is per thread: create and sample from the same thread
+        self.prev_thread_time = time.thread_time()
+
+    def _top_processes(self, elapsed):
+        current = {}
+        rows = []
+        for pid in list_pids():
+            stat = read_process_stat(pid)
+            if stat is None:
+                continue
+            name, _, ticks, rss, start = stat
+            current[pid, start] = ticks
+            before = self.prev_procs.get((pid, start))
+            if before is not None:
+                cpu = 100.0 * (ticks - before) / CLK_TCK / elapsed
+                rows.append((cpu, rss, pid, name))
+        self.prev_procs = current
+        rows.sort(reverse=True)
+        return [
+            {"pid": pid, "name": name, "cpu": cpu, "rss": rss}
+            for cpu, rss, pid, name in rows[:self.top_n]
+        ]
+
+    def sample(self):
+        now = time.monotonic()
+        elapsed = max(now - self.prev_time, 1e-6)
+
+        cpu_times = read_cpu_times()
+        cpu = {}
+        for name, (busy, total) in cpu_times.items():
+            old_busy, old_total = self.prev_cpu.get(name, (busy, total))
+            delta = total - old_total
+            cpu[name] = 100.0 * (busy - old_busy) / delta if delta > 0 else 0.0
+        self.prev_cpu = cpu_times
+
+        disk = read_disk_bytes(self.disks)
+        disk_read = max(0, disk[0] - self.prev_disk[0]) / elapsed
+        disk_write = max(0, disk[1] - self.prev_disk[1]) / elapsed
+        self.prev_disk = disk
+
+        top = self._top_processes(elapsed)
+
+        thread_time = time.thread_time()
+        overhead = 100.0 * (thread_time - self.prev_thread_time) / elapsed
+        self.prev_thread_time = thread_time
+        self.prev_time = now
+
+        return {
+            "cpu_total": cpu.pop("cpu", 0.0),
+            "cpu_cores": [cpu[name] for name in sorted(cpu, key=lambda n: int(n[3:]))],
+            "memory": read_memory(),
+            "disk_read": disk_read,
+            "disk_write": disk_write,
+            "top": top,
+            "overhead": overhead,
+        }
+
+
+class MonitorHistory:
+    """Ring-buffer history for the monitor charts"""
+
+    def __init__(self, capacity=300):
+        self.capacity = capacity
+        self.cpu = RingBuffer(capacity)
+        self.memory = RingBuffer(capacity)
+        self.disk_read = RingBuffer(capacity)
+        self.disk_write = RingBuffer(capacity)
+
+    def add(self, sample):
+        self.cpu.append(sample["cpu_total"])
+        self.memory.append(sample["memory"]["percent"])
+        self.disk_read.append(sample["disk_read"] / 1024)
+        self.disk_write.append(sample["disk_write"] / 1024)
+
+
+# -----------------------------------------------------------
+# PROCESS TABLE
+# -----------------------------------------------------------
+def read_process_io(pid):
+    """(read_bytes, write_bytes) from /proc/<pid>/io; None if not permitted"""
+    data = _read(f"{PROC}/{pid}/io")
+    if not data:
+        return None
+    values = {}
+    for line in data.splitlines():
+        key, _, value = line.partition(":")
+        if key in ("read_bytes", "write_bytes"):
+            values[key] = int(value)
+    return values.get("read_bytes", 0), values.get("write_bytes", 0)
+
+
+class ProcessSampler:
+    """Snapshots every process and diffs it against the previous snapshot
+
+    Only /proc/<pid>/stat and /proc/<pid>/io are read per process. Rows
+    are (name, state, cpu%, rss, read B/s, write B/s) and values are
+    rounded so idle processes don't show up as changed every refresh.
+    Counters are keyed on (pid, starttime): a recycled PID starts from
+    scratch and is reported as removed + added, not as a changed row.
+    """
+
+    def __init__(self):
+        self.counters = {}
+        self.rows = {}
+        self.starts = {}
+        self.prev_time = time.monotonic()
+
+    def sample(self):
+        """Return (added, changed, removed) since the previous call"""
+        now = time.monotonic()
+        elapsed = max(now - self.prev_time, 1e-6)
+        counters = {}
+        rows = {}
+        starts = {}
+        for pid in list_pids():
+            stat = read_process_stat(pid)
+            if stat is None:
+                continue
+            name, state, ticks, rss, start = stat
+            io = read_process_io(pid)
+            starts[pid] = start
+            counters[pid, start] = (ticks, io)
+            prev = self.counters.get((pid, start))
+            cpu = read_rate = write_rate = 0
+            if prev is not None:
+                cpu = round(100.0 * (ticks - prev[0]) / CLK_TCK / elapsed, 1)
+                if io is not None and prev[1] is not None:
+                    read_rate = int((io[0] - prev[1][0]) / elapsed)
+                    write_rate = int((io[1] - prev[1][1]) / elapsed)
+            rows[pid] = (name, state, cpu, rss, read_rate, write_rate, io is not None)
+
+        old = self.rows
+        reused = {pid for pid, start in starts.items() if pid in old and self.starts[pid] != start}
+        added = {pid: row for pid, row in rows.items() if pid not in old or pid in reused}
+        changed = {
+            pid: row for pid, row in rows.items()
+            if pid in old and pid not in reused and old[pid] != row
+        }
+        removed = [pid for pid in old if pid not in rows or pid in reused]
+
+        self.counters = counters
+        self.rows = rows
+        self.starts = starts
+        self.prev_time = now
+        return added, changed, removed
@@ -0,0 +1,91 @@
+import os
+import threading
+
+import pytest
+
+import archives
+
+
+def make_tree(root):
+    """Nested files, an empty file and dir, plus links to a file, a dir and nowhere"""
+    os.makedirs(os.path.join(root, "sub", "deeper"))
+    os.makedirs(os.path.join(root, "empty_dir"))
+    with open(os.path.join(root, "top.txt"), "w") as f:
+        f.write("top level\n")
+    with open(os.path.join(root, "sub", "data.bin"), "wb") as f:
+        f.write(os.urandom(300_000))
+    with open(os.path.join(root, "sub", "deeper", "notes.txt"), "w") as f:
+        f.write("notes\n" * 1000)
+    open(os.path.join(root, "sub", "empty.txt"), "w").close()
+    os.symlink("top.txt", os.path.join(root, "file_link"))
+    os.symlink("sub", os.path.join(root, "dir_link"))
+    os.symlink("missing.txt", os.path.join(root, "dangling"))
+    return root
+
+
+def snapshot(root):
+    """{relative path: file bytes | ('link', target) | 'dir'} without following links"""
+    state = {}
+    for dirpath, dirs, files in os.walk(root):
+        for name in dirs + files:
+            path = os.path.join(dirpath, name)
+            rel = os.path.relpath(path, root)
+            if os.path.islink(path):
+                state[rel] = ("link", os.readlink(path))
+            elif os.path.isdir(path):
+                state[rel] = "dir"
+            else:
+                with open(path, "rb") as f:
+                    state[rel] = f.read()
+    return state
+
+
+FORMATS = [
+    (".zip", 1),
+    (".tar", 1),
+    (".tar.gz", 1),
+    (".tar.gz", 4),
+    (".tar.xz", 1),
+    (".tar.xz", 4),
+    pytest.param(".tar.zst", 2, marks=pytest.mark.skipif(archives.zstandard is None,
+                                                          reason="zstandard not installed")),
+]
+
+
+@pytest.mark.parametrize("ext, threads", FORMATS)
+def test_round_trip(tmp_path, ext, threads):
+    tree = make_tree(str(tmp_path / "tree"))
+    archive = str(tmp_path / ("out" + ext))
+
+    state = archives.create_archive(archive, [tree], threads=threads)
+    assert state["done"] == 10 + 300_000 + 6000
+
+    names = {name.rstrip("/") for name, _, _ in archives.list_archive(archive)}
+    assert {"tree/top.txt", "tree/sub/data.bin", "tree/dir_link", "tree/dangling"} <= names
+
+    out = str(tmp_path / "out")
+    archives.extract_archive(archive, out)
+    assert snapshot(os.path.join(out, "tree")) == snapshot(tree)
+
+
+def test_zip_refuses_link_outside_destination(tmp_path):
+    tree = str(tmp_path / "tree")
+    os.makedirs(tree)
+    os.symlink("../../etc/passwd", os.path.join(tree, "escape"))
+    archive = str(tmp_path / "out.zip")
+    archives.create_archive(archive, [tree])
+
+    with pytest.raises(ValueError):
+        archives.extract_archive(archive, str(tmp_path / "out"))
+    assert not os.path.lexists(str(tmp_path / "out" / "tree" / "escape"))
+
+
+@pytest.mark.parametrize("ext", [".zip", ".tar.gz"])
+def test_cancel_removes_partial_archive(tmp_path, ext):
+    tree = make_tree(str(tmp_path / "tree"))
+    archive = str(tmp_path / ("out" + ext))
+    cancel = threading.Event()
+
+    with pytest.raises(archives.CancelledError):
+        archives.create_archive(archive, [tree], progress=lambda state: cancel.set(), cancel=cancel)
+    assert not os.path.exists(archive)
@@ -0,0 +1,74 @@
+import struct
+
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+import batchimg
+
+
+def segment(marker, payload):
+    return bytes([0xFF, marker]) + struct.pack(">H", len(payload) + 2) + payload
+
+
+def exif_segment(orientation, order="<"):
+    """APP1 holding an IFD0 with only the Orientation tag"""
+    tiff = ({"<": b"II", ">": b"MM"}[order] + struct.pack(order + "HI", 42, 8)
+            + struct.pack(order + "HHHIHH", 1, 0x0112, 3, 1, orientation, 0) + struct.pack(order + "I", 0))
+    return segment(0xE1, b"Exif\0\0" + tiff)
+
+
+ICC = segment(0xE2, b"ICC_PROFILE\0\1\1" + b"profile" * 10)
+
+
+def with_segments(jpeg, *segments):
+    """Insert segments after the APP0 that OpenCV writes first"""
+    head, _ = batchimg._jpeg_segments(jpeg)
+    start = 2 + len(head[0][1])
+    return jpeg[:start] + b"".join(segments) + jpeg[start:]
+
+
+def landscape_jpeg():
+    image = np.zeros((40, 80, 3), np.uint8)
+    image[:, :40] = 255
+    return cv2.imencode(".jpg", image)[1].tobytes()
+
+
+@pytest.mark.parametrize("order", ["<", ">"])
+def test_exif_orientation(order):
+    data = with_segments(landscape_jpeg(), exif_segment(6, order))
+    assert batchimg._exif_orientation(batchimg._jpeg_segments(data)[0]) == 6
+    assert batchimg._exif_orientation(batchimg._jpeg_segments(landscape_jpeg())[0]) == 1
+
+
+def test_strip_keeps_icc_and_drops_exif():
+    data = with_segments(landscape_jpeg(), exif_segment(1), ICC, segment(0xFE, b"comment"))
+    stripped = batchimg._strip_jpeg_metadata(data)
+    markers = [marker for marker, _ in batchimg._jpeg_segments(stripped)[0]]
+    assert 0xE1 not in markers and 0xFE not in markers
+    assert ICC in stripped
+
+
+def test_strip_only_rotates_by_exif_orientation(tmp_path):
+    # Orientation 6: stored landscape, displayed rotated 90° clockwise
+    src = tmp_path / "in.jpg"
+    src.write_bytes(with_segments(landscape_jpeg(), exif_segment(6), ICC))
+    dst = tmp_path / "out.jpg"
+
+    batchimg.process_image(str(src), str(dst), batchimg.default_options())
+
+    data = dst.read_bytes()
+    assert batchimg._exif_orientation(batchimg._jpeg_segments(data)[0]) == 1
+    assert ICC in data
+    assert cv2.imread(str(dst)).shape[:2] == (80, 40)
+
+
+def test_strip_only_upright_jpeg_is_not_reencoded(tmp_path):
+    src = tmp_path / "in.jpg"
+    src.write_bytes(with_segments(landscape_jpeg(), exif_segment(1), ICC))
+    dst = tmp_path / "out.jpg"
+
+    batchimg.process_image(str(src), str(dst), batchimg.default_options())
+
+    assert dst.read_bytes() == batchimg._strip_jpeg_metadata(src.read_bytes())
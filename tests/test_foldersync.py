@@ -0,0 +1,101 @@
+import os
+import threading
+
+import foldersync
+
+
+def make_files(root, count, size=20000):
+    os.makedirs(root, exist_ok=True)
+    for i in range(count):
+        with open(os.path.join(root, f"f{i}"), "wb") as f:
+            f.write(os.urandom(size))
+
+
+def test_sync_copies_everything(tmp_path):
+    src, dst = str(tmp_path / "src"), str(tmp_path / "dst")
+    make_files(src, 10)
+
+    plan = foldersync.plan_sync(src, dst)
+    summary = foldersync.apply_plan(plan)
+
+    assert summary["copied"] == 10
+    assert not summary["cancelled"]
+    assert sorted(os.listdir(dst)) == sorted(os.listdir(src) + [foldersync.MANIFEST_NAME])
+    assert foldersync.plan_sync(src, dst)["copy"] == []
+
+
+def test_cancelled_apply_reports_and_saves_manifest(tmp_path):
+    src, dst = str(tmp_path / "src"), str(tmp_path / "dst")
+    make_files(src, 200)
+    plan = foldersync.plan_sync(src, dst)
+
+    cancel = threading.Event()
+    # The first progress report arrives on the first chunk copied
+    summary = foldersync.apply_plan(plan, progress=lambda state: cancel.set(), cancel=cancel)
+
+    assert summary["cancelled"]
+    assert summary["copied"] < 200
+    assert foldersync.load_manifest(dst, src) is not None
+
+    # Only the files that were not copied are planned again
+    again = foldersync.plan_sync(src, dst)
+    assert again["used_manifest"]
+    assert len(again["copy"]) == 200 - summary["copied"]
+    foldersync.apply_plan(again)
+    assert foldersync.plan_sync(src, dst)["copy"] == []
+
+
+def test_manifest_plan_notices_deleted_destination_files(tmp_path):
+    src, dst = str(tmp_path / "src"), str(tmp_path / "dst")
+    make_files(src, 3, size=100)
+    foldersync.apply_plan(foldersync.plan_sync(src, dst))
+
+    os.remove(os.path.join(dst, "f0"))
+    # Missing copy whose source mtime also changed: must not be hashed
+    os.remove(os.path.join(dst, "f1"))
+    os.utime(os.path.join(src, "f1"), ns=(1, 1))
+
+    plan = foldersync.plan_sync(src, dst)
+    assert plan["used_manifest"]
+    assert sorted((name, reason) for name, _, reason in plan["copy"]) == [("f0", "new"), ("f1", "new")]
+
+    foldersync.apply_plan(plan)
+    assert sorted(os.listdir(dst)) == sorted(["f0", "f1", "f2", foldersync.MANIFEST_NAME])
+
+
+def test_manifest_plan_notices_edited_destination_files(tmp_path):
+    src, dst = str(tmp_path / "src"), str(tmp_path / "dst")
+    make_files(src, 2, size=100)
+    foldersync.apply_plan(foldersync.plan_sync(src, dst))
+
+    with open(os.path.join(dst, "f0"), "ab") as f:
+        f.write(b"edited")
+
+    plan = foldersync.plan_sync(src, dst)
+    assert [(name, reason) for name, _, reason in plan["copy"]] == [("f0", "changed")]
+
+
+def test_mirror_deletes_files_and_dirs_the_manifest_does_not_know(tmp_path):
+    src, dst = str(tmp_path / "src"), str(tmp_path / "dst")
+    make_files(src, 2, size=100)
+    make_files(os.path.join(src, "sub", "deeper"), 1, size=100)
+    foldersync.apply_plan(foldersync.plan_sync(src, dst, mirror=True))
+
+    # Added to dest out of band, so never recorded in the manifest
+    make_files(os.path.join(dst, "extra"), 1, size=100)
+    with open(os.path.join(dst, "stray"), "wb") as f:
+        f.write(b"stray")
+    # Removed from the source along with its directories
+    os.remove(os.path.join(src, "sub", "deeper", "f0"))
+    os.rmdir(os.path.join(src, "sub", "deeper"))
+    os.rmdir(os.path.join(src, "sub"))
+
+    plan = foldersync.plan_sync(src, dst, mirror=True)
+    assert not plan["used_manifest"]
+    assert plan["delete"] == ["extra/f0", "stray", "sub/deeper/f0"]
+    # Deepest first, so each is empty by the time it is removed
+    assert plan["delete_dirs"][0] == "sub/deeper"
+    assert sorted(plan["delete_dirs"]) == ["extra", "sub", "sub/deeper"]
+
+    foldersync.apply_plan(plan)
+    assert sorted(os.listdir(dst)) == sorted(["f0", "f1", foldersync.MANIFEST_NAME])
@@ -0,0 +1,138 @@
+import asyncio
+import socket
+import threading
+
+import pytest
+
+import netdiag
+
+
+async def start_server():
+    """Echo-less TCP server on 127.0.0.1; returns (server, port)"""
+    async def handle(reader, writer):
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def closed_port():
+    """A port nothing listens on, so connecting is refused"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_tcp_probe_open_port():
+    async def run():
+        server, port = await start_server()
+        async with server:
+            return await netdiag.tcp_probe("127.0.0.1", port, timeout=2.0)
+
+    result = asyncio.run(run())
+    assert result.ok and result.error == ""
+    assert result.method == "tcp" and result.rtt_ms >= 0
+    assert str(result).startswith("127.0.0.1:")
+
+
+def test_tcp_probe_refused_port_counts_as_up():
+    result = asyncio.run(netdiag.tcp_probe("127.0.0.1", closed_port(), timeout=2.0))
+    assert result.ok
+    assert result.error == "refused"
+
+
+def test_sweep_reports_every_host():
+    seen = []
+
+    async def run():
+        server, port = await start_server()
+        async with server:
+            return await netdiag.sweep(["127.0.0.1"] * 5, port, concurrency=2, on_result=seen.append), port
+
+    results, port = asyncio.run(run())
+    assert len(results) == len(seen) == 5
+    assert all(r.ok and r.port == port for r in results)
+
+
+def test_sweep_cancelled_before_start_probes_nothing():
+    cancel = threading.Event()
+    cancel.set()
+    results = asyncio.run(netdiag.sweep(["127.0.0.1"] * 3, closed_port(), cancel=cancel))
+    assert results == []
+
+
+def test_track_fills_stats_until_cancelled():
+    stats = netdiag.LatencyStats(window=3)
+    cancel = threading.Event()
+    samples = []
+
+    def on_sample(result):
+        samples.append(result)
+        if len(samples) == 5:
+            cancel.set()
+
+    async def run():
+        server, port = await start_server()
+        async with server:
+            await netdiag.track("127.0.0.1", port, stats, interval=0.01, on_sample=on_sample, cancel=cancel)
+
+    asyncio.run(run())
+    assert len(samples) == stats.sent == 5
+    assert stats.lost == 0
+    assert len(stats.samples) == 3
+    summary = stats.summary()
+    assert summary["loss_pct"] == 0.0
+    assert summary["min_ms"] <= summary["avg_ms"] <= summary["max_ms"]
+
+
+def test_latency_stats_loss_and_jitter():
+    stats = netdiag.LatencyStats(window=4)
+    for rtt in (10.0, None, 14.0, 12.0):
+        stats.add(rtt)
+    summary = stats.summary()
+    assert summary["lost"] == 1 and summary["loss_pct"] == 25.0
+    assert summary["jitter_ms"] == 3.0
+
+
+def test_expand_targets():
+    assert netdiag.expand_targets("a, b 10.0.0.0/30") == ["a", "b", "10.0.0.1", "10.0.0.2"]
+    with pytest.raises(ValueError):
+        netdiag.expand_targets("10.0.0.0/8", limit=1000)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("8.8.8.8", ("8.8.8.8", None)),
+    ("8.8.8.8:53", ("8.8.8.8", 53)),
+    ("example.com:443", ("example.com", 443)),
+    ("::1", ("::1", None)),
+    ("fe80::1%eth0", ("fe80::1%eth0", None)),
+    ("[::1]", ("::1", None)),
+    ("[::1]:8080", ("::1", 8080)),
+    (" [2001:db8::1]:53 ", ("2001:db8::1", 53)),
+])
+def test_parse_target(text, expected):
+    assert netdiag.parse_target(text) == expected
+    assert netdiag.parse_target(netdiag.format_target(*expected)) == expected
+
+
+@pytest.mark.parametrize("text", ["host:http", "host:0", "host:70000", "[::1", "[::1]53", ":53", "[]:53"])
+def test_parse_target_rejects(text):
+    with pytest.raises(ValueError):
+        netdiag.parse_target(text)
+
+
+@pytest.mark.skipif(not socket.has_ipv6, reason="no IPv6")
+def test_tcp_probe_ipv6_loopback():
+    async def run():
+        try:
+            server = await asyncio.start_server(lambda r, w: w.close(), "::1", 0)
+        except OSError:
+            pytest.skip("IPv6 loopback unavailable")
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+            host, port = netdiag.parse_target(f"[::1]:{port}")
+            return await netdiag.tcp_probe(host, port)
+
+    result = asyncio.run(run())
+    assert result.ok
+    assert str(result).startswith("[::1]:")
@@ -0,0 +1,24 @@
+import time
+
+from perf import PerfRecorder, LagMonitor
+
+
+def test_lag_monitor_restarts_after_stop():
+    recorder = PerfRecorder()
+    monitor = LagMonitor(recorder, threshold_ms=20, check_ms=5)
+    monitor.start()
+    monitor.stop()
+    assert monitor.thread is None
+
+    monitor.start()
+    try:
+        assert monitor.thread.is_alive()
+        # No beats: the GUI thread looks stuck until the next one
+        time.sleep(0.1)
+        monitor.beat()
+        deadline = time.monotonic() + 2
+        while not recorder.snapshot()["stalls"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert recorder.snapshot()["stalls"]
+    finally:
+        monitor.stop()
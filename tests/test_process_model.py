@@ -0,0 +1,103 @@
+import os
+import random
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+# Gui also needs OpenCV and Qt Multimedia (libpulse) to import
+Gui = pytest.importorskip("Gui", exc_type=ImportError)
+
+from PyQt6.QtCore import Qt, QPersistentModelIndex
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def make_row(rng, name=None):
+    return (name or f"proc{rng.randrange(1000)}", rng.choice("RSD"), round(rng.random() * 100, 1),
+            rng.randrange(1 << 30), 0, 0, True)
+
+
+def random_diff(rng, snapshot, next_pid):
+    """One sampler-style diff against `snapshot`, including reused PIDs"""
+    pids = list(snapshot)
+    removed = rng.sample(pids, min(len(pids), rng.randrange(0, 30)))
+    # A reused PID is both removed and added
+    reused = rng.sample([p for p in pids if p not in removed], min(3, len(pids) - len(removed)))
+    survivors = [p for p in pids if p not in removed and p not in reused]
+    changed = {p: make_row(rng) for p in rng.sample(survivors, len(survivors) // 3)}
+    added = {p: make_row(rng) for p in reused}
+    for _ in range(rng.randrange(0, 30)):
+        added[next_pid] = make_row(rng)
+        next_pid += 1
+    return added, changed, removed + reused, next_pid
+
+
+def check(model, proxy, snapshot):
+    assert sorted(model.pids) == sorted(snapshot)
+    assert model.rows == snapshot
+    assert model.row_of == {pid: row for row, pid in enumerate(model.pids)}
+    if model.sort_column >= 0:
+        key = model.sort_key(model.sort_column)
+        descending = model.sort_order == Qt.SortOrder.DescendingOrder
+        assert model.pids == sorted(model.pids, key=key, reverse=descending)
+    # What the view sees through the proxy
+    shown = [int(proxy.data(proxy.index(row, 0))) for row in range(proxy.rowCount())]
+    assert shown == model.pids
+
+
+@pytest.mark.parametrize("column, order", [
+    (-1, Qt.SortOrder.AscendingOrder),
+    (0, Qt.SortOrder.AscendingOrder),
+    (1, Qt.SortOrder.AscendingOrder),
+    (3, Qt.SortOrder.DescendingOrder),
+])
+def test_apply_diff_matches_snapshot(app, column, order):
+    rng = random.Random(column)
+    model = Gui.ProcessTableModel(str)
+    proxy = Gui.ProcessFilterProxy()
+    proxy.setSourceModel(model)
+    proxy.sort(column, order)
+
+    snapshot = {}
+    next_pid = 1
+    for _ in range(40):
+        added, changed, removed, next_pid = random_diff(rng, snapshot, next_pid)
+        for pid in removed:
+            del snapshot[pid]
+        snapshot.update(changed)
+        snapshot.update(added)
+        model.apply_diff(added, changed, removed)
+        check(model, proxy, snapshot)
+
+
+def test_resort_keeps_persistent_indexes_on_their_pid(app):
+    model = Gui.ProcessTableModel(str)
+    rng = random.Random(1)
+    model.apply_diff({pid: make_row(rng) for pid in range(1, 50)}, {}, [])
+    model.sort(3, Qt.SortOrder.DescendingOrder)
+    pid = model.pids[10]
+    selected = QPersistentModelIndex(model.index(10, 2))
+
+    model.apply_diff({}, {pid: make_row(rng)[:2] + (1000.0,) + make_row(rng)[3:]}, [model.pids[0]])
+
+    assert model.pids[0] == pid
+    assert selected.row() == 0 and selected.column() == 2
+
+
+def test_filter_uses_pid_and_name(app):
+    model = Gui.ProcessTableModel(str)
+    proxy = Gui.ProcessFilterProxy()
+    proxy.setSourceModel(model)
+    proxy.setFilterRole(Gui.ProcessTableModel.FILTER_ROLE)
+    proxy.setFilterKeyColumn(0)
+    rng = random.Random(2)
+    model.apply_diff({1: make_row(rng, "bash"), 22: make_row(rng, "python"), 3: make_row(rng, "sshd")}, {}, [])
+
+    proxy.setFilterFixedString("sh")
+    assert proxy.rowCount() == 2
+    proxy.setFilterFixedString("22")
+    assert proxy.rowCount() == 1
@@ -0,0 +1,62 @@
+import os
+import json
+import time
+
+import session
+from session import SessionStore
+
+
+def test_set_calls_are_coalesced_into_one_write(tmp_path, monkeypatch):
+    writes = []
+    replace = os.replace
+
+    def counting_replace(src, dst):
+        writes.append(dst)
+        replace(src, dst)
+
+    monkeypatch.setattr(session.os, "replace", counting_replace)
+    path = tmp_path / "session.json"
+    store = SessionStore(str(path), delay=0.2)
+    try:
+        # Each change lands inside the previous one's quiet period
+        for i in range(20):
+            store.set("position", i)
+            time.sleep(0.005)
+        deadline = time.monotonic() + 3
+        while not writes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.5)
+        assert len(writes) == 1
+        assert session.load(str(path)) == {"position": 19}
+    finally:
+        store.close()
+
+
+def test_clear_keeps_settings(tmp_path):
+    path = str(tmp_path / "session.json")
+    store = SessionStore(path, delay=60)
+    store.update(hud=True, restore=False, page="Tools", playlist=["a.mp3"])
+    store.clear()
+    assert store.get("page") is None
+    store.close()
+
+    assert session.load(path) == {"hud": True, "restore": False}
+
+
+def test_failed_save_keeps_old_file_and_leaves_no_temp(tmp_path):
+    path = tmp_path / "session.json"
+    store = SessionStore(str(path), delay=60)
+    store.set("page", "Gallery")
+    store.flush()
+    saved = path.read_bytes()
+
+    # json.dump fails halfway through the temp file
+    store.update(page="Tools", broken=object())
+    try:
+        store.flush()
+        assert path.read_bytes() == saved
+        assert json.loads(saved)["page"] == "Gallery"
+        assert os.listdir(tmp_path) == ["session.json"]
+    finally:
+        store.set("broken", None)
+        store.close()
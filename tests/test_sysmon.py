@@ -0,0 +1,48 @@
+import sysmon
+
+
+def write_stat(proc, pid, name, start, ticks=0, rss_pages=10):
+    """Minimal /proc/<pid>/stat: fields 3.. with utime, starttime and rss filled in"""
+    fields = ["S"] + ["0"] * 49
+    fields[11] = str(ticks)   # utime (field 14)
+    fields[19] = str(start)   # starttime (field 22)
+    fields[21] = str(rss_pages)
+    path = proc / str(pid)
+    path.mkdir(exist_ok=True)
+    (path / "stat").write_text(f"{pid} ({name}) " + " ".join(fields))
+
+
+def test_process_sampler_reports_reused_pid_as_removed_and_added(tmp_path, monkeypatch):
+    monkeypatch.setattr(sysmon, "PROC", str(tmp_path))
+    write_stat(tmp_path, 100, "old", start=5000)
+    write_stat(tmp_path, 200, "steady", start=6000)
+    sampler = sysmon.ProcessSampler()
+
+    added, changed, removed = sampler.sample()
+    assert set(added) == {100, 200} and not changed and not removed
+
+    # PID 100 exits and a new process gets the same PID, with more CPU
+    # time than its predecessor ever had
+    write_stat(tmp_path, 100, "new", start=9000, ticks=50)
+    added, changed, removed = sampler.sample()
+    assert removed == [100]
+    assert added[100][0] == "new"
+    # No CPU% from the old process's counters
+    assert added[100][2] == 0
+    assert 100 not in changed and 200 not in changed
+
+
+def test_process_sampler_diffs_changes_and_exits(tmp_path, monkeypatch):
+    monkeypatch.setattr(sysmon, "PROC", str(tmp_path))
+    write_stat(tmp_path, 100, "a", start=1)
+    write_stat(tmp_path, 200, "b", start=2)
+    sampler = sysmon.ProcessSampler()
+    sampler.sample()
+
+    write_stat(tmp_path, 100, "a", start=1, rss_pages=20)
+    (tmp_path / "200" / "stat").unlink()
+    write_stat(tmp_path, 300, "c", start=3)
+    added, changed, removed = sampler.sample()
+    assert set(added) == {300}
+    assert set(changed) == {100} and changed[100][3] == 20 * sysmon.PAGE_SIZE
+    assert removed == [200]
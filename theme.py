@@ -0,0 +1,143 @@
+import os
+from functools import lru_cache
+
+
+# -----------------------------------------------------------
+# PALETTES
+# -----------------------------------------------------------
+# "glass" is the translucent look; "solid" uses opaque colours so
+# nothing behind a widget has to be repainted and blended with it
+PALETTES = {
+    "glass": {
+        "window": "rgba(255, 255, 255, 0.10)",
+        "list": "rgba(255, 255, 255, 0.15)",
+        "selected": "rgba(255, 255, 255, 0.30)",
+        "button": "rgba(255, 255, 255, 0.20)",
+        "hover": "rgba(255, 255, 255, 0.35)",
+        "console": "rgba(0, 0, 0, 0.5)",
+        "border": "rgba(255, 255, 255, 0.3)",
+        "hud": "rgba(0, 0, 0, 0.75)",
+        "text": "white",
+        "accent": "#00ff00",
+    },
+    "solid": {
+        "window": "#2b2d31",
+        "list": "#34363c",
+        "selected": "#50535b",
+        "button": "#3c3f46",
+        "hover": "#55585f",
+        "console": "#151618",
+        "border": "#5a5d64",
+        "hud": "#101010",
+        "text": "white",
+        "accent": "#00ff00",
+    },
+}
+
+# Widgets opt into the named rules with setObjectName() instead of
+# carrying their own setStyleSheet(), which would re-polish them and
+# their children every time a page is rebuilt
+STYLESHEET = """
+QWidget {
+    background: %(window)s;
+    color: %(text)s;
+    font-size: 16px;
+}
+QListWidget {
+    background: %(list)s;
+    border: none;
+    font-size: 18px;
+}
+QListWidget::item:selected {
+    background: %(selected)s;
+}
+QPushButton {
+    background: %(button)s;
+    border-radius: 12px;
+    padding: 10px;
+}
+QPushButton:hover {
+    background: %(hover)s;
+}
+QLabel {
+    background: transparent;
+    color: %(text)s;
+}
+QLabel#heroTitle {
+    font-size: 32px;
+    font-weight: bold;
+}
+QLabel#pageTitle {
+    font-size: 24px;
+    font-weight: bold;
+}
+QLabel#sectionLabel {
+    font-weight: bold;
+}
+QLabel#infoLabel {
+    font-size: 18px;
+}
+QLabel#monoLabel {
+    font-family: 'Consolas', 'Courier New', monospace;
+    font-size: 13px;
+}
+QLabel#perfHud {
+    background: %(hud)s;
+    color: %(accent)s;
+    font-family: 'Consolas', 'Courier New', monospace;
+    font-size: 12px;
+    border-radius: 6px;
+    padding: 6px;
+}
+QTextEdit#console {
+    background: %(console)s;
+    color: %(accent)s;
+    font-family: 'Consolas', 'Courier New', monospace;
+    font-size: 14px;
+    border: 1px solid %(border)s;
+    border-radius: 8px;
+    padding: 10px;
+}
+"""
+
+
+@lru_cache(maxsize=None)
+def stylesheet(palette):
+    """Compiled stylesheet for a palette name; built once per palette"""
+    return STYLESHEET % PALETTES[palette]
+
+
+def palette_for(reduced_motion):
+    return "solid" if reduced_motion else "glass"
+
+
+# -----------------------------------------------------------
+# REDUCED MOTION
+# -----------------------------------------------------------
+def remote_display(environ=None):
+    """True for SSH sessions, forwarded/remote X displays and headless Qt"""
+    environ = os.environ if environ is None else environ
+    if environ.get("SSH_CONNECTION") or environ.get("SSH_CLIENT"):
+        return True
+    platform = environ.get("QT_QPA_PLATFORM", "").split(":")[0]
+    if platform in ("offscreen", "minimal", "vnc", "linuxfb"):
+        return True
+    # ":0" is local; "host:0" and "localhost:10.0" (ssh -X) go over the network
+    host = environ.get("DISPLAY", "").rpartition(":")[0]
+    return bool(host) and host != "unix"
+
+
+def reduced_motion_default(preference=None, environ=None):
+    """Whether to run without animations and translucency
+
+    UG_REDUCED_MOTION=1/0 forces it either way, then the saved
+    `preference` (None = auto) applies; auto turns it on for remote or
+    headless displays, where every blended frame is expensive.
+    """
+    environ = os.environ if environ is None else environ
+    value = environ.get("UG_REDUCED_MOTION")
+    if value is not None:
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    if preference is not None:
+        return bool(preference)
+    return remote_display(environ)